@@ -1,17 +1,71 @@
+import os
+import time
+from datetime import datetime
+from threading import current_thread
+from threading import Event
+from threading import Lock
+from threading import Thread
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import List
 from typing import Optional
+from typing import Tuple
+from weakref import WeakSet
 
 from databricks.sdk.core import Config
 from databricks.sdk.core import credentials_provider
 from databricks.sdk.core import CredentialsProvider
 from databricks.sdk.core import HeaderFactory
 from databricks.sdk.oauth import ClientCredentials
+from databricks.sdk.oauth import Refreshable
+from databricks.sdk.oauth import SessionCredentials
 from databricks.sdk.oauth import Token
 from databricks.sdk.oauth import TokenSource
+from dbt.adapters.databricks.events.credential_events import TokenRefreshed
+from dbt.adapters.databricks.events.credential_events import TokenRefreshError
+from dbt.adapters.databricks.logging import logger
+from dbt.adapters.databricks.metrics import TokenRefreshStats
+from dbt.adapters.databricks.utils import get_cache_ttl
+from dbt.adapters.databricks.utils import TtlFileCache
 from requests import PreparedRequest
 from requests.auth import AuthBase
 
+# The SDK renews OAuth tokens once they expire within this many seconds
+TOKEN_EXPIRY_MARGIN = 40
+# Databricks rejects tokens that expire within this many seconds
+TOKEN_REJECT_MARGIN = 30
+# Wait this many seconds before retrying a failed background refresh
+TOKEN_REFRESH_RETRY_DELAY = 10
+
+token_refresh_stats = TokenRefreshStats()
+
+# Number of seconds the OAuth token endpoint of a host is cached on disk between invocations.
+# Unset disables the on-disk cache, the endpoint is then only cached for the current process.
+OAUTH_ENDPOINT_CACHE_TTL = get_cache_ttl("DBT_DATABRICKS_OAUTH_ENDPOINT_CACHE_TTL")
+OAUTH_ENDPOINT_CACHE_PATH = os.getenv(
+    "DBT_DATABRICKS_OAUTH_ENDPOINT_CACHE_PATH",
+    os.path.join(os.path.expanduser("~"), ".dbt", "databricks_oauth_endpoints.json"),
+)
+
+
+class OAuthEndpointCache(TtlFileCache[Tuple[str, List[str]]]):
+    """Cache the OAuth token endpoint and scopes of hosts, so that OIDC discovery only runs
+    once per host and process rather than every time an m2m_auth is built."""
+
+    def _to_json(self, value: Tuple[str, List[str]]) -> Any:
+        token_endpoint, scopes = value
+        return {"token_endpoint": token_endpoint, "scopes": scopes}
+
+    def _from_json(self, raw: Any) -> Tuple[str, List[str]]:
+        return str(raw["token_endpoint"]), [str(scope) for scope in raw["scopes"]]
+
+
+oauth_endpoint_cache = OAuthEndpointCache(
+    OAUTH_ENDPOINT_CACHE_PATH,
+    OAUTH_ENDPOINT_CACHE_TTL,
+)
+
 
 class token_auth(CredentialsProvider):
     _token: str
@@ -42,8 +96,23 @@ class token_auth(CredentialsProvider):
 
 class m2m_auth(CredentialsProvider):
     _token_source: Optional[TokenSource] = None
+    _refresher: Optional["TokenRefresher"] = None
 
     def __init__(self, host: str, client_id: str, client_secret: str) -> None:
+        token_endpoint, scopes = oauth_endpoint_cache.get(
+            host, lambda: self._discover_token_endpoint(host)
+        )
+        self._token_source = ClientCredentials(
+            client_id=client_id,
+            client_secret=client_secret,
+            token_url=token_endpoint,
+            scopes=scopes,
+            use_header="microsoft" not in token_endpoint,
+            use_params="microsoft" in token_endpoint,
+        )
+
+    @staticmethod
+    def _discover_token_endpoint(host: str) -> Tuple[str, List[str]]:
         @credentials_provider("noop", [])
         def noop_credentials(_: Any):  # type: ignore
             return lambda: {}
@@ -56,14 +125,7 @@ class m2m_auth(CredentialsProvider):
         if config.is_azure:
             # Azure AD only supports full access to Azure Databricks.
             scopes = [f"{config.effective_azure_login_app_id}/.default"]
-        self._token_source = ClientCredentials(
-            client_id=client_id,
-            client_secret=client_secret,
-            token_url=oidc.token_endpoint,
-            scopes=scopes,
-            use_header="microsoft" not in oidc.token_endpoint,
-            use_params="microsoft" in oidc.token_endpoint,
-        )
+        return oidc.token_endpoint, scopes
 
     def auth_type(self) -> str:
         return "oauth"
@@ -81,11 +143,186 @@ class m2m_auth(CredentialsProvider):
         return c
 
     def __call__(self, _: Optional[Config] = None) -> HeaderFactory:
-        def inner() -> Dict[str, str]:
-            token = self._token_source.token()  # type: ignore
-            return {"Authorization": f"{token.token_type} {token.access_token}"}
+        if self._refresher is None:
+            self._refresher = TokenRefresher(
+                self._token_source,  # type: ignore
+                lambda token: {"Authorization": f"{token.token_type} {token.access_token}"},
+            )
+        return self._refresher.headers
 
-        return inner
+
+class TokenRefresher:
+    """Hand out the authorization headers of a refreshable token source, renewing its token
+    from a background thread as soon as the token source considers it expired.
+
+    The token source renews its token some seconds before Databricks would reject it, so the
+    background thread gets that window to refresh before callers have to wait for a new token.
+    Only the token source's public token() is used, which renews the token once it expired.
+    """
+
+    def __init__(
+        self,
+        token_source: Refreshable,
+        to_headers: Callable[[Token], Dict[str, str]],
+    ) -> None:
+        self._token_source = token_source
+        self._to_headers = to_headers
+        # (token, headers), replaced as a whole
+        self._cached: Optional[Tuple[Token, Dict[str, str]]] = None
+        self._retry_at = 0.0
+        # Whether the background thread refreshes this token, reset when it is stopped
+        self.scheduled = False
+
+    def headers(self) -> Dict[str, str]:
+        cached = self._cached
+        if cached and not _expires_within(cached[0], TOKEN_REJECT_MARGIN):
+            if not self.scheduled:
+                _schedule_token_refresh(self)
+            return cached[1]
+
+        start = time.time()
+        token = self._token_source.token()
+        if not cached or token is not cached[0]:
+            self._record(time.time() - start, background=False)
+        return self._update(token)
+
+    def next_refresh(self) -> Optional[float]:
+        """Return when the token should be refreshed, or None if it never expires."""
+
+        cached = self._cached
+        if not cached or not cached[0].expiry:
+            return None
+
+        due = cached[0].expiry.timestamp() - TOKEN_EXPIRY_MARGIN
+        return max(due, self._retry_at)
+
+    def refresh(self) -> None:
+        """Renew the token through the token source, which only does so once it expired."""
+
+        cached = self._cached
+        start = time.time()
+        try:
+            token = self._token_source.token()
+        except Exception as e:
+            self._retry_at = time.time() + TOKEN_REFRESH_RETRY_DELAY
+            token_refresh_stats.record(time.time() - start, failed=True)
+            logger.warning(TokenRefreshError(e))
+            return
+
+        if cached and token is cached[0]:
+            # Not expired yet in the eyes of the token source, check again shortly
+            self._retry_at = time.time() + 1
+            return
+
+        self._record(time.time() - start, background=True)
+        # Already scheduled. If the background refresh was stopped meanwhile, the next
+        # headers() schedules it again.
+        self._cached = (token, self._to_headers(token))
+
+    def _update(self, token: Token) -> Dict[str, str]:
+        headers = self._to_headers(token)
+        self._cached = (token, headers)
+        _schedule_token_refresh(self)
+        return headers
+
+    @staticmethod
+    def _record(elapsed: float, background: bool) -> None:
+        token_refresh_stats.record(elapsed, background=background)
+        logger.debug(TokenRefreshed(elapsed, background))
+
+
+def _expires_within(token: Token, seconds: float) -> bool:
+    if not token.expiry:
+        return False
+    now = datetime.now(tz=token.expiry.tzinfo)
+    return (token.expiry - now).total_seconds() <= seconds
+
+
+_token_refreshers: "WeakSet[TokenRefresher]" = WeakSet()
+_token_refresh_lock = Lock()
+_token_refresh_wakeup = Event()
+_token_refresh_thread: Optional[Thread] = None
+
+# Attribute holding the refresher of SDK session credentials, so they are collected together
+SESSION_REFRESHER_ATTRIBUTE = "_dbt_token_refresher"
+
+
+def _schedule_token_refresh(refresher: TokenRefresher) -> None:
+    global _token_refresh_thread
+
+    with _token_refresh_lock:
+        _token_refreshers.add(refresher)
+        refresher.scheduled = True
+        if _token_refresh_thread is None:
+            _token_refresh_thread = Thread(
+                target=_run_token_refresher, name="dbt-databricks-token-refresher", daemon=True
+            )
+            _token_refresh_thread.start()
+    _token_refresh_wakeup.set()
+
+
+def stop_token_refresher() -> None:
+    """Stop refreshing tokens in the background. Tokens handed out afterwards start it again."""
+
+    global _token_refresh_thread
+
+    with _token_refresh_lock:
+        _token_refresh_thread = None
+        for refresher in _token_refreshers:
+            refresher.scheduled = False
+        _token_refreshers.clear()
+    _token_refresh_wakeup.set()
+
+
+def _is_token_refresher_running() -> bool:
+    with _token_refresh_lock:
+        return _token_refresh_thread is current_thread()
+
+
+def _run_token_refresher() -> None:
+    while _is_token_refresher_running():
+        delay = _refresh_due_tokens()
+        if _is_token_refresher_running():
+            _token_refresh_wakeup.wait(delay)
+            _token_refresh_wakeup.clear()
+
+
+def _refresh_due_tokens() -> Optional[float]:
+    """Refresh the tokens that are due and return how long to wait for the next one."""
+
+    with _token_refresh_lock:
+        refreshers = list(_token_refreshers)
+
+    now = time.time()
+    delays: List[float] = []
+    for refresher in refreshers:
+        due = refresher.next_refresh()
+        if due is None:
+            continue
+        if due <= now:
+            refresher.refresh()
+            due = refresher.next_refresh()
+            if due is None:
+                continue
+        delays.append(max(due - now, 0.0))
+    return min(delays) if delays else None
+
+
+def get_header_factory(provider: Any, config: Optional[Config] = None) -> HeaderFactory:
+    """Return the header factory of a credentials provider. User to machine OAuth sessions
+    come straight from the SDK, so their background refresh is set up here."""
+
+    if not isinstance(provider, SessionCredentials):
+        return provider(config)
+
+    with _token_refresh_lock:
+        refresher = getattr(provider, SESSION_REFRESHER_ATTRIBUTE, None)
+        if refresher is None:
+            refresher = TokenRefresher(
+                provider, lambda token: {"Authorization": f"Bearer {token.access_token}"}
+            )
+            setattr(provider, SESSION_REFRESHER_ATTRIBUTE, refresher)
+    return refresher.headers
 
 
 class BearerAuth(AuthBase):
@@ -1,24 +1,38 @@
 import decimal
+import itertools
 import os
+import random
 import re
 import sys
 import time
 import uuid
 import warnings
+from collections import defaultdict
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
 from multiprocessing.context import SpawnContext
 from numbers import Number
+from threading import Condition
+from threading import current_thread
+from threading import Event
 from threading import get_ident
+from threading import Lock
+from threading import Semaphore
+from threading import Thread
 from typing import Any
 from typing import Callable
 from typing import cast
+from typing import DefaultDict
 from typing import Dict
 from typing import Hashable
+from typing import Iterable
 from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Sequence
+from typing import Set
 from typing import Tuple
 from typing import TYPE_CHECKING
 
@@ -26,7 +40,10 @@ import databricks.sql as dbsql
 from databricks.sql.client import Connection as DatabricksSQLConnection
 from databricks.sql.client import Cursor as DatabricksSQLCursor
 from databricks.sql.exc import Error
+from databricks.sql.exc import NonRecoverableNetworkError
+from databricks.sql.exc import RequestError
 from dbt.adapters.base.query_headers import MacroQueryStringSetter
+from dbt.adapters.base.query_headers import QueryHeaderContextWrapper
 from dbt.adapters.contracts.connection import AdapterRequiredConfig
 from dbt.adapters.contracts.connection import AdapterResponse
 from dbt.adapters.contracts.connection import Connection
@@ -34,10 +51,17 @@ from dbt.adapters.contracts.connection import ConnectionState
 from dbt.adapters.contracts.connection import DEFAULT_QUERY_COMMENT
 from dbt.adapters.contracts.connection import Identifier
 from dbt.adapters.contracts.connection import LazyHandle
+from dbt.adapters.contracts.connection import QueryComment
 from dbt.adapters.databricks.__version__ import version as __version__
 from dbt.adapters.databricks.auth import BearerAuth
+from dbt.adapters.databricks.auth import get_header_factory
+from dbt.adapters.databricks.auth import stop_token_refresher
+from dbt.adapters.databricks.auth import token_refresh_stats
+from dbt.adapters.databricks.column import DatabricksColumn
 from dbt.adapters.databricks.credentials import DatabricksCredentials
 from dbt.adapters.databricks.credentials import TCredentialProvider
+from dbt.adapters.databricks.events.connection_events import CircuitBreakerClose
+from dbt.adapters.databricks.events.connection_events import CircuitBreakerOpen
 from dbt.adapters.databricks.events.connection_events import ConnectionAcquire
 from dbt.adapters.databricks.events.connection_events import ConnectionCancel
 from dbt.adapters.databricks.events.connection_events import ConnectionCancelError
@@ -46,23 +70,41 @@ from dbt.adapters.databricks.events.connection_events import ConnectionCloseErro
 from dbt.adapters.databricks.events.connection_events import ConnectionCreate
 from dbt.adapters.databricks.events.connection_events import ConnectionCreated
 from dbt.adapters.databricks.events.connection_events import ConnectionCreateError
-from dbt.adapters.databricks.events.connection_events import ConnectionIdleCheck
 from dbt.adapters.databricks.events.connection_events import ConnectionIdleClose
+from dbt.adapters.databricks.events.connection_events import ConnectionKeepalive
+from dbt.adapters.databricks.events.connection_events import ConnectionKeepaliveError
+from dbt.adapters.databricks.events.connection_events import ConnectionLeased
+from dbt.adapters.databricks.events.connection_events import ConnectionOpenSummary
 from dbt.adapters.databricks.events.connection_events import ConnectionRelease
 from dbt.adapters.databricks.events.connection_events import ConnectionReset
 from dbt.adapters.databricks.events.connection_events import ConnectionRetrieve
 from dbt.adapters.databricks.events.connection_events import ConnectionReuse
+from dbt.adapters.databricks.events.connection_events import SessionPoolIdleClose
+from dbt.adapters.databricks.events.connection_events import SessionPoolPrewarm
+from dbt.adapters.databricks.events.connection_events import SessionPoolStats
+from dbt.adapters.databricks.events.credential_events import TokenRefreshSummary
 from dbt.adapters.databricks.events.cursor_events import CursorCancel
 from dbt.adapters.databricks.events.cursor_events import CursorCancelError
 from dbt.adapters.databricks.events.cursor_events import CursorClose
 from dbt.adapters.databricks.events.cursor_events import CursorCloseError
 from dbt.adapters.databricks.events.cursor_events import CursorCreate
+from dbt.adapters.databricks.events.other_events import ColumnCacheSummary
 from dbt.adapters.databricks.events.other_events import QueryError
+from dbt.adapters.databricks.events.other_events import QueryQueued
+from dbt.adapters.databricks.events.other_events import QueryRetry
 from dbt.adapters.databricks.events.pipeline_events import PipelineRefresh
 from dbt.adapters.databricks.events.pipeline_events import PipelineRefreshError
 from dbt.adapters.databricks.logging import logger
+from dbt.adapters.databricks.metrics import ConnectionOpenStats
+from dbt.adapters.databricks.metrics import ConnectionOpenTimings
+from dbt.adapters.databricks.metrics import get_statement_kind
+from dbt.adapters.databricks.metrics import LEADING_COMMENTS_REGEX
+from dbt.adapters.databricks.metrics import QUERY_METRICS_PATH
+from dbt.adapters.databricks.metrics import QueryMetrics
 from dbt.adapters.databricks.python_submissions import PythonRunTracker
 from dbt.adapters.databricks.utils import redact_credentials
+from dbt.adapters.databricks.utils import get_cache_ttl
+from dbt.adapters.databricks.utils import TtlFileCache
 from dbt.adapters.events.types import ConnectionClosedInCleanup
 from dbt.adapters.events.types import ConnectionLeftOpenInCleanup
 from dbt.adapters.events.types import ConnectionReused
@@ -80,6 +122,7 @@ from requests import Session
 
 if TYPE_CHECKING:
     from agate import Table
+    from pyarrow import Table as ArrowTable
 
 
 mv_refresh_regex = re.compile(r"refresh\s+materialized\s+view\s+([`\w.]+)", re.IGNORECASE)
@@ -98,6 +141,211 @@ USE_LONG_SESSIONS = os.getenv("DBT_DATABRICKS_LONG_SESSIONS", "True").upper() ==
 # USE_LONG_SESSIONS is true.
 # Updated when idle times of 180s were causing errors
 DEFAULT_MAX_IDLE_TIME = 60
+# Seconds cleanup waits for the session reaper thread to exit
+REAPER_STOP_TIMEOUT = 1
+
+# Default number of sessions kept open per compute by the long-session pool. The default
+# maximum of None means the pool grows with demand, i.e. at most one session per thread.
+DEFAULT_POOL_MIN_SIZE = 0
+DEFAULT_POOL_MAX_SIZE: Optional[int] = None
+# Seconds a node waits for a session of a full pool before failing. Sessions are leased for
+# a whole node, so this has to cover the longest running node. 0 waits forever.
+DEFAULT_POOL_TIMEOUT = 3600
+
+# Number of rows fetched at a time from a query result.
+DEFAULT_FETCH_BATCH_SIZE = 10000
+
+# Number of times a query failing with a transient error is retried, and the kinds of
+# statements retried by default. Other kinds are not idempotent and must be opted in.
+DEFAULT_QUERY_RETRIES = 2
+DEFAULT_QUERY_RETRY_STATEMENTS = ("metadata",)
+# Number of consecutive failures to connect to a compute resource after which connecting to
+# it fails fast, and the number of seconds before it is tried again. A threshold of 0
+# disables the circuit breaker.
+DEFAULT_CIRCUIT_BREAKER_THRESHOLD = 5
+DEFAULT_CIRCUIT_BREAKER_COOLDOWN = 60
+
+# Base and maximum delay in seconds between query retries.
+QUERY_RETRY_BASE_DELAY = 1.0
+QUERY_RETRY_MAX_DELAY = 30.0
+
+SESSION_EXPIRED_REGEX = re.compile(
+    r"invalid sessionhandle|session_not_found|session .* (does not exist|has expired)"
+    r"|session (is )?expired",
+    re.IGNORECASE,
+)
+# Status codes only count in the way the connector reports them, e.g. "http code 503", as
+# bare numbers also show up in names, literals and row counts of ordinary SQL errors.
+TRANSIENT_ERROR_REGEX = re.compile(
+    r"temporarily_unavailable|too many requests|connection reset|connection aborted"
+    r"|read timed out|\b(?:http[\s_-]*(?:status[\s_-]*)?code|status[\s_-]*code)[\s:=]*"
+    r"(?:429|502|503|504)\b",
+    re.IGNORECASE,
+)
+
+USE_CATALOG_REGEX = re.compile(
+    r"^(?:use|set)\s+catalog\s+(`(?:[^`]|``)+`|[^\s`;]+)\s*;?\s*$", re.IGNORECASE
+)
+USE_REGEX = re.compile(r"^use\s", re.IGNORECASE)
+
+# Name of a relation, with each part either backquoted or a plain word
+RELATION_NAME_PATTERN = r"(?:`(?:[^`]|``)+`|[\w$]+)(?:\s*\.\s*(?:`(?:[^`]|``)+`|[\w$]+))*"
+RELATION_NAME_PART_REGEX = re.compile(r"`((?:[^`]|``)+)`|([\w$]+)")
+# Relation a statement creates, changes or writes to. Only the head of the statement is
+# looked at, as the relation always follows the first few keywords.
+STATEMENT_TARGET_REGEX = re.compile(
+    r"(?:create|replace|alter|drop|truncate|comment|insert|merge|copy)\b[^`;]{0,100}?"
+    r"\b(?:table|view|into|overwrite|on)\s+(?:(column)\s+|(?:table|view)\s+)?"
+    rf"(?:if\s+(?:not\s+)?exists\s+)?({RELATION_NAME_PATTERN})",
+    re.IGNORECASE,
+)
+RENAME_TARGET_REGEX = re.compile(rf"\brename\s+to\s+({RELATION_NAME_PATTERN})", re.IGNORECASE)
+
+# Number of seconds the DBR version of a cluster is cached on disk between invocations.
+# Unset disables the on-disk cache, the version is then only cached for the current process.
+DBR_VERSION_CACHE_TTL = get_cache_ttl("DBT_DATABRICKS_DBR_VERSION_CACHE_TTL")
+DBR_VERSION_CACHE_PATH = os.getenv(
+    "DBT_DATABRICKS_DBR_VERSION_CACHE_PATH",
+    os.path.join(os.path.expanduser("~"), ".dbt", "databricks_dbr_versions.json"),
+)
+
+
+class DbrVersionCache(TtlFileCache[Tuple[int, int]]):
+    """Cache the DBR version of clusters, keyed by host and http_path, so that it is only
+    looked up once per process rather than once per session."""
+
+    def _to_json(self, value: Tuple[int, int]) -> Any:
+        return list(value)
+
+    def _from_json(self, raw: Any) -> Tuple[int, int]:
+        major, minor = raw
+        return int(major), int(minor)
+
+
+dbr_version_cache = DbrVersionCache(
+    DBR_VERSION_CACHE_PATH,
+    DBR_VERSION_CACHE_TTL,
+)
+
+
+def _parse_relation_name(name: str) -> Tuple[str, ...]:
+    return tuple(
+        (quoted.replace("``", "`") if quoted else plain).lower()
+        for quoted, plain in RELATION_NAME_PART_REGEX.findall(name)
+    )
+
+
+class ColumnCache:
+    """Cache the columns of relations for the duration of a run, so that the macros of a
+    model asking for the columns of the same relation only describe it once.
+
+    The result of DESCRIBE TABLE EXTENDED is kept as well, so that the columns and the
+    relation config of a relation described that way can be served without describing it
+    again.
+
+    Entries are forgotten when a statement creates, changes or writes to the relation. They
+    are matched by the last part of the name, so a statement that qualifies the name
+    differently from the cached relation still invalidates it.
+    """
+
+    COLUMNS = "columns"
+    DESCRIBE_EXTENDED = "describe_extended"
+
+    def __init__(self) -> None:
+        # Entries by the last part of the relation name, then by kind and full name
+        self._entries: Dict[str, Dict[Tuple[str, Tuple[str, ...]], Any]] = {}
+        # Bumped on every invalidation of a name, so that a describe that raced with a
+        # statement changing the relation does not put stale columns back in the cache.
+        self._generations: DefaultDict[str, int] = defaultdict(int)
+        self._epoch = 0
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(
+        self,
+        relation_name: str,
+        load: Callable[[], List[DatabricksColumn]],
+        from_described: Optional[Callable[["Table"], List[DatabricksColumn]]] = None,
+    ) -> List[DatabricksColumn]:
+        """Get the columns of the relation, calling load to describe it if missing. If given,
+        from_described reads them from a cached DESCRIBE TABLE EXTENDED result instead."""
+
+        if from_described is not None:
+            described = self.peek_described(relation_name)
+            if described is not None:
+                return from_described(described)
+        return list(self._get(self.COLUMNS, relation_name, load))
+
+    def get_described(self, relation_name: str, load: Callable[[], "Table"]) -> "Table":
+        """Get the DESCRIBE TABLE EXTENDED result of the relation, calling load if missing."""
+
+        return self._get(self.DESCRIBE_EXTENDED, relation_name, load)
+
+    def peek_described(self, relation_name: str) -> Optional["Table"]:
+        """Return the DESCRIBE TABLE EXTENDED result of the relation if it is cached. Only a
+        result found counts, as a hit: callers describe the relation some other way if not."""
+
+        key = _parse_relation_name(relation_name)
+        if not key:
+            return None
+        with self._lock:
+            value = self._entries.get(key[-1], {}).get((self.DESCRIBE_EXTENDED, key))
+            if value is not None:
+                self.hits += 1
+            return value
+
+    def _get(self, kind: str, relation_name: str, load: Callable[[], Any]) -> Any:
+        key = _parse_relation_name(relation_name)
+        if not key:
+            return load()
+
+        with self._lock:
+            value = self._entries.get(key[-1], {}).get((kind, key))
+            if value is not None:
+                self.hits += 1
+                return value
+            self.misses += 1
+            generation = (self._epoch, self._generations[key[-1]])
+
+        value = load()
+        with self._lock:
+            if generation == (self._epoch, self._generations[key[-1]]):
+                stored = list(value) if kind == self.COLUMNS else value
+                self._entries.setdefault(key[-1], {})[(kind, key)] = stored
+        return value
+
+    def invalidate(self, sql: str) -> None:
+        """Forget what is cached for the relation the statement creates, changes or writes to."""
+
+        pos = LEADING_COMMENTS_REGEX.match(sql).end()  # type: ignore[union-attr]
+        match = STATEMENT_TARGET_REGEX.match(sql, pos)
+        if not match:
+            return
+
+        names = [_parse_relation_name(match.group(2))]
+        if match.group(1):
+            # COMMENT ON COLUMN names the column after the relation
+            names[0] = names[0][:-1]
+        rename = RENAME_TARGET_REGEX.search(sql, match.end(), match.end() + 1000)
+        if rename:
+            names.append(_parse_relation_name(rename.group(1)))
+
+        with self._lock:
+            for name in names:
+                if name:
+                    self._generations[name[-1]] += 1
+                    self.invalidations += len(self._entries.pop(name[-1], ()))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._epoch += 1
+            self.invalidations += sum(len(entries) for entries in self._entries.values())
+            self._entries.clear()
+
+    def is_empty(self) -> bool:
+        return self.hits == 0 and self.misses == 0
 
 
 class DatabricksSQLConnectionWrapper:
@@ -105,9 +353,13 @@ class DatabricksSQLConnectionWrapper:
 
     _conn: DatabricksSQLConnection
     _is_cluster: bool
-    _cursors: List[DatabricksSQLCursor]
+    # Cursors that haven't been closed yet, so that they can be cancelled.
+    _cursors: Set[DatabricksSQLCursor]
     _creds: DatabricksCredentials
     _user_agent: str
+    _http_path: Optional[str]
+    # Catalog the session is in, as far as the statements run on it tell. None if unknown.
+    current_catalog: Optional[str]
 
     def __init__(
         self,
@@ -116,29 +368,67 @@ class DatabricksSQLConnectionWrapper:
         is_cluster: bool,
         creds: DatabricksCredentials,
         user_agent: str,
+        http_path: Optional[str] = None,
+        catalog: Optional[str] = None,
     ):
         self._conn = conn
         self._is_cluster = is_cluster
-        self._cursors = []
+        self._cursors = set()
         self._creds = creds
         self._user_agent = user_agent
+        self._http_path = http_path
+        self.current_catalog = catalog
 
     def cursor(self) -> "DatabricksSQLCursorWrapper":
         cursor = self._conn.cursor()
 
         logger.debug(CursorCreate(cursor))
 
-        self._cursors.append(cursor)
+        self._cursors.add(cursor)
         return DatabricksSQLCursorWrapper(
             cursor,
             creds=self._creds,
             user_agent=self._user_agent,
+            on_close=self._forget_cursor,
+            on_execute=self._track_catalog,
         )
 
+    @property
+    def live_cursor_count(self) -> int:
+        """Number of cursors of this connection that have not been closed."""
+        return len(self._cursors)
+
+    def _track_catalog(self, sql: str) -> None:
+        """Keep current_catalog up to date with the catalog switches run on the session."""
+
+        sql = LEADING_COMMENTS_REGEX.sub("", sql, count=1)
+        if sql[:3].lower() not in ("use", "set"):
+            return
+
+        match = USE_CATALOG_REGEX.match(sql)
+        if match:
+            catalog = match.group(1)
+            if catalog.startswith("`"):
+                catalog = catalog[1:-1].replace("``", "`")
+            self.current_catalog = catalog
+        elif USE_REGEX.match(sql):
+            # USE of a qualified schema may switch catalogs too, so stop trusting the state
+            self.current_catalog = None
+
+    def _forget_cursor(self, cursor: DatabricksSQLCursor) -> None:
+        self._cursors.discard(cursor)
+        # The connector also keeps every cursor it created, only releasing them when the
+        # connection is closed. Drop closed ones so long sessions don't accumulate them.
+        # _cursors is private to the connector (a list as of databricks-sql-connector 3.1.2),
+        # so leave it alone if it is missing or changed shape.
+        connector_cursors = getattr(self._conn, "_cursors", None)
+        if isinstance(connector_cursors, list) and cursor in connector_cursors:
+            connector_cursors.remove(cursor)
+
     def cancel(self) -> None:
         logger.debug(ConnectionCancel(self._conn))
 
-        cursors: List[DatabricksSQLCursor] = self._cursors
+        cursors: List[DatabricksSQLCursor] = list(self._cursors)
 
         for cursor in cursors:
             try:
@@ -157,32 +447,63 @@ class DatabricksSQLConnectionWrapper:
     def rollback(self, *args: Any, **kwargs: Any) -> None:
         logger.debug("NotImplemented: rollback")
 
+    @property
+    def session_id(self) -> Optional[str]:
+        return self._conn.get_session_id_hex()
+
+    def ping(self) -> bool:
+        """Run a trivial query so the session isn't closed for idleness on the back end.
+        Returns whether the session is still usable."""
+
+        logger.debug(ConnectionKeepalive(self._conn))
+
+        try:
+            # Through the wrapper, so the cursor is forgotten by the connector once closed
+            cursor = self.cursor()
+            try:
+                cursor.execute("SELECT 1")
+                cursor.fetchall()
+            finally:
+                cursor.close()
+            return True
+        except Error as exc:
+            logger.debug(ConnectionKeepaliveError(self._conn, exc))
+            return False
+
     _dbr_version: Tuple[int, int]
 
     @property
     def dbr_version(self) -> Tuple[int, int]:
         if not hasattr(self, "_dbr_version"):
             if self._is_cluster:
-                with self._conn.cursor() as cursor:
-                    cursor.execute("SET spark.databricks.clusterUsageTags.sparkVersion")
-                    results = cursor.fetchone()
-                    if results:
-                        dbr_version: str = results[1]
-
-                m = DBR_VERSION_REGEX.search(dbr_version)
-                assert m, f"Unknown DBR version: {dbr_version}"
-                major = int(m.group(1))
-                try:
-                    minor = int(m.group(2))
-                except ValueError:
-                    minor = sys.maxsize
-                self._dbr_version = (major, minor)
+                if self._http_path:
+                    self._dbr_version = dbr_version_cache.get(
+                        f"{self._creds.host}{self._http_path}", self._fetch_dbr_version
+                    )
+                else:
+                    self._dbr_version = self._fetch_dbr_version()
             else:
                 # Assuming SQL Warehouse uses the latest version.
                 self._dbr_version = (sys.maxsize, sys.maxsize)
 
         return self._dbr_version
 
+    def _fetch_dbr_version(self) -> Tuple[int, int]:
+        with self._conn.cursor() as cursor:
+            cursor.execute("SET spark.databricks.clusterUsageTags.sparkVersion")
+            results = cursor.fetchone()
+            if results:
+                dbr_version: str = results[1]
+
+        m = DBR_VERSION_REGEX.search(dbr_version)
+        assert m, f"Unknown DBR version: {dbr_version}"
+        major = int(m.group(1))
+        try:
+            minor = int(m.group(2))
+        except ValueError:
+            minor = sys.maxsize
+        return (major, minor)
+
 
 class DatabricksSQLCursorWrapper:
     """Wrap a Databricks SQL cursor in a way that no-ops transactions"""
@@ -190,11 +511,22 @@ class DatabricksSQLCursorWrapper:
     _cursor: DatabricksSQLCursor
     _user_agent: str
     _creds: DatabricksCredentials
+    _on_close: Optional[Callable[[DatabricksSQLCursor], None]]
+    _on_execute: Optional[Callable[[str], None]]
 
-    def __init__(self, cursor: DatabricksSQLCursor, creds: DatabricksCredentials, user_agent: str):
+    def __init__(
+        self,
+        cursor: DatabricksSQLCursor,
+        creds: DatabricksCredentials,
+        user_agent: str,
+        on_close: Optional[Callable[[DatabricksSQLCursor], None]] = None,
+        on_execute: Optional[Callable[[str], None]] = None,
+    ):
         self._cursor = cursor
         self._creds = creds
         self._user_agent = user_agent
+        self._on_close = on_close
+        self._on_execute = on_execute
 
     def cancel(self) -> None:
         logger.debug(CursorCancel(self._cursor))
@@ -211,6 +543,9 @@ class DatabricksSQLCursorWrapper:
             self._cursor.close()
         except Error as exc:
             logger.warning(CursorCloseError(self._cursor, exc))
+        finally:
+            if self._on_close is not None:
+                self._on_close(self._cursor)
 
     def fetchall(self) -> Sequence[Tuple]:
         return self._cursor.fetchall()
@@ -221,6 +556,42 @@ class DatabricksSQLCursorWrapper:
     def fetchmany(self, size: int) -> Sequence[Tuple]:
         return self._cursor.fetchmany(size)
 
+    def fetchall_arrow(self) -> "ArrowTable":
+        return self._cursor.fetchall_arrow()
+
+    def fetchmany_arrow(self, size: int) -> "ArrowTable":
+        return self._cursor.fetchmany_arrow(size)
+
+    def fetch_arrow_batches(
+        self, batch_size: int = DEFAULT_FETCH_BATCH_SIZE, limit: Optional[int] = None
+    ) -> Iterator["ArrowTable"]:
+        """Fetch the result as Arrow tables of at most batch_size rows, up to limit rows if
+        given."""
+
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = batch_size if remaining is None else min(batch_size, remaining)
+            table = self._cursor.fetchmany_arrow(size)
+            if table.num_rows == 0:
+                return
+            yield table
+            if remaining is not None:
+                remaining -= table.num_rows
+
+    def fetch_batches(
+        self, batch_size: int = DEFAULT_FETCH_BATCH_SIZE, limit: Optional[int] = None
+    ) -> Iterator[Sequence[Tuple]]:
+        """Fetch the result in batches of at most batch_size rows, up to limit rows if given.
+
+        Rows are built from the Arrow result a column at a time, which is much cheaper than
+        the connector's row by row conversion. Arrays, maps and structs come back as Python
+        lists and dicts, as the connector returns them without pandas, rather than as the
+        numpy arrays of its pandas conversion.
+        """
+
+        for table in self.fetch_arrow_batches(batch_size, limit):
+            yield list(zip(*(column.to_pylist() for column in table.columns)))
+
     def execute(self, sql: str, bindings: Optional[Sequence[Any]] = None) -> None:
         # print(f"execute: {sql}")
         if sql.strip().endswith(";"):
@@ -228,6 +599,8 @@ class DatabricksSQLCursorWrapper:
         if bindings is not None:
             bindings = [self._fix_binding(binding) for binding in bindings]
         self._cursor.execute(sql, bindings)
+        if self._on_execute:
+            self._on_execute(sql)
 
     def poll_refresh_pipeline(self, pipeline_id: str) -> None:
         # interval in seconds
@@ -386,12 +759,34 @@ DATABRICKS_QUERY_COMMENT = f"""
 
 
 class DatabricksMacroQueryStringSetter(MacroQueryStringSetter):
+    def __init__(self, config: AdapterRequiredConfig, query_header_context: Dict[str, Any]):
+        # Rendered comments by node unique_id and connection name. A new setter, and so a new
+        # cache, is created whenever the query header context changes.
+        self._comments: Dict[Tuple[Optional[str], str], Optional[str]] = {}
+        super().__init__(config, query_header_context)
+
     def _get_comment_macro(self) -> Optional[str]:
         if self.config.query_comment.comment == DEFAULT_QUERY_COMMENT:
             return DATABRICKS_QUERY_COMMENT
         else:
             return self.config.query_comment.comment
 
+    def set(self, name: str, query_header_context: Any) -> None:
+        # A node acquires connections many times during a run, rendering the comment macro
+        # each time. The comment only depends on the node and connection name, so render it
+        # once per pair.
+        key = (getattr(query_header_context, "unique_id", None), name)
+        if key not in self._comments:
+            wrapped: Optional[QueryHeaderContextWrapper] = None
+            if query_header_context is not None:
+                wrapped = QueryHeaderContextWrapper(query_header_context)
+            self._comments[key] = self.generator(name, wrapped)
+
+        append = False
+        if isinstance(self.config.query_comment, QueryComment):
+            append = self.config.query_comment.append
+        self.comment.set(self._comments[key], append)
+
 
 @dataclass
 class DatabricksAdapterResponse(AdapterResponse):
@@ -406,6 +801,8 @@ class DatabricksDBTConnection(Connection):
     http_path: str = ""
     thread_identifier: Tuple[int, int] = (0, 0)
     max_idle_time: int = DEFAULT_MAX_IDLE_TIME
+    # Whether to ping the session once it has been idle for max_idle_time, instead of closing it.
+    keepalive: bool = False
 
     # If the connection is being used for a model we want to track the model language.
     # We do this because we need special handling for python models.  Python models will
@@ -472,10 +869,350 @@ class DatabricksDBTConnection(Connection):
         logger.debug(ConnectionReset(str(self)))
 
 
+class DatabricksSessionPool:
+    """A pool of open sessions against a single compute resource (http_path).
+
+    Sessions are leased by whichever thread needs one and given back when the thread
+    releases its connection, so the number of open sessions follows the number of
+    concurrently running nodes rather than threads * computes.
+
+    With keepalive, sessions idle for max_idle_time are pinged instead of being closed.
+    """
+
+    def __init__(
+        self,
+        http_path: str,
+        *,
+        min_size: int = DEFAULT_POOL_MIN_SIZE,
+        max_size: Optional[int] = DEFAULT_POOL_MAX_SIZE,
+        max_idle_time: int = DEFAULT_MAX_IDLE_TIME,
+        keepalive: bool = False,
+        timeout: int = DEFAULT_POOL_TIMEOUT,
+    ):
+        if max_size is not None and max_size < max(min_size, 1):
+            raise DbtRuntimeError(
+                f"connect_pool_max_size ({max_size}) must be at least 1 and not less than "
+                f"connect_pool_min_size ({min_size}) for compute {http_path}"
+            )
+
+        self.http_path = http_path
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_idle_time = max_idle_time
+        self.keepalive = keepalive
+        self.timeout = timeout
+
+        # Idle sessions with the time they were last used, ordered from least to most recently
+        # used, so the next session to expire is always the first one.
+        self._idle: List[Tuple[DatabricksSQLConnectionWrapper, float]] = []
+        # Number of sessions owned by the pool: idle, leased or being opened.
+        self._size = 0
+        self._condition = Condition()
+
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+        self.wait_time = 0.0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    def lease(self) -> Optional[Tuple[DatabricksSQLConnectionWrapper, float]]:
+        """Lease an idle session, waiting for one to be given back if the pool is full.
+
+        Returns None if there is no idle session but there is room to grow. In that case
+        a slot has been reserved and the caller must open a new session, then either give
+        it back with `release` or free the slot with `discard`.
+
+        Raises DbtRuntimeError if the pool stays full for longer than its timeout, e.g.
+        because a session was leased and never given back.
+        """
+
+        expired: List[DatabricksSQLConnectionWrapper] = []
+        try:
+            with self._condition:
+                if self._is_exhausted():
+                    self.waits += 1
+                    start = time.time()
+                    deadline = start + self.timeout if self.timeout > 0 else None
+                    while self._is_exhausted():
+                        remaining = None if deadline is None else deadline - time.time()
+                        if remaining is not None and remaining <= 0:
+                            self.wait_time += time.time() - start
+                            raise DbtRuntimeError(
+                                f"Timed out after {self.timeout}s waiting for a session for "
+                                f"compute {self.http_path}: all {self.max_size} sessions of "
+                                "its pool are in use. Increase connect_pool_max_size or "
+                                "connect_pool_timeout."
+                            )
+                        self._condition.wait(remaining)
+                    self.wait_time += time.time() - start
+
+                while self._idle:
+                    handle, last_used_time = self._idle.pop()
+                    if not self.keepalive and self._is_expired(last_used_time):
+                        expired.append(handle)
+                        self._size -= 1
+                        continue
+                    self.hits += 1
+                    return handle, last_used_time
+
+                self.misses += 1
+                self._size += 1
+                return None
+        finally:
+            for handle in expired:
+                handle.close()
+
+    def release(self, handle: DatabricksSQLConnectionWrapper, last_used_time: float) -> None:
+        """Give a leased session back to the pool."""
+
+        with self._condition:
+            # Sessions almost always come back in order; python models are the exception, as
+            # they don't touch last_used_time while they run.
+            position = len(self._idle)
+            while position > 0 and self._idle[position - 1][1] > last_used_time:
+                position -= 1
+            self._idle.insert(position, (handle, last_used_time))
+            self._condition.notify()
+
+    def discard(self) -> None:
+        """Free the slot of a leased session that was closed or failed to open."""
+
+        with self._condition:
+            self._size = max(self._size - 1, 0)
+            self._condition.notify()
+
+    def reap(self) -> List[DatabricksSQLConnectionWrapper]:
+        """Remove idle sessions that have been idle for too long and return them so that
+        the caller can close them outside of the pool's lock."""
+
+        expired: List[DatabricksSQLConnectionWrapper] = []
+        with self._condition:
+            while self._idle and self._is_expired(self._idle[0][1]):
+                expired.append(self._idle.pop(0)[0])
+            if expired:
+                self._size -= len(expired)
+                self._condition.notify_all()
+        return expired
+
+    def lease_expired(self) -> List[DatabricksSQLConnectionWrapper]:
+        """Lease the idle sessions that have been idle for too long so that the caller can
+        ping them, then either give them back with `release` or close them and `discard`."""
+
+        expired: List[DatabricksSQLConnectionWrapper] = []
+        with self._condition:
+            while self._idle and self._is_expired(self._idle[0][1]):
+                expired.append(self._idle.pop(0)[0])
+        return expired
+
+    def next_expiry(self) -> Optional[float]:
+        """Get the time at which the least recently used idle session expires."""
+
+        with self._condition:
+            if not self._idle or self.max_idle_time <= 0:
+                return None
+            return self._idle[0][1] + self.max_idle_time
+
+    def reserve(self, target_size: int) -> bool:
+        """Reserve a slot for a session opened ahead of demand, as long as the pool has
+        fewer than `target_size` sessions and room to grow."""
+
+        with self._condition:
+            if self._size >= target_size:
+                return False
+            if self.max_size is not None and self._size >= self.max_size:
+                return False
+            self._size += 1
+            return True
+
+    def drain(self) -> List[DatabricksSQLConnectionWrapper]:
+        """Remove all idle sessions from the pool and return them to be closed."""
+
+        with self._condition:
+            handles = [handle for handle, _ in self._idle]
+            self._size -= len(handles)
+            self._idle = []
+            self._condition.notify_all()
+        return handles
+
+    def _is_exhausted(self) -> bool:
+        return not self._idle and self.max_size is not None and self._size >= self.max_size
+
+    def _is_expired(self, last_used_time: float) -> bool:
+        return self.max_idle_time > 0 and time.time() - last_used_time > self.max_idle_time
+
+
+class DatabricksQueryLimiter:
+    """Limit the number of queries running concurrently against a compute resource, keeping
+    track of how long queries had to queue for a slot."""
+
+    def __init__(self, compute_name: str, max_concurrent_queries: int):
+        if max_concurrent_queries < 1:
+            raise DbtRuntimeError(
+                f"max_concurrent_queries ({max_concurrent_queries}) must be at least 1 "
+                f"for compute {compute_name or 'default'}"
+            )
+
+        self.compute_name = compute_name
+        self.max_concurrent_queries = max_concurrent_queries
+        self._semaphore = Semaphore(max_concurrent_queries)
+        self._lock = Lock()
+
+        self.queued = 0
+        self.queue_time = 0.0
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold a query slot for the duration of the context, waiting for one if needed."""
+
+        if not self._semaphore.acquire(blocking=False):
+            start = time.time()
+            self._semaphore.acquire()
+            queue_time = time.time() - start
+            with self._lock:
+                self.queued += 1
+                self.queue_time += queue_time
+            logger.debug(QueryQueued(self.compute_name, queue_time))
+
+        try:
+            yield
+        finally:
+            self._semaphore.release()
+
+
+class DatabricksCircuitBreaker:
+    """Fail fast when connecting to a compute resource that keeps failing.
+
+    After `threshold` consecutive failures the breaker opens and attempts to connect raise
+    immediately. Once `cooldown` seconds have passed a single attempt is let through as a probe:
+    if it succeeds the breaker closes, otherwise it opens again for another cooldown.
+    """
+
+    def __init__(self, http_path: str, threshold: int, cooldown: float):
+        self.http_path = http_path
+        self.threshold = threshold
+        self.cooldown = cooldown
+
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def before_attempt(self) -> None:
+        """Raise if attempts to connect should fail fast."""
+
+        with self._lock:
+            if self.opened_at is None:
+                return
+            remaining = self.opened_at + self.cooldown - time.time()
+            if remaining <= 0 and not self._probing:
+                self._probing = True
+                return
+
+        raise DbtRuntimeError(
+            f"Not connecting to compute {self.http_path}: {self.failures} consecutive "
+            "connection attempts failed"
+            + (f", retrying in {remaining:.0f}s" if remaining > 0 else ", a retry is in progress")
+        )
+
+    def record_success(self) -> None:
+        with self._lock:
+            was_open = self.opened_at is not None
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+        if was_open:
+            logger.info(CircuitBreakerClose(self.http_path))
+
+    def abort_attempt(self) -> None:
+        """Give up an attempt that neither succeeded nor failed, such as an interrupted one."""
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.threshold <= 0 or self.failures < self.threshold:
+                return
+            was_open = self.opened_at is not None and not self._probing
+            self.opened_at = time.time()
+            self._probing = False
+        if not was_open:
+            logger.warning(CircuitBreakerOpen(self.http_path, self.failures, self.cooldown))
+
+
+# Keyed by http_path and the settings of the breaker, as computes sharing an http_path may
+# configure different thresholds and cooldowns
+_circuit_breakers: Dict[Tuple[str, int, int], DatabricksCircuitBreaker] = {}
+_circuit_breakers_lock = Lock()
+
+
+def get_circuit_breaker(
+    http_path: str, compute_name: Optional[str], creds: DatabricksCredentials
+) -> DatabricksCircuitBreaker:
+    """Get the circuit breaker of a compute resource, shared by all connection managers."""
+
+    threshold = _get_compute_setting(compute_name, creds, "connect_circuit_breaker_threshold")
+    cooldown = _get_compute_setting(compute_name, creds, "connect_circuit_breaker_cooldown")
+    key = (
+        http_path,
+        (
+            DEFAULT_CIRCUIT_BREAKER_THRESHOLD
+            if threshold is None
+            else _get_int_setting(threshold, "connect_circuit_breaker_threshold")
+        ),
+        (
+            DEFAULT_CIRCUIT_BREAKER_COOLDOWN
+            if cooldown is None
+            else _get_int_setting(cooldown, "connect_circuit_breaker_cooldown")
+        ),
+    )
+
+    with _circuit_breakers_lock:
+        breaker = _circuit_breakers.get(key)
+        if breaker is None:
+            breaker = DatabricksCircuitBreaker(http_path, threshold=key[1], cooldown=key[2])
+            _circuit_breakers[key] = breaker
+        return breaker
+
+
+class DatabricksQueryRetryPolicy:
+    """Decide whether a failed query is retried, and how long to wait before retrying."""
+
+    def __init__(self, retries: int, statement_kinds: Sequence[str]):
+        self.retries = retries
+        self.statement_kinds = frozenset(kind.lower() for kind in statement_kinds)
+
+    def should_retry(self, kind: str, attempt: int) -> bool:
+        return attempt < self.retries and kind in self.statement_kinds
+
+    def get_delay(self, attempt: int) -> float:
+        """Exponential backoff with full jitter."""
+        return random.uniform(0, min(QUERY_RETRY_MAX_DELAY, QUERY_RETRY_BASE_DELAY * 2**attempt))
+
+
 class DatabricksConnectionManager(SparkConnectionManager):
     TYPE: str = "databricks"
     credentials_provider: Optional[TCredentialProvider] = None
     _user_agent = f"dbt-databricks/{__version__}"
+    connection_open_stats = ConnectionOpenStats()
+
+    def __init__(self, profile: AdapterRequiredConfig, mp_context: SpawnContext) -> None:
+        super().__init__(profile, mp_context)
+        self.query_limiters: Dict[str, Optional[DatabricksQueryLimiter]] = {}
+        self.query_retry_policies: Dict[str, DatabricksQueryRetryPolicy] = {}
+        self.query_metrics = QueryMetrics()
+        self.column_cache = ColumnCache()
 
     def cancel_open(self) -> List[str]:
         cancelled = super().cancel_open()
@@ -483,7 +1220,7 @@ class DatabricksConnectionManager(SparkConnectionManager):
             logger.info("Cancelling open python jobs")
             tracker = PythonRunTracker()
             session = Session()
-            creds = self.credentials_provider(None)  # type: ignore
+            creds = get_header_factory(self.credentials_provider)
             session.auth = BearerAuth(creds)
             session.headers = {"User-Agent": self._user_agent}
             tracker.cancel_runs(session)
@@ -496,22 +1233,38 @@ class DatabricksConnectionManager(SparkConnectionManager):
         dbr_version = connection.dbr_version
         return (dbr_version > version) - (dbr_version < version)
 
+    def get_current_catalog(self) -> Optional[str]:
+        """Return the catalog the thread's session is in, or None if it is not known."""
+        handle = self._get_open_handle()
+        return handle.current_catalog if handle else None
+
+    def set_current_catalog(self, catalog: Optional[str]) -> None:
+        handle = self._get_open_handle()
+        if handle:
+            handle.current_catalog = catalog
+
+    def _get_open_handle(self) -> Optional[DatabricksSQLConnectionWrapper]:
+        # Reading the handle of a lazy connection opens it, so only look at open ones
+        conn = self.get_thread_connection()
+        if conn.state != ConnectionState.OPEN:
+            return None
+        handle = conn.handle
+        return handle if isinstance(handle, DatabricksSQLConnectionWrapper) else None
+
     def set_query_header(self, query_header_context: Dict[str, Any]) -> None:
         self.query_header = DatabricksMacroQueryStringSetter(self.profile, query_header_context)
 
     @contextmanager
     def exception_handler(self, sql: str) -> Iterator[None]:
-        log_sql = redact_credentials(sql)
-
         try:
             yield
 
         except Error as exc:
-            logger.debug(QueryError(log_sql, exc))
+            logger.debug(QueryError(redact_credentials(sql), exc))
             raise DbtRuntimeError(str(exc)) from exc
 
         except Exception as exc:
-            logger.debug(QueryError(log_sql, exc))
+            logger.debug(QueryError(redact_credentials(sql), exc))
             if len(exc.args) == 0:
                 raise
 
@@ -535,6 +1288,7 @@ class DatabricksConnectionManager(SparkConnectionManager):
 
         # Get a connection for this thread
         conn = self.get_if_exists()
+        compute_name = _get_compute_name(query_header_context) or ""
 
         if conn and conn.name == conn_name and conn.state == ConnectionState.OPEN:
             # Found a connection and nothing to do, so just return it
@@ -551,6 +1305,7 @@ class DatabricksConnectionManager(SparkConnectionManager):
                 credentials=self.profile.credentials,
             )
             conn.handle = LazyHandle(self.get_open_for_context(query_header_context))
+            conn.compute_name = compute_name
             # Add the connection to thread_connections for this thread
             self.set_thread_connection(conn)
             fire_event(
@@ -559,6 +1314,7 @@ class DatabricksConnectionManager(SparkConnectionManager):
         else:  # existing connection either wasn't open or didn't have the right name
             if conn.state != ConnectionState.OPEN:
                 conn.handle = LazyHandle(self.get_open_for_context(query_header_context))
+                cast(DatabricksDBTConnection, conn).compute_name = compute_name
             if conn.name != conn_name:
                 orig_conn_name: str = conn.name or ""
                 conn.name = conn_name
@@ -597,8 +1353,11 @@ class DatabricksConnectionManager(SparkConnectionManager):
 
                 pre = time.time()
 
-                cursor = cast(DatabricksSQLConnectionWrapper, connection.handle).cursor()
-                cursor.execute(sql, bindings)
+                cursor = self._execute_with_retries(
+                    connection,
+                    get_statement_kind(sql),
+                    lambda cursor: cursor.execute(sql, bindings),
+                )
 
                 fire_event(
                     SQLQueryStatus(
@@ -615,6 +1374,8 @@ class DatabricksConnectionManager(SparkConnectionManager):
                     cursor = None
                 raise
             finally:
+                # Also on failure, a statement that failed may still have changed the relation
+                self.column_cache.invalidate(sql)
                 if close_cursor and cursor is not None:
                     cursor.close()
 
@@ -640,6 +1401,74 @@ class DatabricksConnectionManager(SparkConnectionManager):
         finally:
             cursor.close()
 
+    def execute_batches(
+        self, sql: str, batch_size: int = DEFAULT_FETCH_BATCH_SIZE, auto_begin: bool = False
+    ) -> Iterator["Table"]:
+        """Execute the query and yield its result as tables of at most batch_size rows, so
+        that large results are never held in memory all at once."""
+
+        from dbt_common.clients.agate_helper import table_from_data_flat
+
+        sql = self._add_query_comment(sql)
+        _, cursor = self.add_query(sql, auto_begin)
+        try:
+            if cursor.description is None:
+                return
+            column_names = [col[0] for col in cursor.description]
+            batches = cursor.fetch_batches(batch_size)
+            while True:
+                # Fetch errors surface here rather than in add_query, translate them the same way
+                with self.exception_handler(sql):
+                    rows = next(batches, None)
+                if rows is None:
+                    return
+                data = list(self.process_results(column_names, rows))
+                yield table_from_data_flat(data, column_names)
+        finally:
+            # Also reached through GeneratorExit, when a caller that stopped iterating early
+            # closes the generator
+            cursor.close()
+
+    def execute_arrow(
+        self, sql: str, limit: Optional[int] = None, auto_begin: bool = False
+    ) -> "ArrowTable":
+        """Execute the query and return its result as an Arrow table, without converting it
+        to rows."""
+
+        import pyarrow
+
+        sql = self._add_query_comment(sql)
+        _, cursor = self.add_query(sql, auto_begin)
+        try:
+            if limit:
+                tables = list(cursor.fetch_arrow_batches(DEFAULT_FETCH_BATCH_SIZE, limit))
+                if tables:
+                    return pyarrow.concat_tables(tables)
+                return cursor.fetchmany_arrow(0)
+            return cursor.fetchall_arrow()
+        finally:
+            cursor.close()
+
+    @classmethod
+    def get_result_from_cursor(
+        cls, cursor: DatabricksSQLCursorWrapper, limit: Optional[int]
+    ) -> "Table":
+        # Fetching in batches rather than with fetchall means the raw rows don't have to be
+        # held in memory at the same time as the table built from them.
+        from dbt_common.clients.agate_helper import table_from_data_flat
+
+        data: Iterable[Any] = []
+        column_names: List[str] = []
+
+        if cursor.description is not None:
+            column_names = [col[0] for col in cursor.description]
+            rows = itertools.chain.from_iterable(
+                cursor.fetch_batches(DEFAULT_FETCH_BATCH_SIZE, limit or None)
+            )
+            data = cls.process_results(column_names, rows)
+
+        return table_from_data_flat(data, column_names)
+
     def _execute_cursor(
         self, log_sql: str, f: Callable[[DatabricksSQLCursorWrapper], None]
     ) -> "Table":
@@ -660,9 +1489,7 @@ class DatabricksConnectionManager(SparkConnectionManager):
 
                 pre = time.time()
 
-                handle: DatabricksSQLConnectionWrapper = connection.handle
-                cursor = handle.cursor()
-                f(cursor)
+                cursor = self._execute_with_retries(connection, "metadata", f)
 
                 fire_event(
                     SQLQueryStatus(
@@ -677,6 +1504,150 @@ class DatabricksConnectionManager(SparkConnectionManager):
                 if cursor is not None:
                     cursor.close()
 
+    def _execute_with_retries(
+        self,
+        connection: Connection,
+        kind: str,
+        f: Callable[[DatabricksSQLCursorWrapper], None],
+    ) -> DatabricksSQLCursorWrapper:
+        """Run f with a new cursor of the connection, retrying with a new cursor if it fails
+        with a transient error and the retry policy of the compute allows it."""
+
+        compute_name = getattr(connection, "compute_name", "")
+        policy = self._get_query_retry_policy(compute_name)
+        attempt = 0
+        while True:
+            handle: DatabricksSQLConnectionWrapper = connection.handle
+            cursor = handle.cursor()
+            self.query_metrics.record_live_cursors(
+                handle.live_cursor_count, compute_name=compute_name
+            )
+            try:
+                with self._query_slot(connection), self._record_query(connection, kind):
+                    f(cursor)
+                return cursor
+            except Error as exc:
+                cursor.close()
+                reason = _get_retry_reason(exc)
+                if reason is None or not policy.should_retry(kind, attempt):
+                    raise
+                if reason == "session_expired" and not (
+                    self._reopen_session(connection)
+                    and self._restore_catalog(connection, handle.current_catalog)
+                ):
+                    raise
+
+                delay = policy.get_delay(attempt)
+                attempt += 1
+                logger.debug(QueryRetry(reason, attempt, delay, exc))
+                self.query_metrics.record_retry(kind, reason, compute_name=compute_name)
+                time.sleep(delay)
+
+    def _reopen_session(self, connection: Connection) -> bool:
+        """Replace the expired session of the connection with a new one. Returns whether the
+        connection will get a new session on next use."""
+        return False
+
+    def _restore_catalog(self, connection: Connection, catalog: Optional[str]) -> bool:
+        """Switch the new session of a reopened connection to the catalog the expired one was
+        in. Returns False if that catalog is not known, so the query is not retried elsewhere.
+        """
+
+        handle: DatabricksSQLConnectionWrapper = connection.handle
+        if handle.current_catalog == catalog:
+            return True
+        if catalog is None:
+            return False
+
+        cursor = handle.cursor()
+        try:
+            cursor.execute(f"USE CATALOG `{catalog.replace('`', '``')}`")
+        finally:
+            cursor.close()
+        return True
+
+    def _get_query_retry_policy(self, compute_name: str) -> DatabricksQueryRetryPolicy:
+        if compute_name in self.query_retry_policies:
+            return self.query_retry_policies[compute_name]
+
+        with self.lock:
+            if compute_name not in self.query_retry_policies:
+                creds = cast(DatabricksCredentials, self.profile.credentials)
+                self.query_retry_policies[compute_name] = _get_query_retry_policy(
+                    compute_name or None, creds
+                )
+            return self.query_retry_policies[compute_name]
+
+    @contextmanager
+    def _query_slot(self, connection: Connection) -> Iterator[None]:
+        """Hold a query slot on the compute of the connection while running a query, if the
+        compute limits the number of concurrent queries."""
+
+        compute_name = getattr(connection, "compute_name", "")
+        limiter = self._get_query_limiter(compute_name)
+        if limiter is None:
+            yield
+        else:
+            with limiter.slot():
+                yield
+
+    @contextmanager
+    def _record_query(self, connection: Connection, kind: str) -> Iterator[None]:
+        """Record the latency of the query run within the context in the query metrics."""
+
+        compute_name = getattr(connection, "compute_name", "")
+        node_id = get_node_info().get("unique_id")
+        start = time.time()
+        try:
+            yield
+        except Exception:
+            self.query_metrics.record(
+                kind, time.time() - start, compute_name=compute_name, node_id=node_id, error=True
+            )
+            raise
+        self.query_metrics.record(
+            kind, time.time() - start, compute_name=compute_name, node_id=node_id
+        )
+
+    def _log_connection_summaries(self) -> None:
+        if not self.connection_open_stats.is_empty():
+            logger.debug(ConnectionOpenSummary(self.connection_open_stats))
+        if not token_refresh_stats.is_empty():
+            logger.debug(TokenRefreshSummary(token_refresh_stats))
+        if not self.column_cache.is_empty():
+            cache = self.column_cache
+            logger.debug(ColumnCacheSummary(cache.hits, cache.misses, cache.invalidations))
+
+    def _export_query_metrics(self) -> None:
+        if not QUERY_METRICS_PATH or self.query_metrics.is_empty():
+            return
+        try:
+            self.query_metrics.export(QUERY_METRICS_PATH)
+        except OSError as e:
+            logger.warning(f"Unable to write query metrics to {QUERY_METRICS_PATH}: {e}")
+
+    # override
+    def cleanup_all(self) -> None:
+        super().cleanup_all()
+        stop_token_refresher()
+        self._log_connection_summaries()
+        self._export_query_metrics()
+
+    def _get_query_limiter(self, compute_name: str) -> Optional[DatabricksQueryLimiter]:
+        if compute_name in self.query_limiters:
+            return self.query_limiters[compute_name]
+
+        with self.lock:
+            if compute_name not in self.query_limiters:
+                creds = cast(DatabricksCredentials, self.profile.credentials)
+                max_concurrent_queries = _get_max_concurrent_queries(compute_name or None, creds)
+                self.query_limiters[compute_name] = (
+                    None
+                    if max_concurrent_queries is None
+                    else DatabricksQueryLimiter(compute_name, max_concurrent_queries)
+                )
+            return self.query_limiters[compute_name]
+
     def list_schemas(self, database: str, schema: Optional[str] = None) -> "Table":
         database = database.strip("`")
         if schema:
@@ -727,8 +1698,12 @@ class DatabricksConnectionManager(SparkConnectionManager):
         creds: DatabricksCredentials = connection.credentials
         timeout = creds.connect_timeout
 
+        timings = ConnectionOpenTimings()
+        start = time.time()
         # gotta keep this so we don't prompt users many times
         cls.credentials_provider = creds.authenticate(cls.credentials_provider)
+        timings.authenticate = time.time() - start
+        credentials_provider = TimedCredentialsProvider(cls.credentials_provider, timings)
 
         invocation_env = creds.get_invocation_env()
         user_agent_entry = cls._user_agent
@@ -744,14 +1719,23 @@ class DatabricksConnectionManager(SparkConnectionManager):
         # If a model specifies a compute resource the http path
         # may be different than the http_path property of creds.
         http_path = _get_http_path(query_header_context, creds)
+        circuit_breaker = get_circuit_breaker(
+            http_path or "", _get_compute_name(query_header_context), creds
+        )
+
+        connect_start = time.time()
 
         def connect() -> DatabricksSQLConnectionWrapper:
+            timings.attempts += 1
+            attempt_start = time.time()
+            token_time = timings.token
+            circuit_breaker.before_attempt()
             try:
                 # TODO: what is the error when a user specifies a catalog they don't have access to
                 conn: DatabricksSQLConnection = dbsql.connect(
                     server_hostname=creds.host,
                     http_path=http_path,
-                    credentials_provider=cls.credentials_provider,
+                    credentials_provider=credentials_provider,
                     http_headers=http_headers if http_headers else None,
                     session_configuration=creds.session_properties,
                     catalog=creds.database,
@@ -760,16 +1744,27 @@ class DatabricksConnectionManager(SparkConnectionManager):
                     _user_agent_entry=user_agent_entry,
                     **connection_parameters,
                 )
-                logger.debug(ConnectionCreated(str(conn)))
+                _update_connect_timings(timings, connect_start, attempt_start, token_time)
+                circuit_breaker.record_success()
+                logger.debug(ConnectionCreated(str(conn), timings))
 
                 return DatabricksSQLConnectionWrapper(
                     conn,
                     is_cluster=creds.cluster_id is not None,
                     creds=creds,
                     user_agent=user_agent_entry,
+                    http_path=http_path,
+                    catalog=creds.database,
                 )
-            except Error as exc:
-                logger.error(ConnectionCreateError(exc))
+            except Exception as exc:
+                # Not only connector errors: an outage can also surface as a requests or OAuth
+                # error raised while fetching the token
+                _update_connect_timings(timings, connect_start, attempt_start, token_time)
+                circuit_breaker.record_failure()
+                logger.error(ConnectionCreateError(exc, timings))
+                raise
+            except BaseException:
+                circuit_breaker.abort_attempt()
                 raise
 
         def exponential_backoff(attempt: int) -> int:
@@ -780,14 +1775,23 @@ class DatabricksConnectionManager(SparkConnectionManager):
         if creds.retry_all:
             retryable_exceptions = [Error]
 
-        return cls.retry_connection(
-            connection,
-            connect=connect,
-            logger=logger,
-            retryable_exceptions=retryable_exceptions,
-            retry_limit=creds.connect_retries,
-            retry_timeout=(timeout if timeout is not None else exponential_backoff),
-        )
+        try:
+            connection = cls.retry_connection(
+                connection,
+                connect=connect,
+                logger=logger,
+                retryable_exceptions=retryable_exceptions,
+                retry_limit=creds.connect_retries,
+                retry_timeout=(timeout if timeout is not None else exponential_backoff),
+            )
+        except Exception:
+            _update_connect_timings(timings, connect_start)
+            timings.done = True
+            cls.connection_open_stats.record(timings, failed=True)
+            raise
+        timings.done = True
+        cls.connection_open_stats.record(timings)
+        return connection
 
     @classmethod
     def get_response(cls, cursor: DatabricksSQLCursorWrapper) -> DatabricksAdapterResponse:
@@ -810,6 +1814,10 @@ class ExtendedSessionConnectionManager(DatabricksConnectionManager):
         self.threads_compute_connections: Dict[
             Hashable, Dict[Hashable, DatabricksDBTConnection]
         ] = {}
+        self.session_pools: Dict[str, DatabricksSessionPool] = {}
+        self._prewarmed = False
+        self._reaper: Optional[Thread] = None
+        self._reaper_wakeup = Event()
 
     def set_connection_name(
         self, name: Optional[str] = None, query_header_context: Any = None
@@ -819,7 +1827,7 @@ class ExtendedSessionConnectionManager(DatabricksConnectionManager):
         Creates a connection for this thread if one doesn't already
         exist, and will rename an existing connection."""
 
-        self._cleanup_idle_connections()
+        self._prewarm_session_pools()
 
         conn_name: str = "master" if name is None else name
 
@@ -829,6 +1837,7 @@ class ExtendedSessionConnectionManager(DatabricksConnectionManager):
         if conn is None:
             conn = self._create_compute_connection(conn_name, query_header_context)
         else:  # existing connection either wasn't open or didn't have the right name
+            self._close_if_idle_too_long(conn)
             conn = self._update_compute_connection(conn, conn_name)
 
         conn._acquire(query_header_context)
@@ -843,6 +1852,8 @@ class ExtendedSessionConnectionManager(DatabricksConnectionManager):
                 return
 
         conn._release()
+        if conn.acquire_release_count == 0:
+            self._return_to_pool(conn)
 
     # override
     @classmethod
@@ -856,6 +1867,8 @@ class ExtendedSessionConnectionManager(DatabricksConnectionManager):
 
     # override
     def cleanup_all(self) -> None:
+        self._stop_reaper()
+
         with self.lock:
             for thread_connections in self.threads_compute_connections.values():
                 for connection in thread_connections.values():
@@ -869,9 +1882,29 @@ class ExtendedSessionConnectionManager(DatabricksConnectionManager):
                         )
                     self.close(connection)
 
+            for pool in self.session_pools.values():
+                logger.debug(
+                    SessionPoolStats(
+                        pool.http_path,
+                        pool.size,
+                        pool.hits,
+                        pool.misses,
+                        pool.waits,
+                        pool.wait_time,
+                    )
+                )
+                for handle in pool.drain():
+                    handle.close()
+
             # garbage collect these connections
             self.thread_connections.clear()
             self.threads_compute_connections.clear()
+            self.session_pools.clear()
+            self._prewarmed = False
+
+        stop_token_refresher()
+        self._log_connection_summaries()
+        self._export_query_metrics()
 
     def _update_compute_connection(
         self, conn: DatabricksDBTConnection, new_name: str
@@ -884,7 +1917,7 @@ class ExtendedSessionConnectionManager(DatabricksConnectionManager):
         orig_conn_name: str = conn.name or ""
 
         if conn.state != ConnectionState.OPEN:
-            conn.handle = LazyHandle(self.open)
+            conn.handle = LazyHandle(self._open_pooled)
         if conn.name != new_name:
             conn.name = new_name
             fire_event(ConnectionReused(orig_conn_name=orig_conn_name, conn_name=new_name))
@@ -931,30 +1964,31 @@ class ExtendedSessionConnectionManager(DatabricksConnectionManager):
             threads_map = self._get_compute_connections()
             return threads_map.get(compute_name)
 
-    def _cleanup_idle_connections(self) -> None:
-        with self.lock:
-            # Get all connections associated with this thread. There can be multiple connections
-            # if different models use different compute resources
-            thread_conns = self._get_compute_connections()
-            for conn in thread_conns.values():
-                logger.debug(ConnectionIdleCheck(str(conn)))
-
-                # Generally speaking we only want to close/refresh the connection if the
-                # acquire_release_count is zero.  i.e. the connection is not currently in use.
-                # However python models acquire a connection then run the pyton model, which
-                # doesn't actually use the connection. If the python model takes lone enought to
-                # run the connection can be idle long enough to timeout on the back end.
-                # If additional sql needs to be run after the python model, but before the
-                # connection is released, the connection needs to be refreshed or there will
-                # be a failure.  Making an exception when language is 'python' allows the
-                # the call to _cleanup_idle_connections from get_thread_connection to refresh the
-                # connection in this scenario.
-                if (
-                    conn.acquire_release_count == 0 or conn.language == "python"
-                ) and conn._idle_too_long():
-                    logger.debug(ConnectionIdleClose(str(conn)))
-                    self.close(conn)
-                    conn._reset_handle(self._open)
+    def _close_if_idle_too_long(self, conn: DatabricksDBTConnection) -> None:
+        """Close the session held by a connection of the current thread if it sat idle for too
+        long. Sessions given back to a pool are expired by the reaper thread instead, so this
+        only has to look at the one connection about to be used."""
+
+        # Generally speaking we only want to close/refresh the connection if the
+        # acquire_release_count is zero.  i.e. the connection is not currently in use.
+        # However python models acquire a connection then run the pyton model, which
+        # doesn't actually use the connection. If the python model takes lone enought to
+        # run the connection can be idle long enough to timeout on the back end.
+        # If additional sql needs to be run after the python model, but before the
+        # connection is released, the connection needs to be refreshed or there will
+        # be a failure.  Making an exception when language is 'python' allows the
+        # the call from get_thread_connection to refresh the connection in this scenario.
+        if (
+            conn.state == ConnectionState.OPEN
+            and (conn.acquire_release_count == 0 or conn.language == "python")
+            and conn._idle_too_long()
+        ):
+            if conn.keepalive and conn.handle.ping():
+                conn.last_used_time = time.time()
+                return
+
+            logger.debug(ConnectionIdleClose(str(conn)))
+            self._close_pooled(conn)
 
     def _create_compute_connection(
         self, conn_name: str, query_header_context: Any = None
@@ -978,8 +2012,9 @@ class ExtendedSessionConnectionManager(DatabricksConnectionManager):
         conn.http_path = _get_http_path(query_header_context, creds=creds) or ""
         conn.thread_identifier = cast(Tuple[int, int], self.get_thread_identifier())
         conn.max_idle_time = _get_max_idle_time(query_header_context, creds=creds)
+        conn.keepalive = _get_keepalive(compute_name or None, creds)
 
-        conn.handle = LazyHandle(self.open)
+        conn.handle = LazyHandle(self._open_pooled)
 
         logger.debug(ConnectionCreate(str(conn)))
 
@@ -998,12 +2033,277 @@ class ExtendedSessionConnectionManager(DatabricksConnectionManager):
 
     def get_thread_connection(self) -> Connection:
         conn = super().get_thread_connection()
-        self._cleanup_idle_connections()
         dbr_conn = cast(DatabricksDBTConnection, conn)
+        self._close_if_idle_too_long(dbr_conn)
         logger.debug(ConnectionRetrieve(str(dbr_conn)))
 
         return conn
 
+    def _get_session_pool(
+        self, http_path: str, compute_name: Optional[str] = None
+    ) -> DatabricksSessionPool:
+        """Get the session pool for the compute, creating it on first use."""
+
+        with self.lock:
+            pool = self.session_pools.get(http_path)
+            if pool is None:
+                creds = cast(DatabricksCredentials, self.profile.credentials)
+                min_size, max_size = _get_pool_size(compute_name, creds)
+                pool = DatabricksSessionPool(
+                    http_path,
+                    min_size=min_size,
+                    max_size=max_size,
+                    max_idle_time=_get_compute_max_idle_time(compute_name, creds),
+                    keepalive=_get_keepalive(compute_name, creds),
+                    timeout=_get_pool_timeout(compute_name, creds),
+                )
+                self.session_pools[http_path] = pool
+                self._wake_reaper()
+            return pool
+
+    def _prewarm_session_pools(self) -> None:
+        """Open sessions for every compute in the profile that asks for it, concurrently, so
+        that the first nodes don't pay for opening them."""
+
+        # Checked without the lock first, as this runs every time a node acquires a connection
+        if self._prewarmed:
+            return
+
+        with self.lock:
+            if self._prewarmed:
+                return
+            self._prewarmed = True
+
+        creds = cast(DatabricksCredentials, self.profile.credentials)
+
+        # Computes are pooled by http_path, so only the first compute for a path is warmed.
+        computes: Dict[str, Optional[str]] = {}
+        if creds.http_path:
+            computes[creds.http_path] = None
+        for name, compute in (creds.compute or {}).items():
+            if compute.get("http_path"):
+                computes.setdefault(compute["http_path"], name)
+
+        warm_ups: List[Tuple[DatabricksSessionPool, int]] = []
+        for http_path, compute_name in computes.items():
+            prewarm_size = _get_prewarm_size(compute_name, creds)
+            if prewarm_size > 0:
+                warm_ups.append((self._get_session_pool(http_path, compute_name), prewarm_size))
+
+        if not warm_ups:
+            return
+
+        start = time.time()
+
+        def warm(pool: DatabricksSessionPool) -> Tuple[bool, float]:
+            opened = self._fill_session_pool(pool)
+            return opened, time.time() - start
+
+        with ThreadPoolExecutor(max_workers=sum(size for _, size in warm_ups)) as executor:
+            futures: List[Tuple[DatabricksSessionPool, List[Future[Tuple[bool, float]]]]] = []
+            for pool, prewarm_size in warm_ups:
+                pool_futures = []
+                while pool.reserve(prewarm_size):
+                    pool_futures.append(executor.submit(warm, pool))
+                futures.append((pool, pool_futures))
+
+            for pool, pool_futures in futures:
+                results = [future.result() for future in pool_futures]
+                logger.info(
+                    SessionPoolPrewarm(
+                        pool.http_path,
+                        sum(1 for opened, _ in results if opened),
+                        max((elapsed for _, elapsed in results), default=0.0),
+                    )
+                )
+
+    def _open_pooled(self, connection: Connection) -> Connection:
+        """Open the connection by leasing a session from the pool of its compute, opening a
+        new session only when no idle one is available."""
+
+        if connection.state == ConnectionState.OPEN:
+            return connection
+
+        conn = cast(DatabricksDBTConnection, connection)
+        pool = self._get_session_pool(conn.http_path, conn.compute_name)
+        leased = pool.lease()
+
+        if leased is None:
+            try:
+                return self.open(conn)
+            except Exception:
+                pool.discard()
+                raise
+
+        handle, last_used_time = leased
+        if pool.keepalive and pool._is_expired(last_used_time):
+            # The reaper didn't get to this session in time, check that it's still alive.
+            if handle.ping():
+                last_used_time = time.time()
+            else:
+                handle.close()
+                try:
+                    return self.open(conn)
+                except Exception:
+                    pool.discard()
+                    raise
+
+        conn.handle = handle
+        conn.state = ConnectionState.OPEN
+        conn.session_id = handle.session_id
+        conn.last_used_time = last_used_time
+        logger.debug(ConnectionLeased(str(conn)))
+
+        return conn
+
+    def _return_to_pool(self, conn: DatabricksDBTConnection) -> None:
+        """Give the session of a connection that is no longer in use back to its pool."""
+
+        if conn.state != ConnectionState.OPEN:
+            return
+
+        pool = self._get_session_pool(conn.http_path, conn.compute_name)
+        pool.release(conn.handle, conn.last_used_time or time.time())
+        conn.state = ConnectionState.INIT
+        conn.transaction_open = False
+        conn._reset_handle(self._open_pooled)
+
+    def _reopen_session(self, connection: Connection) -> bool:
+        # The session of a long lived connection may expire on the back end between queries.
+        # Drop it so the next use of the connection leases or opens another one.
+        self._close_pooled(cast(DatabricksDBTConnection, connection))
+        return True
+
+    def _close_pooled(self, conn: DatabricksDBTConnection) -> None:
+        """Close the session leased by a connection and free its slot in the pool."""
+
+        was_open = conn.state == ConnectionState.OPEN
+        self.close(conn)
+        if was_open:
+            self._get_session_pool(conn.http_path, conn.compute_name).discard()
+        conn._reset_handle(self._open_pooled)
+
+    def _wake_reaper(self) -> None:
+        """Start the reaper thread if it isn't running, and have it look at the pools again."""
+
+        with self.lock:
+            if self._reaper is None:
+                self._reaper = Thread(
+                    target=self._run_reaper, name="dbt-databricks-session-reaper", daemon=True
+                )
+                self._reaper.start()
+            self._reaper_wakeup.set()
+
+    def _stop_reaper(self) -> None:
+        """Have the reaper thread exit, waiting only briefly for a session it is closing or
+        opening. It stops at the next pool otherwise, and being a daemon never blocks exit."""
+
+        with self.lock:
+            reaper = self._reaper
+            self._reaper = None
+            self._reaper_wakeup.set()
+
+        if reaper is not None:
+            reaper.join(timeout=REAPER_STOP_TIMEOUT)
+
+    def _is_reaper_running(self) -> bool:
+        # A reaper replaced by a newer one, or stopped, exits even if it missed the wakeup
+        with self.lock:
+            return self._reaper is current_thread()
+
+    def _run_reaper(self) -> None:
+        """Expire idle sessions in the background, sleeping until the next one is due."""
+
+        while self._is_reaper_running():
+            self._reaper_wakeup.wait(self._get_reap_delay())
+            self._reaper_wakeup.clear()
+            if self._is_reaper_running():
+                self._maintain_session_pools()
+
+    def _get_reap_delay(self) -> Optional[float]:
+        """Get the number of seconds until the next idle session expires.
+
+        A session given back after this is computed can't expire before the smallest max idle
+        time has passed, so the delay is capped at that. None means there is nothing to expire.
+        """
+
+        with self.lock:
+            pools = list(self.session_pools.values())
+
+        now = time.time()
+        delays: List[float] = [pool.max_idle_time for pool in pools if pool.max_idle_time > 0]
+        for pool in pools:
+            next_expiry = pool.next_expiry()
+            if next_expiry is not None:
+                delays.append(max(next_expiry - now, 0))
+
+        return min(delays, default=None)
+
+    def _maintain_session_pools(self) -> None:
+        """Close sessions that sat idle in a pool for too long, and top pools back up to
+        their minimum size."""
+
+        with self.lock:
+            pools = list(self.session_pools.values())
+
+        for pool in pools:
+            with self.lock:
+                if self._reaper is None:
+                    # Stopped by cleanup, which takes care of the remaining sessions
+                    return
+            if pool.keepalive:
+                for handle in pool.lease_expired():
+                    if handle.ping():
+                        self._release_to_pool(pool, handle)
+                    else:
+                        handle.close()
+                        pool.discard()
+            for handle in pool.reap():
+                logger.debug(SessionPoolIdleClose(pool.http_path, handle.session_id))
+                handle.close()
+            while pool.reserve(pool.min_size):
+                if not self._fill_session_pool(pool):
+                    break
+
+    def _fill_session_pool(self, pool: DatabricksSessionPool) -> bool:
+        """Open a session for a slot reserved in the pool and add it to the idle sessions.
+
+        Failures are not raised, they will surface when a node actually needs a session."""
+
+        conn = DatabricksDBTConnection(
+            type=Identifier(self.TYPE),
+            name=f"pool:{pool.http_path}",
+            state=ConnectionState.INIT,
+            transaction_open=False,
+            handle=None,
+            credentials=self.profile.credentials,
+        )
+        conn.http_path = pool.http_path
+
+        try:
+            self.open(conn)
+        except Exception:
+            pool.discard()
+            return False
+
+        return self._release_to_pool(pool, conn.handle)
+
+    def _release_to_pool(
+        self, pool: DatabricksSessionPool, handle: DatabricksSQLConnectionWrapper
+    ) -> bool:
+        """Give a session opened or pinged outside of a node back to its pool. If cleanup
+        stopped the reaper and drained the pools meanwhile, close the session instead, as
+        nothing would close it anymore. Returns whether the session went back to the pool."""
+
+        with self.lock:
+            if self._reaper is not None and self.session_pools.get(pool.http_path) is pool:
+                pool.release(handle, time.time())
+                return True
+
+        handle.close()
+        pool.discard()
+        return False
+
     @classmethod
     def open(cls, connection: Connection) -> Connection:
         # Once long session management is no longer under the USE_LONG_SESSIONS toggle
@@ -1020,8 +2320,12 @@ class ExtendedSessionConnectionManager(DatabricksConnectionManager):
         creds: DatabricksCredentials = connection.credentials
         timeout = creds.connect_timeout
 
+        timings = ConnectionOpenTimings()
+        start = time.time()
         # gotta keep this so we don't prompt users many times
         cls.credentials_provider = creds.authenticate(cls.credentials_provider)
+        timings.authenticate = time.time() - start
+        credentials_provider = TimedCredentialsProvider(cls.credentials_provider, timings)
 
         invocation_env = creds.get_invocation_env()
         user_agent_entry = cls._user_agent
@@ -1037,14 +2341,23 @@ class ExtendedSessionConnectionManager(DatabricksConnectionManager):
         # If a model specifies a compute resource the http path
         # may be different than the http_path property of creds.
         http_path = databricks_connection.http_path
+        circuit_breaker = get_circuit_breaker(
+            http_path, databricks_connection.compute_name or None, creds
+        )
+
+        connect_start = time.time()
 
         def connect() -> DatabricksSQLConnectionWrapper:
+            timings.attempts += 1
+            attempt_start = time.time()
+            token_time = timings.token
+            circuit_breaker.before_attempt()
             try:
                 # TODO: what is the error when a user specifies a catalog they don't have access to
                 conn = dbsql.connect(
                     server_hostname=creds.host,
                     http_path=http_path,
-                    credentials_provider=cls.credentials_provider,
+                    credentials_provider=credentials_provider,
                     http_headers=http_headers if http_headers else None,
                     session_configuration=creds.session_properties,
                     catalog=creds.database,
@@ -1057,16 +2370,27 @@ class ExtendedSessionConnectionManager(DatabricksConnectionManager):
                 if conn:
                     databricks_connection.session_id = conn.get_session_id_hex()
                 databricks_connection.last_used_time = time.time()
-                logger.debug(ConnectionCreated(str(databricks_connection)))
+                _update_connect_timings(timings, connect_start, attempt_start, token_time)
+                circuit_breaker.record_success()
+                logger.debug(ConnectionCreated(str(databricks_connection), timings))
 
                 return DatabricksSQLConnectionWrapper(
                     conn,
                     is_cluster=creds.cluster_id is not None,
                     creds=creds,
                     user_agent=user_agent_entry,
+                    http_path=http_path,
+                    catalog=creds.database,
                 )
-            except Error as exc:
-                logger.error(ConnectionCreateError(exc))
+            except Exception as exc:
+                # Not only connector errors: an outage can also surface as a requests or OAuth
+                # error raised while fetching the token
+                _update_connect_timings(timings, connect_start, attempt_start, token_time)
+                circuit_breaker.record_failure()
+                logger.error(ConnectionCreateError(exc, timings))
+                raise
+            except BaseException:
+                circuit_breaker.abort_attempt()
                 raise
 
         def exponential_backoff(attempt: int) -> int:
@@ -1077,14 +2401,63 @@ class ExtendedSessionConnectionManager(DatabricksConnectionManager):
         if creds.retry_all:
             retryable_exceptions = [Error]
 
-        return cls.retry_connection(
-            connection,
-            connect=connect,
-            logger=logger,
-            retryable_exceptions=retryable_exceptions,
-            retry_limit=creds.connect_retries,
-            retry_timeout=(timeout if timeout is not None else exponential_backoff),
-        )
+        try:
+            connection = cls.retry_connection(
+                connection,
+                connect=connect,
+                logger=logger,
+                retryable_exceptions=retryable_exceptions,
+                retry_limit=creds.connect_retries,
+                retry_timeout=(timeout if timeout is not None else exponential_backoff),
+            )
+        except Exception:
+            _update_connect_timings(timings, connect_start)
+            timings.done = True
+            cls.connection_open_stats.record(timings, failed=True)
+            raise
+        timings.done = True
+        cls.connection_open_stats.record(timings)
+        return connection
+
+
+class TimedCredentialsProvider:
+    """Wrap a credentials provider to add the time spent getting tokens while a connection
+    opens to its timings. Attributes are delegated to the wrapped provider."""
+
+    def __init__(self, provider: TCredentialProvider, timings: ConnectionOpenTimings):
+        self._provider = provider
+        self._timings = timings
+
+    def __call__(self, *args: Any) -> Callable[[], Dict[str, str]]:
+        start = time.time()
+        header_factory = get_header_factory(self._provider, *args)
+        self._timings.token += time.time() - start
+
+        def timed_header_factory() -> Dict[str, str]:
+            start = time.time()
+            headers = header_factory()
+            if not self._timings.done:
+                self._timings.token += time.time() - start
+            return headers
+
+        return timed_header_factory
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._provider, name)
+
+
+def _update_connect_timings(
+    timings: ConnectionOpenTimings,
+    connect_start: float,
+    attempt_start: Optional[float] = None,
+    token_time: float = 0.0,
+) -> None:
+    """Update the connect and backoff timings once an attempt to connect finished."""
+
+    now = time.time()
+    if attempt_start is not None:
+        timings.connect += now - attempt_start - (timings.token - token_time)
+    timings.backoff = max(now - connect_start - timings.connect - timings.token, 0.0)
 
 
 def _get_pipeline_state(session: Session, host: str, pipeline_id: str) -> dict:
@@ -1198,20 +2571,141 @@ def _get_http_path(query_header_context: Any, creds: DatabricksCredentials) -> O
     return http_path
 
 
+def _get_compute_setting(
+    compute_name: Optional[str], creds: DatabricksCredentials, key: str
+) -> Any:
+    """Get a connection setting for the named compute, falling back to the value of the same
+    setting at the top level of the profile."""
+
+    value = getattr(creds, key, None)
+    if compute_name and creds.compute:
+        value = creds.compute.get(compute_name, {}).get(key, value)
+    return value
+
+
+def _get_int_setting(value: Any, key: str) -> int:
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise DbtRuntimeError(f"{value} is not a valid value for {key}. Must be an integer.")
+    if isinstance(value, str):
+        if not value.strip().isnumeric():
+            raise DbtRuntimeError(f"{value} is not a valid value for {key}. Must be an integer.")
+        return int(value.strip())
+    if value < 0:
+        raise DbtRuntimeError(f"{value} is not a valid value for {key}. Must not be negative.")
+    return value
+
+
+def _get_pool_size(
+    compute_name: Optional[str], creds: DatabricksCredentials
+) -> Tuple[int, Optional[int]]:
+    """Get the minimum and maximum number of sessions to pool for the named compute."""
+
+    min_size = _get_compute_setting(compute_name, creds, "connect_pool_min_size")
+    max_size = _get_compute_setting(compute_name, creds, "connect_pool_max_size")
+
+    return (
+        (
+            DEFAULT_POOL_MIN_SIZE
+            if min_size is None
+            else _get_int_setting(min_size, "connect_pool_min_size")
+        ),
+        (
+            DEFAULT_POOL_MAX_SIZE
+            if max_size is None
+            else _get_int_setting(max_size, "connect_pool_max_size")
+        ),
+    )
+
+
+def _get_pool_timeout(compute_name: Optional[str], creds: DatabricksCredentials) -> int:
+    """Get the number of seconds to wait for a session of the named compute's full pool."""
+
+    timeout = _get_compute_setting(compute_name, creds, "connect_pool_timeout")
+    return (
+        DEFAULT_POOL_TIMEOUT
+        if timeout is None
+        else _get_int_setting(timeout, "connect_pool_timeout")
+    )
+
+
+def _get_prewarm_size(compute_name: Optional[str], creds: DatabricksCredentials) -> int:
+    """Get the number of sessions to open for the named compute before the first node runs."""
+
+    prewarm_size = _get_compute_setting(compute_name, creds, "connect_pool_prewarm")
+    return 0 if prewarm_size is None else _get_int_setting(prewarm_size, "connect_pool_prewarm")
+
+
+def _get_max_concurrent_queries(
+    compute_name: Optional[str], creds: DatabricksCredentials
+) -> Optional[int]:
+    max_concurrent_queries = _get_compute_setting(compute_name, creds, "max_concurrent_queries")
+    if max_concurrent_queries is None:
+        return None
+    return _get_int_setting(max_concurrent_queries, "max_concurrent_queries")
+
+
+def _get_query_retry_policy(
+    compute_name: Optional[str], creds: DatabricksCredentials
+) -> DatabricksQueryRetryPolicy:
+    retries = _get_compute_setting(compute_name, creds, "query_retries")
+    statements = _get_compute_setting(compute_name, creds, "query_retry_statements")
+    if isinstance(statements, str):
+        statements = [statement.strip() for statement in statements.split(",")]
+    if statements is not None and not isinstance(statements, (list, tuple)):
+        raise DbtRuntimeError(
+            f"{statements} is not a valid value for query_retry_statements. Must be a list."
+        )
+    return DatabricksQueryRetryPolicy(
+        DEFAULT_QUERY_RETRIES if retries is None else _get_int_setting(retries, "query_retries"),
+        [*DEFAULT_QUERY_RETRY_STATEMENTS, *(statements or [])],
+    )
+
+
+def _get_retry_reason(exc: Error) -> Optional[str]:
+    """Classify an error raised by a query, returning None if it isn't worth retrying."""
+
+    if isinstance(exc, NonRecoverableNetworkError):
+        return None
+
+    message = str(exc.message or exc)
+    if SESSION_EXPIRED_REGEX.search(message):
+        return "session_expired"
+    if isinstance(exc, RequestError):
+        http_code = exc.context.get("http-code")
+        if http_code in (429, 503):
+            return "throttled"
+        if http_code in (502, 504):
+            return "transient"
+    if TRANSIENT_ERROR_REGEX.search(message):
+        return "transient"
+    return None
+
+
+def _get_keepalive(compute_name: Optional[str], creds: DatabricksCredentials) -> bool:
+    """Get whether idle sessions of the compute are kept alive rather than closed after
+    connect_max_idle seconds."""
+
+    keepalive = _get_compute_setting(compute_name, creds, "connect_keepalive")
+    if keepalive is None or isinstance(keepalive, bool):
+        return bool(keepalive)
+    if isinstance(keepalive, str) and keepalive.strip().lower() in ("true", "false"):
+        return keepalive.strip().lower() == "true"
+    raise DbtRuntimeError(
+        f"{keepalive} is not a valid value for connect_keepalive. Must be true or false."
+    )
+
+
 def _get_max_idle_time(query_header_context: Any, creds: DatabricksCredentials) -> int:
-    """Get the http_path for the compute specified for the node.
+    """Get the max idle time for the compute specified for the node.
     If none is specified default will be used."""
 
-    max_idle_time = (
-        DEFAULT_MAX_IDLE_TIME if creds.connect_max_idle is None else creds.connect_max_idle
-    )
+    return _get_compute_max_idle_time(_get_compute_name(query_header_context), creds)
 
-    if query_header_context:
-        compute_name = _get_compute_name(query_header_context)
-        if compute_name and creds.compute:
-            max_idle_time = creds.compute.get(compute_name, {}).get(
-                "connect_max_idle", max_idle_time
-            )
+
+def _get_compute_max_idle_time(compute_name: Optional[str], creds: DatabricksCredentials) -> int:
+    max_idle_time: Any = _get_compute_setting(compute_name, creds, "connect_max_idle")
+    if max_idle_time is None:
+        max_idle_time = DEFAULT_MAX_IDLE_TIME
 
     if not isinstance(max_idle_time, Number):
         if isinstance(max_idle_time, str) and max_idle_time.strip().isnumeric():
@@ -1222,4 +2716,4 @@ def _get_max_idle_time(query_header_context: Any, creds: DatabricksCredentials)
                 "Must be a number of seconds."
             )
 
-    return max_idle_time
+    return cast(int, max_idle_time)
@@ -3,8 +3,10 @@ import json
 import os
 import re
 import threading
+from contextlib import nullcontext
 from dataclasses import dataclass
 from typing import Any
+from typing import Callable
 from typing import cast
 from typing import Dict
 from typing import Iterable
@@ -17,6 +19,7 @@ import keyring
 from databricks.sdk.core import CredentialsProvider
 from databricks.sdk.oauth import OAuthClient
 from databricks.sdk.oauth import SessionCredentials
+from databricks.sdk.oauth import Token
 from dbt.adapters.contracts.connection import Credentials
 from dbt.adapters.databricks.auth import m2m_auth
 from dbt.adapters.databricks.auth import token_auth
@@ -24,6 +27,8 @@ from dbt.adapters.databricks.events.credential_events import CredentialLoadError
 from dbt.adapters.databricks.events.credential_events import CredentialSaveError
 from dbt.adapters.databricks.events.credential_events import CredentialShardEvent
 from dbt.adapters.databricks.logging import logger
+from dbt.adapters.databricks.token_cache import FileTokenCache
+from dbt.adapters.databricks.token_cache import get_token_cache
 from dbt_common.exceptions import DbtConfigError
 from dbt_common.exceptions import DbtValidationError
 
@@ -45,6 +50,25 @@ SPA_CLIENT_FIXED_TIME_LIMIT_ERROR = "AADSTS700084"
 TCredentialProvider = Union[CredentialsProvider, SessionCredentials]
 
 
+class TokenSavingSessionCredentials(SessionCredentials):
+    """OAuth session credentials that save every refreshed token, so later invocations start
+    from the latest refresh token whether the token was refreshed in the background or inline.
+    """
+
+    def __init__(self, client: OAuthClient, token: Token, on_refresh: Callable[[Token], None]):
+        super().__init__(client, token)
+        self._on_refresh = on_refresh
+
+    def refresh(self) -> Token:
+        token = super().refresh()
+        try:
+            self._on_refresh(token)
+        # error with keyring or the token cache. Maybe machine has no password persistency
+        except Exception as e:
+            logger.warning(CredentialSaveError(e))
+        return token
+
+
 @dataclass
 class DatabricksCredentials(Credentials):
     database: Optional[str] = None  # type: ignore[assignment]
@@ -68,6 +92,16 @@ class DatabricksCredentials(Credentials):
     connect_timeout: Optional[int] = None
     retry_all: bool = False
     connect_max_idle: Optional[int] = None
+    connect_keepalive: Optional[bool] = None
+    connect_circuit_breaker_threshold: Optional[int] = None
+    connect_circuit_breaker_cooldown: Optional[int] = None
+    connect_pool_min_size: Optional[int] = None
+    connect_pool_max_size: Optional[int] = None
+    connect_pool_prewarm: Optional[int] = None
+    connect_pool_timeout: Optional[int] = None
+    max_concurrent_queries: Optional[int] = None
+    query_retries: Optional[int] = None
+    query_retry_statements: Optional[List[str]] = None
 
     _credentials_provider: Optional[Dict[str, Any]] = None
     _lock = threading.Lock()  # to avoid concurrent auth
@@ -139,6 +173,10 @@ class DatabricksCredentials(Credentials):
             connection_parameters["_socket_timeout"] = 600
         self.connection_parameters = connection_parameters
 
+        # Provider resolved by the first call to authenticate. Not a field, so it is never
+        # serialized with the credentials.
+        self._resolved_provider: Optional[TCredentialProvider] = None
+
     def validate_creds(self) -> None:
         for key in ["host", "http_path"]:
             if not getattr(self, key):
@@ -245,6 +283,19 @@ class DatabricksCredentials(Credentials):
         return self.extract_cluster_id(self.http_path)  # type: ignore[arg-type]
 
     def authenticate(self, in_provider: Optional[TCredentialProvider]) -> TCredentialProvider:
+        # Once resolved, the provider of a credentials object never changes, so every thread
+        # opening a connection can read it without taking the lock.
+        provider = self._resolved_provider
+        if provider is not None:
+            return provider
+
+        # dbt will spin up multiple threads. This has to be sync. So lock here
+        with self._lock:
+            if self._resolved_provider is None:
+                self._resolved_provider = self._resolve_provider(in_provider)
+            return self._resolved_provider
+
+    def _resolve_provider(self, in_provider: Optional[TCredentialProvider]) -> TCredentialProvider:
         self.validate_creds()
         host: str = self.host or ""
         if self._credentials_provider:
@@ -255,60 +306,56 @@ class DatabricksCredentials(Credentials):
             return in_provider
 
         provider: TCredentialProvider
-        # dbt will spin up multiple threads. This has to be sync. So lock here
-        self._lock.acquire()
-        try:
-            if self.token:
-                provider = token_auth(self.token)
-                self._credentials_provider = provider.as_dict()
-                return provider
-
-            if self.client_id and self.client_secret:
-                provider = m2m_auth(
-                    host=host,
-                    client_id=self.client_id or "",
-                    client_secret=self.client_secret or "",
-                )
-                self._credentials_provider = provider.as_dict()
-                return provider
-
-            client_id = self.client_id or CLIENT_ID
-
-            if client_id == "dbt-databricks":
-                # This is the temp code to make client id dbt-databricks work with server,
-                # currently the redirect url and scope for client dbt-databricks are fixed
-                # values as below. It can be removed after Databricks extends dbt-databricks
-                # scope to all-apis
-                redirect_url = "http://localhost:8050"
-                scopes = ["sql", "offline_access"]
-            else:
-                redirect_url = self.oauth_redirect_url or REDIRECT_URL
-                scopes = self.oauth_scopes or SCOPES
+        if self.token:
+            provider = token_auth(self.token)
+            self._credentials_provider = provider.as_dict()
+            return provider
 
-            oauth_client = OAuthClient(
+        if self.client_id and self.client_secret:
+            provider = m2m_auth(
                 host=host,
-                client_id=client_id,
-                client_secret="",
-                redirect_url=redirect_url,
-                scopes=scopes,
+                client_id=self.client_id or "",
+                client_secret=self.client_secret or "",
             )
+            self._credentials_provider = provider.as_dict()
+            return provider
+
+        client_id = self.client_id or CLIENT_ID
+
+        if client_id == "dbt-databricks":
+            # This is the temp code to make client id dbt-databricks work with server,
+            # currently the redirect url and scope for client dbt-databricks are fixed
+            # values as below. It can be removed after Databricks extends dbt-databricks
+            # scope to all-apis
+            redirect_url = "http://localhost:8050"
+            scopes = ["sql", "offline_access"]
+        else:
+            redirect_url = self.oauth_redirect_url or REDIRECT_URL
+            scopes = self.oauth_scopes or SCOPES
+
+        oauth_client = OAuthClient(
+            host=host,
+            client_id=client_id,
+            client_secret="",
+            redirect_url=redirect_url,
+            scopes=scopes,
+        )
+        # Other dbt processes sharing the token cache wait here while this one refreshes or
+        # fetches the token, then pick it up from the cache
+        token_cache = get_token_cache()
+        with token_cache.lock(host) if token_cache else nullcontext():
             # optional branch. Try and keep going if it does not work
             try:
                 # try to get cached credentials
-                credsdict = self.get_sharded_password("dbt-databricks", host)
+                credsdict = self._load_token(host, token_cache)
 
                 if credsdict:
-                    provider = SessionCredentials.from_dict(oauth_client, json.loads(credsdict))
+                    provider = self._session_credentials(oauth_client, json.loads(credsdict))
                     # if refresh token is expired, this will throw
                     try:
+                        # a refreshed token gets saved by the provider itself
                         if provider.token().valid:
                             self._credentials_provider = provider.as_dict()
-                            if json.loads(credsdict) != provider.as_dict():
-                                # if the provider dict has changed, most likely because of a token
-                                # refresh, save it for further use
-                                self.set_sharded_password(
-                                    "dbt-databricks", host, json.dumps(self._credentials_provider)
-                                )
                             return provider
                     except Exception as e:
                         # SPA token are supposed to expire after 24h, no need to warn
@@ -317,30 +364,60 @@ class DatabricksCredentials(Credentials):
                         else:
                             logger.warning(CredentialLoadError(e))
                         # whatever it is, get rid of the cache
-                        self.delete_sharded_password("dbt-databricks", host)
+                        self._delete_token(host, token_cache)
 
-            # error with keyring. Maybe machine has no password persistency
+            # error with keyring or the token cache. Maybe machine has no password persistency
             except Exception as e:
                 logger.warning(CredentialLoadError(e))
 
             # no token, go fetch one
             consent = oauth_client.initiate_consent()
 
-            provider = consent.launch_external_browser()
+            provider = self._session_credentials(
+                oauth_client, consent.launch_external_browser().as_dict()
+            )
             # save for later
             self._credentials_provider = provider.as_dict()
             try:
-                self.set_sharded_password(
-                    "dbt-databricks", host, json.dumps(self._credentials_provider)
-                )
-            # error with keyring. Maybe machine has no password persistency
+                self._save_token(host, json.dumps(self._credentials_provider), token_cache)
+            # error with keyring or the token cache. Maybe machine has no password persistency
             except Exception as e:
                 logger.warning(CredentialSaveError(e))
 
             return provider
 
-        finally:
-            self._lock.release()
+    def _session_credentials(
+        self, oauth_client: OAuthClient, raw: Dict[str, Any]
+    ) -> SessionCredentials:
+        host = self.host or ""
+        return TokenSavingSessionCredentials(
+            oauth_client,
+            Token.from_dict(raw["token"]),
+            lambda token: self._save_refreshed_token(host, token),
+        )
+
+    def _save_refreshed_token(self, host: str, token: Token) -> None:
+        self._credentials_provider = {"token": token.as_dict()}
+        # Not locked: the refresh may happen while this process holds the lock in authenticate,
+        # and the cache replaces its files atomically anyway
+        self._save_token(host, json.dumps(self._credentials_provider), get_token_cache())
+
+    def _load_token(self, host: str, token_cache: Optional[FileTokenCache]) -> Optional[str]:
+        if token_cache:
+            return token_cache.get(host)
+        return self.get_sharded_password("dbt-databricks", host)
+
+    def _save_token(self, host: str, token: str, token_cache: Optional[FileTokenCache]) -> None:
+        if token_cache:
+            token_cache.set(host, token)
+        else:
+            self.set_sharded_password("dbt-databricks", host, token)
+
+    def _delete_token(self, host: str, token_cache: Optional[FileTokenCache]) -> None:
+        if token_cache:
+            token_cache.delete(host)
+        else:
+            self.delete_sharded_password("dbt-databricks", host)
 
     def set_sharded_password(self, service_name: str, username: str, password: str) -> None:
         max_size = MAX_NT_PASSWORD_SIZE
@@ -419,6 +496,4 @@ class DatabricksCredentials(Credentials):
             scopes=self.oauth_scopes or SCOPES,
         )
 
-        return SessionCredentials.from_dict(
-            client=oauth_client, raw=self._credentials_provider or {"token": {}}
-        )
+        return self._session_credentials(oauth_client, self._credentials_provider or {"token": {}})
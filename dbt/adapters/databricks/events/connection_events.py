@@ -5,6 +5,8 @@ from typing import Tuple
 
 from databricks.sql.client import Connection
 from dbt.adapters.databricks.events.base import SQLErrorEvent
+from dbt.adapters.databricks.metrics import ConnectionOpenStats
+from dbt.adapters.databricks.metrics import ConnectionOpenTimings
 
 
 class ConnectionEvent(ABC):
@@ -42,13 +44,26 @@ class ConnectionCloseError(ConnectionEvent):
         )
 
 
-class ConnectionCreateError(ConnectionEvent):
-    def __init__(self, exception: Exception):
+class ConnectionKeepalive(ConnectionEvent):
+    def __init__(self, connection: Optional[Connection]):
+        super().__init__(connection, "Pinging connection to keep it alive")
+
+
+class ConnectionKeepaliveError(ConnectionEvent):
+    def __init__(self, connection: Optional[Connection], exception: Exception):
         super().__init__(
-            None, str(SQLErrorEvent(exception, "Exception while trying to create connection"))
+            connection, str(SQLErrorEvent(exception, "Exception while trying to ping connection"))
         )
 
 
+class ConnectionCreateError(ConnectionEvent):
+    def __init__(self, exception: Exception, timings: Optional[ConnectionOpenTimings] = None):
+        message = "Exception while trying to create connection"
+        if timings:
+            message += f" ({timings})"
+        super().__init__(None, str(SQLErrorEvent(exception, message)))
+
+
 class ConnectionWrapperEvent(ABC):
     def __init__(self, description: str, message: str):
         self.message = message
@@ -117,5 +132,78 @@ class ConnectionRetrieve(ConnectionWrapperEvent):
 
 
 class ConnectionCreated(ConnectionWrapperEvent):
+    def __init__(self, description: str, timings: Optional[ConnectionOpenTimings] = None):
+        message = "Connection created"
+        if timings:
+            message += f" ({timings})"
+        super().__init__(description, message)
+
+
+class ConnectionOpenSummary:
+    def __init__(self, stats: ConnectionOpenStats):
+        self.stats = stats
+
+    def __str__(self) -> str:
+        stats = self.stats
+        return (
+            f"Opened {stats.opened} connections, {stats.failed} failed, slowest took "
+            f"{stats.max_elapsed:.2f}s. Totals: {stats.totals}"
+        )
+
+
+class ConnectionLeased(ConnectionWrapperEvent):
     def __init__(self, description: str):
-        super().__init__(description, "Connection created")
+        super().__init__(description, "Leased session from pool")
+
+
+class SessionPoolEvent(ABC):
+    def __init__(self, http_path: str, message: str):
+        self.http_path = http_path
+        self.message = message
+
+    def __str__(self) -> str:
+        return f"SessionPool(http-path={self.http_path}) - {self.message}"
+
+
+class SessionPoolIdleClose(SessionPoolEvent):
+    def __init__(self, http_path: str, session_id: Optional[str]):
+        super().__init__(http_path, f"Closing for idleness: session-id={session_id}")
+
+
+class SessionPoolPrewarm(SessionPoolEvent):
+    def __init__(self, http_path: str, session_count: int, elapsed: float):
+        super().__init__(http_path, f"Pre-warmed {session_count} sessions in {elapsed:.2f}s")
+
+
+class SessionPoolStats(SessionPoolEvent):
+    def __init__(
+        self, http_path: str, size: int, hits: int, misses: int, waits: int, wait_time: float
+    ):
+        super().__init__(
+            http_path,
+            f"Sessions: {size}, hits: {hits}, misses: {misses}, waits: {waits}, "
+            f"wait time: {wait_time:.2f}s",
+        )
+
+
+class CircuitBreakerEvent(ABC):
+    def __init__(self, http_path: str, message: str):
+        self.http_path = http_path
+        self.message = message
+
+    def __str__(self) -> str:
+        return f"CircuitBreaker(http-path={self.http_path}) - {self.message}"
+
+
+class CircuitBreakerOpen(CircuitBreakerEvent):
+    def __init__(self, http_path: str, failures: int, cooldown: float):
+        super().__init__(
+            http_path,
+            f"Opened after {failures} consecutive connection failures, failing fast for "
+            f"{cooldown:.0f}s",
+        )
+
+
+class CircuitBreakerClose(CircuitBreakerEvent):
+    def __init__(self, http_path: str):
+        super().__init__(http_path, "Closed after a successful connection")
@@ -1,4 +1,5 @@
 from dbt.adapters.databricks.events.base import ErrorEvent
+from dbt.adapters.databricks.metrics import TokenRefreshStats
 
 
 class CredentialLoadError(ErrorEvent):
@@ -17,3 +18,32 @@ class CredentialShardEvent:
 
     def __str__(self) -> str:
         return f"Password is {self.password_len} characters, sharding it"
+
+
+class TokenRefreshed:
+    def __init__(self, elapsed: float, background: bool):
+        self.elapsed = elapsed
+        self.background = background
+
+    def __str__(self) -> str:
+        where = "in the background" if self.background else "inline"
+        return f"Refreshed OAuth token {where} in {self.elapsed:.2f}s"
+
+
+class TokenRefreshError(ErrorEvent):
+    def __init__(self, exception: Exception):
+        super().__init__(exception, "Exception while trying to refresh OAuth token")
+
+
+class TokenRefreshSummary:
+    def __init__(self, stats: TokenRefreshStats):
+        self.stats = stats
+
+    def __str__(self) -> str:
+        stats = self.stats
+        average = stats.total_elapsed / max(stats.refreshed + stats.failed, 1)
+        return (
+            f"Refreshed OAuth tokens {stats.refreshed} times ({stats.background} in the "
+            f"background), {stats.failed} failed, average {average:.2f}s, slowest "
+            f"{stats.max_elapsed:.2f}s"
+        )
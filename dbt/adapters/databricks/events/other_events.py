@@ -4,3 +4,38 @@ from dbt.adapters.databricks.events.base import SQLErrorEvent
 class QueryError(SQLErrorEvent):
     def __init__(self, log_sql: str, exception: Exception):
         super().__init__(exception, f"Exception while trying to execute query\n{log_sql}\n")
+
+
+class QueryQueued:
+    def __init__(self, compute_name: str, queue_time: float):
+        self.compute_name = compute_name
+        self.queue_time = queue_time
+
+    def __str__(self) -> str:
+        compute = (
+            f"compute resource '{self.compute_name}'"
+            if self.compute_name
+            else "default compute resource"
+        )
+        return f"Query queued for {self.queue_time:.2f}s waiting for a slot on {compute}"
+
+
+class QueryRetry(SQLErrorEvent):
+    def __init__(self, reason: str, attempt: int, delay: float, exception: Exception):
+        super().__init__(
+            exception,
+            f"Retrying query after {reason} error (attempt {attempt}) in {delay:.2f}s",
+        )
+
+
+class ColumnCacheSummary:
+    def __init__(self, hits: int, misses: int, invalidations: int):
+        self.hits = hits
+        self.misses = misses
+        self.invalidations = invalidations
+
+    def __str__(self) -> str:
+        return (
+            f"Column cache saved {self.hits} of {self.hits + self.misses} describes, "
+            f"{self.invalidations} entries invalidated"
+        )
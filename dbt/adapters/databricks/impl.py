@@ -3,9 +3,11 @@ import re
 from abc import ABC
 from abc import abstractmethod
 from collections import defaultdict
+from concurrent.futures import as_completed
 from concurrent.futures import Future
 from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import partial
 from typing import Any
 from typing import Callable
 from typing import cast
@@ -41,8 +43,10 @@ from dbt.adapters.databricks.column import DatabricksColumn
 from dbt.adapters.databricks.connections import DatabricksConnectionManager
 from dbt.adapters.databricks.connections import DatabricksDBTConnection
 from dbt.adapters.databricks.connections import DatabricksSQLConnectionWrapper
+from dbt.adapters.databricks.connections import DEFAULT_FETCH_BATCH_SIZE
 from dbt.adapters.databricks.connections import ExtendedSessionConnectionManager
 from dbt.adapters.databricks.connections import USE_LONG_SESSIONS
+from dbt.adapters.databricks.logging import logger
 from dbt.adapters.databricks.python_submissions import (
     DbtDatabricksAllPurposeClusterPythonJobHelper,
 )
@@ -51,6 +55,7 @@ from dbt.adapters.databricks.python_submissions import (
 )
 from dbt.adapters.databricks.relation import DatabricksRelation
 from dbt.adapters.databricks.relation import DatabricksRelationType
+from dbt.adapters.databricks.relation import is_hive_metastore
 from dbt.adapters.databricks.relation import KEY_TABLE_PROVIDER
 from dbt.adapters.databricks.relation_configs.base import DatabricksRelationConfig
 from dbt.adapters.databricks.relation_configs.base import DatabricksRelationConfigBase
@@ -80,6 +85,7 @@ from dbt_common.utils.dict import AttrDict
 if TYPE_CHECKING:
     from agate import Row
     from agate import Table
+    from pyarrow import Table as ArrowTable
 
 CURRENT_CATALOG_MACRO_NAME = "current_catalog"
 USE_CATALOG_MACRO_NAME = "use_catalog"
@@ -88,6 +94,7 @@ SHOW_TABLE_EXTENDED_MACRO_NAME = "show_table_extended"
 SHOW_TABLES_MACRO_NAME = "show_tables"
 SHOW_VIEWS_MACRO_NAME = "show_views"
 GET_COLUMNS_COMMENTS_MACRO_NAME = "get_columns_comments"
+GET_UC_TABLES_FOR_SCHEMAS_MACRO_NAME = "get_uc_tables_for_schemas"
 
 
 @dataclass
@@ -228,6 +235,29 @@ class DatabricksAdapter(SparkAdapter):
             if staging_table is not None:
                 self.drop_relation(staging_table)
 
+    @available.parse(lambda *a, **k: [])
+    def execute_batches(
+        self, sql: str, batch_size: int = DEFAULT_FETCH_BATCH_SIZE
+    ) -> Iterator["Table"]:
+        """
+        Execute the query and iterate over its result as tables of at most `batch_size` rows.
+
+        Use instead of `run_query` for large results, which would otherwise be fetched into
+        memory all at once. The cursor stays open until the result is exhausted, a macro that
+        stops iterating early should call `close()` on it to release the cursor right away.
+        """
+        return self.connections.execute_batches(sql, batch_size)
+
+    @available.parse_none
+    def execute_arrow(self, sql: str, limit: Optional[int] = None) -> "ArrowTable":
+        """
+        Execute the query and return its result as a pyarrow Table.
+
+        Skips the conversion of every row to Python objects that `run_query` does, for macros
+        that only need a few columns or aggregates of a result.
+        """
+        return self.connections.execute_arrow(sql, limit)
+
     def list_relations_without_caching(  # type: ignore[override]
         self, schema_relation: DatabricksRelation
     ) -> List[DatabricksRelation]:
@@ -236,8 +266,15 @@ class DatabricksAdapter(SparkAdapter):
             lambda: self.get_relations_without_caching(schema_relation), empty
         )
 
+        return self._relations_from_rows(schema_relation, results)
+
+    def _relations_from_rows(
+        self,
+        schema_relation: BaseRelation,
+        rows: Iterable[Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]],
+    ) -> List[DatabricksRelation]:
         relations = []
-        for row in results:
+        for row in rows:
             name, kind, file_format, owner = row
             metadata = None
             if file_format:
@@ -254,6 +291,90 @@ class DatabricksAdapter(SparkAdapter):
 
         return relations
 
+    def _relations_cache_for_schemas(
+        self,
+        relation_configs: Iterable[RelationConfig],
+        cache_schemas: Optional[Set[BaseRelation]] = None,
+    ) -> None:
+        if not cache_schemas:
+            cache_schemas = self._get_cache_schemas(relation_configs)
+
+        # Unity Catalog schemas are listed with one query per catalog instead of one per
+        # schema, and hive_metastore schemas in one batch per thread. Catalogs whose query
+        # failed, and schemas without a name, go through the listing of the base adapter.
+        uc_schemas: Dict[str, List[BaseRelation]] = defaultdict(list)
+        hive_schemas: List[BaseRelation] = []
+        other_schemas: Set[BaseRelation] = set()
+        for schema_relation in cache_schemas:
+            if not schema_relation.schema:
+                other_schemas.add(schema_relation)
+            elif is_hive_metastore(schema_relation.database):
+                hive_schemas.append(schema_relation)
+            else:
+                uc_schemas[cast(str, schema_relation.database)].append(schema_relation)
+
+        listed_schemas: Set[Tuple[Optional[str], str]] = set()
+        with executor(self.config) as tpe:
+            futures: Dict[Future[Optional[List[DatabricksRelation]]], List[BaseRelation]] = {
+                tpe.submit_connected(
+                    self,
+                    f"list_{catalog}",
+                    self._list_uc_relations_for_schemas,
+                    catalog,
+                    schemas,
+                ): schemas
+                for catalog, schemas in uc_schemas.items()
+            }
+            batch_count = min(self.config.threads, len(hive_schemas))
+            for i in range(batch_count):
+                batch = hive_schemas[i::batch_count]
+                future = tpe.submit_connected(
+                    self, f"list_hive_metastore_{i}", self._list_hive_relations_for_schemas, batch
+                )
+                futures[future] = batch
+
+            for future in as_completed(futures):
+                relations = future.result()
+                if relations is None:
+                    other_schemas.update(futures[future])
+                    continue
+                for relation in relations:
+                    self.cache.add(relation)
+                listed_schemas.update(
+                    (schema.database, cast(str, schema.schema)) for schema in futures[future]
+                )
+
+        self.cache.update_schemas(listed_schemas)
+        if other_schemas:
+            super()._relations_cache_for_schemas(relation_configs, other_schemas)
+
+    def _list_uc_relations_for_schemas(
+        self, catalog: str, schemas: List[BaseRelation]
+    ) -> Optional[List[DatabricksRelation]]:
+        """List the relations of several schemas of a catalog with a single query, or return
+        None if the query failed."""
+
+        kwargs = {"database": catalog, "schemas": [schema.schema for schema in schemas]}
+        try:
+            results = self.execute_macro(GET_UC_TABLES_FOR_SCHEMAS_MACRO_NAME, kwargs=kwargs)
+        except DbtRuntimeError as e:
+            logger.debug(f"Falling back to listing the schemas of {catalog} one by one: {e}")
+            return None
+
+        rows_by_schema: Dict[
+            str, List[Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]]
+        ] = defaultdict(list)
+        for row in results:
+            rows_by_schema[row["table_schema"]].append(
+                (row["table_name"], row["table_type"], row["file_format"], row["table_owner"])
+            )
+
+        relations = []
+        for schema_relation in schemas:
+            rows = rows_by_schema.get(cast(str, schema_relation.schema), [])
+            relations.extend(self._relations_from_rows(schema_relation, rows))
+        return relations
+
     def get_relations_without_caching(
         self, relation: DatabricksRelation
     ) -> List[Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]]:
@@ -274,8 +395,54 @@ class DatabricksAdapter(SparkAdapter):
     def _get_hive_relations(
         self, relation: DatabricksRelation
     ) -> List[Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]]:
-        kwargs = {"relation": relation}
+        new_rows = self._get_hive_tables(relation)
 
+        # if there are any table types to be resolved
+        if any(not row[1] for row in new_rows):
+            with self._catalog(relation.database):
+                new_rows = self._resolve_hive_types(relation, new_rows)
+
+        return [(row[0], row[1], None, None) for row in new_rows]
+
+    def _list_hive_relations_for_schemas(
+        self, schemas: List[BaseRelation]
+    ) -> List[DatabricksRelation]:
+        """List the relations of several hive_metastore schemas.
+
+        The table types GetTables could not tell are resolved for all the schemas of a catalog
+        in one pass, so the catalog is switched at most once per catalog instead of once per
+        schema. A batch can mix schemas without a catalog and schemas of hive_metastore.
+        """
+
+        empty: List[Tuple[str, Optional[str]]] = []
+        tables = [
+            (schema, handle_missing_objects(partial(self._get_hive_tables, schema), empty))
+            for schema in schemas
+        ]
+
+        unresolved: Dict[Optional[str], List[BaseRelation]] = defaultdict(list)
+        for schema, rows in tables:
+            if any(not r[1] for r in rows):
+                unresolved[schema.database].append(schema)
+        if unresolved:
+            rows_by_schema = dict(tables)
+            for catalog, catalog_schemas in unresolved.items():
+                with self._catalog(catalog):
+                    for schema in catalog_schemas:
+                        rows_by_schema[schema] = handle_missing_objects(
+                            partial(self._resolve_hive_types, schema, rows_by_schema[schema]),
+                            empty,
+                        )
+            tables = [(schema, rows_by_schema[schema]) for schema, _ in tables]
+
+        relations = []
+        for schema, rows in tables:
+            relations.extend(
+                self._relations_from_rows(schema, [(row[0], row[1], None, None) for row in rows])
+            )
+        return relations
+
+    def _get_hive_tables(self, relation: BaseRelation) -> List[Tuple[str, Optional[str]]]:
         new_rows: List[Tuple[str, Optional[str]]]
         if all([relation.database, relation.schema]):
             tables = self.connections.list_tables(
@@ -291,20 +458,22 @@ class DatabricksAdapter(SparkAdapter):
                 new_rows.append(row)
 
         else:
+            kwargs = {"relation": relation}
             tables = self.execute_macro(SHOW_TABLES_MACRO_NAME, kwargs=kwargs)
             new_rows = [(row["tableName"], None) for row in tables]
 
-        # if there are any table types to be resolved
-        if any(not row[1] for row in new_rows):
-            with self._catalog(relation.database):
-                views = self.execute_macro(SHOW_VIEWS_MACRO_NAME, kwargs=kwargs)
-                view_names = set(views.columns["viewName"].values())  # type: ignore[attr-defined]
-                new_rows = [
-                    (row[0], str(RelationType.View if row[0] in view_names else RelationType.Table))
-                    for row in new_rows
-                ]
+        return new_rows
 
-        return [(row[0], row[1], None, None) for row in new_rows]
+    def _resolve_hive_types(
+        self, relation: BaseRelation, rows: List[Tuple[str, Optional[str]]]
+    ) -> List[Tuple[str, Optional[str]]]:
+        kwargs = {"relation": relation}
+        views = self.execute_macro(SHOW_VIEWS_MACRO_NAME, kwargs=kwargs)
+        view_names = set(views.columns["viewName"].values())  # type: ignore[attr-defined]
+        return [
+            (row[0], str(RelationType.View if row[0] in view_names else RelationType.Table))
+            for row in rows
+        ]
 
     def get_relation(
         self,
@@ -357,18 +526,28 @@ class DatabricksAdapter(SparkAdapter):
     def get_columns_in_relation(  # type: ignore[override]
         self, relation: DatabricksRelation
     ) -> List[DatabricksColumn]:
-        rows = list(
-            handle_missing_objects(
-                lambda: self.execute_macro(
-                    GET_COLUMNS_COMMENTS_MACRO_NAME, kwargs={"relation": relation}
-                ),
-                AttrDict(),
-            )
+        # DESCRIBE TABLE EXTENDED starts with the same rows as DESCRIBE TABLE, so the columns
+        # of a relation already described that way are read from that result
+        return self.connections.column_cache.get(
+            relation.render(),
+            lambda: self._get_columns_comments(relation),
+            from_described=self._columns_from_describe,
         )
 
+    def _get_columns_comments(self, relation: DatabricksRelation) -> List[DatabricksColumn]:
+        rows = handle_missing_objects(
+            lambda: self.execute_macro(
+                GET_COLUMNS_COMMENTS_MACRO_NAME, kwargs={"relation": relation}
+            ),
+            AttrDict(),
+        )
+        return self._columns_from_describe(rows)
+
+    @staticmethod
+    def _columns_from_describe(rows: Iterable[Any]) -> List[DatabricksColumn]:
         columns = []
         for row in rows:
-            if row["col_name"].startswith("#"):
+            if not row["col_name"] or row["col_name"].startswith("#"):
                 break
             columns.append(
                 DatabricksColumn(
@@ -383,9 +562,11 @@ class DatabricksAdapter(SparkAdapter):
     ) -> Tuple[DatabricksRelation, List[DatabricksColumn]]:
         rows = list(
             handle_missing_objects(
-                lambda: self.execute_macro(
-                    GET_COLUMNS_IN_RELATION_RAW_MACRO_NAME,
-                    kwargs={"relation": relation},
+                lambda: self.connections.column_cache.get_described(
+                    relation.render(),
+                    lambda: self.execute_macro(
+                        GET_COLUMNS_IN_RELATION_RAW_MACRO_NAME, kwargs={"relation": relation}
+                    ),
                 ),
                 AttrDict(),
             )
@@ -406,6 +587,15 @@ class DatabricksAdapter(SparkAdapter):
             columns,
         )
 
+    def describe_extended(self, relation: DatabricksRelation) -> "Table":
+        """Run DESCRIBE TABLE EXTENDED on the relation, unless its result is still cached."""
+        return self.connections.column_cache.get_described(
+            relation.render(),
+            lambda: self.execute_macro(
+                DESCRIBE_TABLE_EXTENDED_MACRO_NAME, kwargs={"table_name": relation}
+            ),
+        )
+
     def _set_relation_information(self, relation: DatabricksRelation) -> DatabricksRelation:
         """Update the information of the relation, or return it if it already exists."""
         if relation.has_information():
@@ -583,6 +773,11 @@ class DatabricksAdapter(SparkAdapter):
             cursor.close()
             conn.transaction_open = False
 
+    def generate_python_submission_response(self, submission_result: Any) -> AdapterResponse:
+        # A python model can change the schema of any table it writes to
+        self.connections.column_cache.clear()
+        return super().generate_python_submission_response(submission_result)
+
     def valid_incremental_strategies(self) -> List[str]:
         return ["append", "merge", "insert_overwrite", "replace_where"]
 
@@ -608,7 +803,10 @@ class DatabricksAdapter(SparkAdapter):
         current_catalog: Optional[str] = None
         try:
             if catalog is not None:
-                current_catalog = self.execute_macro(CURRENT_CATALOG_MACRO_NAME)[0][0]
+                current_catalog = self.connections.get_current_catalog()
+                if current_catalog is None:
+                    current_catalog = self.execute_macro(CURRENT_CATALOG_MACRO_NAME)[0][0]
+                    self.connections.set_current_catalog(current_catalog)
                 if current_catalog is not None:
                     if current_catalog != catalog:
                         self.execute_macro(USE_CATALOG_MACRO_NAME, kwargs=dict(catalog=catalog))
@@ -736,11 +934,8 @@ class MaterializedViewAPI(DeltaLiveTableAPIBase[MaterializedViewConfig]):
     def _describe_relation(
         cls, adapter: DatabricksAdapter, relation: DatabricksRelation
     ) -> RelationResults:
-        kwargs = {"table_name": relation}
         results: RelationResults = dict()
-        results["describe_extended"] = adapter.execute_macro(
-            DESCRIBE_TABLE_EXTENDED_MACRO_NAME, kwargs=kwargs
-        )
+        results["describe_extended"] = adapter.describe_extended(relation)
 
         kwargs = {"relation": relation}
         results["information_schema.views"] = cls._get_information_schema_views(adapter, kwargs)
@@ -763,11 +958,8 @@ class StreamingTableAPI(DeltaLiveTableAPIBase[StreamingTableConfig]):
     def _describe_relation(
         cls, adapter: DatabricksAdapter, relation: DatabricksRelation
     ) -> RelationResults:
-        kwargs = {"table_name": relation}
         results: RelationResults = dict()
-        results["describe_extended"] = adapter.execute_macro(
-            DESCRIBE_TABLE_EXTENDED_MACRO_NAME, kwargs=kwargs
-        )
+        results["describe_extended"] = adapter.describe_extended(relation)
 
         kwargs = {"relation": relation}
 
@@ -0,0 +1,281 @@
+import json
+import os
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+from typing import DefaultDict
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# Where to write query metrics at the end of the run. A path ending in .json gets a JSON
+# summary, anything else an OpenMetrics textfile. Unset disables the export.
+QUERY_METRICS_PATH = os.getenv("DBT_DATABRICKS_QUERY_METRICS_PATH")
+
+# Upper bounds, in seconds, of the query latency histogram buckets.
+LATENCY_BUCKETS: Tuple[float, ...] = (0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 300, 900, 1800)
+
+LEADING_COMMENTS_REGEX = re.compile(r"^(\s*(/\*.*?\*/|--[^\n]*(\n|$)))*\s*", re.DOTALL)
+
+STATEMENT_KINDS = {
+    "create": "ddl",
+    "alter": "ddl",
+    "drop": "ddl",
+    "replace": "ddl",
+    "truncate": "ddl",
+    "comment": "ddl",
+    "merge": "merge",
+    "insert": "dml",
+    "update": "dml",
+    "delete": "dml",
+    "copy": "dml",
+    "select": "query",
+    "with": "query",
+    "show": "metadata",
+    "describe": "metadata",
+    "desc": "metadata",
+    "list": "metadata",
+    "set": "metadata",
+    "use": "metadata",
+}
+
+
+def get_statement_kind(sql: str) -> str:
+    """Classify a statement by its first keyword, ignoring leading comments."""
+
+    sql = LEADING_COMMENTS_REGEX.sub("", sql, count=1)
+    keyword = sql.split(None, 1)[0].lower() if sql.strip() else ""
+    return STATEMENT_KINDS.get(keyword, "other")
+
+
+class LatencyHistogram:
+    """Cumulative histogram of query latencies, in seconds."""
+
+    def __init__(self) -> None:
+        self.bucket_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, elapsed: float) -> None:
+        self.bucket_counts[bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+        self.count += 1
+        self.sum += elapsed
+
+    def cumulative_buckets(self) -> List[Tuple[str, int]]:
+        buckets = []
+        total = 0
+        for bound, count in zip([*map(str, LATENCY_BUCKETS), "+Inf"], self.bucket_counts):
+            total += count
+            buckets.append((bound, total))
+        return buckets
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "buckets": dict(self.cumulative_buckets()),
+        }
+
+
+class QueryMetrics:
+    """Latency histograms and counters for the queries run by a connection manager."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.compute_latency: DefaultDict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self.node_latency: DefaultDict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self.statement_counts: DefaultDict[Tuple[str, str], int] = defaultdict(int)
+        self.error_counts: DefaultDict[Tuple[str, str], int] = defaultdict(int)
+        self.retry_counts: DefaultDict[Tuple[str, str], int] = defaultdict(int)
+        # Most cursors open at once on a single session of each compute
+        self.peak_live_cursors: DefaultDict[str, int] = defaultdict(int)
+
+    def record(
+        self,
+        kind: str,
+        elapsed: float,
+        *,
+        compute_name: Optional[str] = None,
+        node_id: Optional[str] = None,
+        error: bool = False,
+    ) -> None:
+        compute = compute_name or "default"
+        with self._lock:
+            self.compute_latency[compute].observe(elapsed)
+            if node_id:
+                self.node_latency[node_id].observe(elapsed)
+            self.statement_counts[(compute, kind)] += 1
+            if error:
+                self.error_counts[(compute, kind)] += 1
+
+    def record_retry(self, kind: str, reason: str, *, compute_name: Optional[str] = None) -> None:
+        with self._lock:
+            self.retry_counts[(compute_name or "default", f"{kind}:{reason}")] += 1
+
+    def record_live_cursors(self, count: int, *, compute_name: Optional[str] = None) -> None:
+        compute = compute_name or "default"
+        with self._lock:
+            self.peak_live_cursors[compute] = max(self.peak_live_cursors[compute], count)
+
+    def is_empty(self) -> bool:
+        return not self.statement_counts
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "compute_latency_seconds": {
+                    compute: histogram.to_dict()
+                    for compute, histogram in sorted(self.compute_latency.items())
+                },
+                "node_latency_seconds": {
+                    node_id: histogram.to_dict()
+                    for node_id, histogram in sorted(self.node_latency.items())
+                },
+                "statements": _counts_to_dict(self.statement_counts),
+                "errors": _counts_to_dict(self.error_counts),
+                "retries": _counts_to_dict(self.retry_counts),
+                "peak_live_cursors": dict(sorted(self.peak_live_cursors.items())),
+            }
+
+    def to_openmetrics(self) -> str:
+        lines: List[str] = []
+        with self._lock:
+            for name, label, histograms in (
+                ("dbt_databricks_compute_query_latency_seconds", "compute", self.compute_latency),
+                ("dbt_databricks_node_query_latency_seconds", "node", self.node_latency),
+            ):
+                lines.append(f"# TYPE {name} histogram")
+                for key, histogram in sorted(histograms.items()):
+                    labels = f'{label}="{_escape_label(key)}"'
+                    for bound, count in histogram.cumulative_buckets():
+                        lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+                    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+                    lines.append(f"{name}_sum{{{labels}}} {histogram.sum}")
+
+            for name, counts in (
+                ("dbt_databricks_queries", self.statement_counts),
+                ("dbt_databricks_query_errors", self.error_counts),
+            ):
+                lines.append(f"# TYPE {name} counter")
+                for (compute, kind), count in sorted(counts.items()):
+                    labels = f'compute="{_escape_label(compute)}",kind="{kind}"'
+                    lines.append(f"{name}_total{{{labels}}} {count}")
+
+            name = "dbt_databricks_query_retries"
+            lines.append(f"# TYPE {name} counter")
+            for (compute, kind_reason), count in sorted(self.retry_counts.items()):
+                kind, reason = kind_reason.split(":", 1)
+                labels = f'compute="{_escape_label(compute)}",kind="{kind}",reason="{reason}"'
+                lines.append(f"{name}_total{{{labels}}} {count}")
+
+            name = "dbt_databricks_peak_live_cursors"
+            lines.append(f"# TYPE {name} gauge")
+            for compute, count in sorted(self.peak_live_cursors.items()):
+                lines.append(f'{name}{{compute="{_escape_label(compute)}"}} {count}')
+
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def export(self, path: str) -> None:
+        """Write the metrics to path, as JSON if it ends in .json and OpenMetrics otherwise."""
+
+        if path.endswith(".json"):
+            content = json.dumps(self.to_dict(), indent=2)
+        else:
+            content = self.to_openmetrics()
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            f.write(content)
+        os.replace(temp_path, path)
+
+
+def _counts_to_dict(counts: Dict[Tuple[str, str], int]) -> Dict[str, Dict[str, int]]:
+    result: DefaultDict[str, Dict[str, int]] = defaultdict(dict)
+    for (compute, kind), count in sorted(counts.items()):
+        result[compute][kind] = count
+    return dict(result)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+@dataclass
+class ConnectionOpenTimings:
+    """Time spent in each phase of opening a connection, in seconds."""
+
+    authenticate: float = 0.0
+    token: float = 0.0
+    connect: float = 0.0
+    backoff: float = 0.0
+    attempts: int = 0
+    # Set once the connection is open, tokens fetched after that are not part of opening it.
+    done: bool = False
+
+    def __str__(self) -> str:
+        return (
+            f"authenticate={self.authenticate:.2f}s, token={self.token:.2f}s, "
+            f"connect={self.connect:.2f}s, backoff={self.backoff:.2f}s, attempts={self.attempts}"
+        )
+
+
+class ConnectionOpenStats:
+    """Aggregate of the timings of all the connections opened by the process."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.opened = 0
+        self.failed = 0
+        self.totals = ConnectionOpenTimings()
+        self.max_elapsed = 0.0
+
+    def record(self, timings: ConnectionOpenTimings, failed: bool = False) -> None:
+        with self._lock:
+            if failed:
+                self.failed += 1
+            else:
+                self.opened += 1
+            self.totals.authenticate += timings.authenticate
+            self.totals.token += timings.token
+            self.totals.connect += timings.connect
+            self.totals.backoff += timings.backoff
+            self.totals.attempts += timings.attempts
+            self.max_elapsed = max(
+                self.max_elapsed,
+                timings.authenticate + timings.token + timings.connect + timings.backoff,
+            )
+
+    def is_empty(self) -> bool:
+        return self.opened == 0 and self.failed == 0
+
+
+class TokenRefreshStats:
+    """Aggregate latency of the OAuth token refreshes done by the process."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.refreshed = 0
+        self.failed = 0
+        self.background = 0
+        self.total_elapsed = 0.0
+        self.max_elapsed = 0.0
+
+    def record(self, elapsed: float, *, background: bool = False, failed: bool = False) -> None:
+        with self._lock:
+            if failed:
+                self.failed += 1
+            else:
+                self.refreshed += 1
+                if background:
+                    self.background += 1
+            self.total_elapsed += elapsed
+            self.max_elapsed = max(self.max_elapsed, elapsed)
+
+    def is_empty(self) -> bool:
+        return self.refreshed == 0 and self.failed == 0
@@ -0,0 +1,91 @@
+import errno
+import hashlib
+import os
+import sys
+from contextlib import contextmanager
+from typing import Iterator
+from typing import Optional
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+# Directory of the file-backed OAuth token cache. When set, tokens are stored there instead of
+# the system keyring, and shared by every dbt process using the same directory.
+TOKEN_CACHE_DIR = os.getenv("DBT_DATABRICKS_TOKEN_CACHE_DIR")
+
+
+class FileTokenCache:
+    """Store OAuth tokens as files in a directory, one per key.
+
+    Writes are atomic, and lock() takes an exclusive lock on the key across processes, so
+    that concurrent invocations check, refresh and save a token one at a time instead of
+    all refreshing it at once.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = os.path.expanduser(directory)
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        self._ensure_directory()
+        fd = os.open(f"{self._path(key)}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            _lock_file(fd)
+            try:
+                yield
+            finally:
+                if sys.platform == "win32":
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+                else:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            with open(self._path(key)) as f:
+                return f.read() or None
+        except FileNotFoundError:
+            return None
+
+    def set(self, key: str, value: str) -> None:
+        self._ensure_directory()
+        path = self._path(key)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(value)
+        os.replace(temp_path, path)
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(key.encode()).hexdigest() + ".json")
+
+    def _ensure_directory(self) -> None:
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+
+
+def _lock_file(fd: int) -> None:
+    if sys.platform == "win32":
+        # LK_LOCK gives up after trying for about 10 seconds, while another process may hold
+        # the lock for as long as the user takes to log in through the browser. Wait like flock.
+        while True:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return
+            except OSError as e:
+                if e.errno != errno.EDEADLOCK:
+                    raise
+    else:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+
+def get_token_cache() -> Optional[FileTokenCache]:
+    return FileTokenCache(TOKEN_CACHE_DIR) if TOKEN_CACHE_DIR else None
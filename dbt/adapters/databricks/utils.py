@@ -1,13 +1,21 @@
 import functools
 import inspect
+import json
+import os
 import re
+import time
+from threading import Lock
 from typing import Any
 from typing import Callable
+from typing import Dict
+from typing import Generic
+from typing import Optional
 from typing import Type
 from typing import TYPE_CHECKING
 from typing import TypeVar
 
 from dbt.adapters.base import BaseAdapter
+from dbt.adapters.databricks.logging import logger
 from jinja2 import Undefined
 
 if TYPE_CHECKING:
@@ -16,6 +24,7 @@ if TYPE_CHECKING:
 
 
 A = TypeVar("A", bound=BaseAdapter)
+T = TypeVar("T")
 
 
 CREDENTIAL_IN_COPY_INTO_REGEX = re.compile(
@@ -24,6 +33,9 @@ CREDENTIAL_IN_COPY_INTO_REGEX = re.compile(
 
 
 def redact_credentials(sql: str) -> str:
+    # The regex is slow on large generated statements, so skip it unless it can match
+    if "credential" not in sql:
+        return sql
     redacted = _redact_credentials_in_copy_into(sql)
     return redacted
 
@@ -92,3 +104,113 @@ def get_first_row(results: "Table") -> "Row":
 
         return Row(values=set())
     return results.rows[0]
+
+
+def get_cache_ttl(env_var: str) -> Optional[float]:
+    """Read the TTL, in seconds, of an on-disk cache from the environment.
+
+    Unset disables the on-disk cache, as does an invalid value after a warning.
+    """
+
+    value = os.getenv(env_var)
+    if not value:
+        return None
+    try:
+        ttl = float(value)
+    except ValueError:
+        ttl = -1
+    if ttl < 0:
+        logger.warning(
+            f"{value} is not a valid value for {env_var}, it must be a non-negative number of "
+            "seconds. Not caching on disk."
+        )
+        return None
+    return ttl
+
+
+class TtlFileCache(Generic[T]):
+    """Cache values by key for the lifetime of the process, loading each one at most once.
+
+    If a TTL is given, values are also persisted to a JSON file and reused by later invocations
+    until they are older than the TTL. Subclasses convert values to and from JSON.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: Optional[float] = None):
+        self.path = path
+        self.ttl = ttl
+        self._values: Dict[str, T] = {}
+        # Guards the dicts and the file, loads only hold the lock of their key so that a slow
+        # lookup does not block lookups of other keys
+        self._lock = Lock()
+        self._key_locks: Dict[str, Lock] = {}
+
+    def get(self, key: str, load: Callable[[], T]) -> T:
+        """Get the cached value for the key, calling load to look it up if missing."""
+
+        with self._lock:
+            value = self._values.get(key)
+            if value is not None:
+                return value
+            key_lock = self._key_locks.setdefault(key, Lock())
+
+        with key_lock:
+            with self._lock:
+                value = self._values.get(key)
+                if value is None:
+                    value = self._read(key)
+                    if value is not None:
+                        self._values[key] = value
+            if value is not None:
+                return value
+
+            value = load()
+            with self._lock:
+                self._write(key, value)
+                self._values[key] = value
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def _to_json(self, value: T) -> Any:
+        return value
+
+    def _from_json(self, raw: Any) -> T:
+        return raw
+
+    def _read(self, key: str) -> Optional[T]:
+        entry = self._read_file().get(key)
+        if not isinstance(entry, dict) or self.ttl is None:
+            return None
+        try:
+            if time.time() - float(entry["fetched_at"]) > self.ttl:
+                return None
+            return self._from_json(entry["value"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def _write(self, key: str, value: T) -> None:
+        if not self.path or self.ttl is None:
+            return
+
+        entries = self._read_file()
+        entries[key] = {"value": self._to_json(value), "fetched_at": time.time()}
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(temp_path, "w") as f:
+                json.dump(entries, f)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logger.debug(f"Unable to write cache {self.path}: {e}")
+
+    def _read_file(self) -> Dict[str, Any]:
+        if not self.path or self.ttl is None:
+            return {}
+        try:
+            with open(self.path) as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
@@ -103,4 +103,24 @@
   {% endcall %}
 
   {% do return(load_result('get_uc_tables').table) %}
-{% endmacro %}
\ No newline at end of file
+{% endmacro %}
+
+{% macro get_uc_tables_for_schemas(database, schemas) %}
+  {% call statement('get_uc_tables_for_schemas', fetch_result=True) -%}
+    select
+      table_schema,
+      table_name,
+      if(table_type in ('EXTERNAL', 'MANAGED', 'MANAGED_SHALLOW_CLONE'), 'table', lower(table_type)) as table_type,
+      lower(data_source_format) as file_format,
+      table_owner
+    from `system`.`information_schema`.`tables`
+    where table_catalog = '{{ database }}'
+      and table_schema in (
+        {%- for schema in schemas -%}
+          '{{ schema }}'{%- if not loop.last %}, {% endif -%}
+        {%- endfor -%}
+      )
+  {% endcall %}
+
+  {% do return(load_result('get_uc_tables_for_schemas').table) %}
+{% endmacro %}
@@ -1,6 +1,8 @@
 from dbt.adapters.databricks.events.connection_events import ConnectionAcquire
 from dbt.adapters.databricks.events.connection_events import ConnectionCloseError
+from dbt.adapters.databricks.events.connection_events import ConnectionCreated
 from dbt.adapters.databricks.events.connection_events import ConnectionEvent
+from dbt.adapters.databricks.metrics import ConnectionOpenTimings
 from mock import Mock
 
 
@@ -69,3 +71,17 @@ class TestConnectionAcquire:
             == "Connection - Acquired connection on thread (0, 0), using compute resource 'Eniac'"
             " for model 'MyModel'"
         )
+
+
+class TestConnectionCreated:
+    def test_connection_created__no_timings(self):
+        assert str(ConnectionCreated("Connection")) == "Connection - Connection created"
+
+    def test_connection_created__with_timings(self):
+        timings = ConnectionOpenTimings(
+            authenticate=0.5, token=0.25, connect=1.5, backoff=1, attempts=2
+        )
+        assert str(ConnectionCreated("Connection", timings)) == (
+            "Connection - Connection created (authenticate=0.50s, token=0.25s, connect=1.50s,"
+            " backoff=1.00s, attempts=2)"
+        )
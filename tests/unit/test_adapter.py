@@ -7,6 +7,7 @@ import dbt.flags as flags
 import mock
 import pytest
 from agate import Row
+from agate import Table
 from dbt.adapters.databricks import __version__
 from dbt.adapters.databricks import DatabricksAdapter
 from dbt.adapters.databricks import DatabricksRelation
@@ -18,7 +19,9 @@ from dbt.adapters.databricks.impl import check_not_found_error
 from dbt.adapters.databricks.impl import get_identifier_list_string
 from dbt.adapters.databricks.relation import DatabricksRelationType
 from dbt.config import RuntimeConfig
+from dbt_common.context import set_invocation_context
 from dbt_common.exceptions import DbtConfigError
+from dbt_common.exceptions import DbtRuntimeError
 from dbt_common.exceptions import DbtValidationError
 from mock import Mock
 from tests.unit.utils import config_from_parts_or_dicts
@@ -1024,3 +1027,144 @@ class TestGetPersistDocColumns(DatabricksAdapterBase):
             "col1": {"name": "col1", "description": "comment2"},
         }
         assert adapter.get_persist_doc_columns(existing, column_dict) == expected
+
+
+class TestRelationsCacheWarmup(DatabricksAdapterBase):
+    @pytest.fixture
+    def adapter(self, setUp) -> DatabricksAdapter:
+        set_invocation_context({})
+        return DatabricksAdapter(self._get_config(), get_context("spawn"))
+
+    @staticmethod
+    def schema(name, database="main") -> DatabricksRelation:
+        return DatabricksRelation.create(database=database, schema=name)
+
+    @staticmethod
+    def row(schema, name, table_type="table", file_format="delta"):
+        return {
+            "table_schema": schema,
+            "table_name": name,
+            "table_type": table_type,
+            "file_format": file_format,
+            "table_owner": "owner",
+        }
+
+    def test_uc_schemas__one_query_per_catalog(self, adapter):
+        schemas = {self.schema("a"), self.schema("b"), self.schema("c"), self.schema("d", "other")}
+        with mock.patch.object(DatabricksAdapter, "execute_macro") as execute_macro:
+            execute_macro.side_effect = lambda name, kwargs: (
+                [self.row("a", "t1"), self.row("a", "v1", "view", None), self.row("b", "t2")]
+                if kwargs["database"] == "main"
+                else [self.row("d", "t3")]
+            )
+            adapter._relations_cache_for_schemas([], schemas)
+
+        assert execute_macro.call_count == 2
+        kwargs = {}
+        for call in execute_macro.call_args_list:
+            kwargs[call.kwargs["kwargs"]["database"]] = call.kwargs["kwargs"]["schemas"]
+        assert sorted(kwargs["main"]) == ["a", "b", "c"]
+        assert kwargs["other"] == ["d"]
+
+        relations = {(r.schema, r.identifier): r for r in adapter.cache.get_relations("main", "a")}
+        assert relations[("a", "t1")].is_delta
+        assert relations[("a", "v1")].type == DatabricksRelationType.View
+        assert len(adapter.cache.get_relations("other", "d")) == 1
+        assert ("main", "c") in adapter.cache.schemas
+
+    def test_uc_schemas__falls_back_on_error(self, adapter):
+        schemas = {self.schema("a"), self.schema("b")}
+        with mock.patch.object(
+            DatabricksAdapter, "execute_macro", side_effect=DbtRuntimeError("no access")
+        ), mock.patch.object(
+            DatabricksAdapter, "list_relations_without_caching", return_value=[]
+        ) as list_relations:
+            adapter._relations_cache_for_schemas([], schemas)
+
+        assert {call.args[0].schema for call in list_relations.call_args_list} == {"a", "b"}
+        assert {("main", "a"), ("main", "b")} <= adapter.cache.schemas
+
+    def test_hive_schemas__one_catalog_switch_per_batch(self, adapter):
+        schemas = {self.schema("a", "hive_metastore"), self.schema("b", "hive_metastore")}
+        tables = {
+            "a": [{"TABLE_NAME": "t1", "TABLE_TYPE": ""}, {"TABLE_NAME": "v1", "TABLE_TYPE": ""}],
+            "b": [{"TABLE_NAME": "t2", "TABLE_TYPE": ""}],
+        }
+
+        def execute_macro(name, kwargs=None):
+            if name == "current_catalog":
+                return [["main"]]
+            if name == "show_views":
+                views = ["v1"] if kwargs["relation"].schema == "a" else []
+                return Table([[view] for view in views], ["viewName"])
+
+        with mock.patch.object(
+            DatabricksAdapter, "execute_macro", side_effect=execute_macro
+        ) as mocked, mock.patch.object(
+            adapter.connections, "list_tables", side_effect=lambda database, schema: tables[schema]
+        ):
+            adapter._relations_cache_for_schemas([], schemas)
+
+        names = [call.args[0] for call in mocked.call_args_list]
+        assert names.count("current_catalog") == 1
+        assert names.count("use_catalog") == 2
+        assert names.count("show_views") == 2
+
+        types = {
+            r.identifier: r.type
+            for schema in ("a", "b")
+            for r in adapter.cache.get_relations("hive_metastore", schema)
+        }
+        assert types == {
+            "t1": DatabricksRelationType.Table,
+            "v1": DatabricksRelationType.View,
+            "t2": DatabricksRelationType.Table,
+        }
+
+    def test_hive_schemas__batch_mixing_catalogs(self, adapter):
+        schemas = [self.schema("a", None), self.schema("b", "hive_metastore")]
+        calls = []
+
+        def execute_macro(name, kwargs=None):
+            calls.append((name, kwargs.get("catalog") if name == "use_catalog" else None))
+            if name == "current_catalog":
+                return [["main"]]
+            if name == "show_tables":
+                return [{"tableName": "t1"}]
+            if name == "show_views":
+                return Table([], ["viewName"])
+
+        with mock.patch.object(
+            DatabricksAdapter, "execute_macro", side_effect=execute_macro
+        ), mock.patch.object(
+            adapter.connections,
+            "list_tables",
+            return_value=[{"TABLE_NAME": "t2", "TABLE_TYPE": ""}],
+        ), mock.patch.object(
+            adapter.connections, "get_current_catalog", return_value=None
+        ), mock.patch.object(
+            adapter.connections, "set_current_catalog"
+        ):
+            relations = adapter._list_hive_relations_for_schemas(schemas)
+
+        # The schema without a catalog is not resolved in hive_metastore
+        assert calls[1:] == [
+            ("show_views", None),
+            ("current_catalog", None),
+            ("use_catalog", "hive_metastore"),
+            ("show_views", None),
+            ("use_catalog", "main"),
+        ]
+        assert {r.identifier for r in relations} == {"t1", "t2"}
+
+    def test_hive_schemas__resolved_types_skip_show_views(self, adapter):
+        schemas = {self.schema("a", "hive_metastore")}
+        with mock.patch.object(DatabricksAdapter, "execute_macro") as mocked, mock.patch.object(
+            adapter.connections,
+            "list_tables",
+            return_value=[{"TABLE_NAME": "t1", "TABLE_TYPE": "TABLE"}],
+        ):
+            adapter._relations_cache_for_schemas([], schemas)
+
+        mocked.assert_not_called()
+        assert ("hive_metastore", "a") in adapter.cache.schemas
@@ -1,5 +1,8 @@
+import threading
+
 import keyring.backend
 import pytest
+from mock import patch
 
 from dbt.adapters.databricks.credentials import DatabricksCredentials
 
@@ -81,6 +84,46 @@ class TestTokenAuth:
         assert headers == headers2
 
 
+class TestAuthenticateFastPath:
+    def creds(self):
+        return DatabricksCredentials(
+            host="my.cloud.databricks.com",
+            token="foo",
+            database="andre",
+            http_path="http://foo",
+            schema="dbt",
+        )
+
+    def test_authenticate__resolves_once(self):
+        creds = self.creds()
+        with patch.object(creds, "validate_creds", wraps=creds.validate_creds) as validate:
+            provider = creds.authenticate(None)
+            assert creds.authenticate(None) is provider
+            assert creds.authenticate(provider) is provider
+
+        validate.assert_called_once()
+
+    def test_authenticate__concurrent_threads_share_provider(self):
+        creds = self.creds()
+        providers = []
+
+        def run():
+            providers.append(creds.authenticate(None))
+
+        threads = [threading.Thread(target=run) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(provider) for provider in providers}) == 1
+
+    def test_authenticate__not_serialized(self):
+        creds = self.creds()
+        creds.authenticate(None)
+        assert "_resolved_provider" not in creds.to_dict()
+
+
 class TestShardedPassword:
     def test_store_and_delete_short_password(self):
         # set the keyring to mock class
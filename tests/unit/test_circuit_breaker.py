@@ -0,0 +1,143 @@
+import time
+
+import pytest
+from dbt.adapters.contracts.connection import Connection
+from dbt.adapters.databricks import connections
+from dbt.adapters.databricks.connections import DatabricksCircuitBreaker
+from dbt.adapters.databricks.connections import DatabricksConnectionManager
+from dbt.adapters.databricks.connections import get_circuit_breaker
+from dbt.adapters.databricks.credentials import DatabricksCredentials
+from dbt_common.exceptions import DbtRuntimeError
+from mock import patch
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+
+class TestDatabricksCircuitBreaker:
+    @pytest.fixture
+    def breaker(self):
+        return DatabricksCircuitBreaker("path", threshold=2, cooldown=60)
+
+    def test_opens_after_threshold(self, breaker):
+        breaker.record_failure()
+        breaker.before_attempt()
+        breaker.record_failure()
+
+        assert breaker.is_open
+        with pytest.raises(DbtRuntimeError, match="2 consecutive connection attempts failed"):
+            breaker.before_attempt()
+
+    def test_success_resets_failures(self, breaker):
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert not breaker.is_open
+
+    def test_probe_after_cooldown(self, breaker):
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.opened_at = time.time() - 61
+
+        breaker.before_attempt()
+        with pytest.raises(DbtRuntimeError, match="a retry is in progress"):
+            breaker.before_attempt()
+
+        breaker.record_success()
+        assert not breaker.is_open
+        breaker.before_attempt()
+
+    def test_failed_probe_reopens(self, breaker):
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.opened_at = time.time() - 61
+
+        breaker.before_attempt()
+        breaker.record_failure()
+        with pytest.raises(DbtRuntimeError, match="retrying in 60s"):
+            breaker.before_attempt()
+
+    def test_aborted_probe_allows_another(self, breaker):
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.opened_at = time.time() - 61
+
+        breaker.before_attempt()
+        breaker.abort_attempt()
+        breaker.before_attempt()
+
+    def test_disabled(self):
+        breaker = DatabricksCircuitBreaker("path", threshold=0, cooldown=60)
+        for _ in range(10):
+            breaker.record_failure()
+        breaker.before_attempt()
+
+
+class TestGetCircuitBreaker:
+    @pytest.fixture(autouse=True)
+    def clear_breakers(self):
+        connections._circuit_breakers.clear()
+        yield
+        connections._circuit_breakers.clear()
+
+    def test_shared_per_http_path(self):
+        creds = DatabricksCredentials()
+        assert get_circuit_breaker("path", None, creds) is get_circuit_breaker("path", "foo", creds)
+        assert get_circuit_breaker("path", None, creds) is not get_circuit_breaker(
+            "other", None, creds
+        )
+
+    def test_separate_per_settings(self):
+        creds = DatabricksCredentials(compute={"foo": {"connect_circuit_breaker_threshold": 1}})
+        assert get_circuit_breaker("path", None, creds) is not get_circuit_breaker(
+            "path", "foo", creds
+        )
+
+    def test_settings(self):
+        creds = DatabricksCredentials(
+            connect_circuit_breaker_threshold=3,
+            compute={"foo": {"connect_circuit_breaker_cooldown": "10"}},
+        )
+        breaker = get_circuit_breaker("path", "foo", creds)
+        assert (breaker.threshold, breaker.cooldown) == (3, 10)
+
+    def test_defaults(self):
+        breaker = get_circuit_breaker("path", None, DatabricksCredentials())
+        assert (breaker.threshold, breaker.cooldown) == (5, 60)
+
+
+class TestConnectWithCircuitBreaker:
+    @pytest.fixture(autouse=True)
+    def clear_breakers(self):
+        connections._circuit_breakers.clear()
+        yield
+        connections._circuit_breakers.clear()
+
+    @pytest.fixture
+    def connection(self):
+        creds = DatabricksCredentials(
+            host="my.cloud.databricks.com",
+            http_path="path",
+            token="foo",
+            database="main",
+            schema="s",
+            connect_retries=0,
+        )
+        return Connection(type="databricks", name="test", credentials=creds)
+
+    def test_probe_failing_with_non_connector_error(self, connection):
+        breaker = get_circuit_breaker("path", None, connection.credentials)
+        for _ in range(breaker.threshold):
+            breaker.record_failure()
+        breaker.opened_at = time.time() - breaker.cooldown - 1
+
+        with patch(
+            "dbt.adapters.databricks.connections.dbsql.connect",
+            side_effect=RequestsConnectionError("connection refused"),
+        ):
+            with pytest.raises(Exception):
+                DatabricksConnectionManager.open(connection)
+
+        # The failed probe opens the breaker again for a cooldown, instead of leaving the
+        # probe in progress forever
+        assert breaker.is_open
+        with pytest.raises(DbtRuntimeError, match="retrying in"):
+            breaker.before_attempt()
@@ -0,0 +1,165 @@
+import pytest
+from agate import Table
+from dbt.adapters.databricks.column import DatabricksColumn
+from dbt.adapters.databricks.connections import ColumnCache
+from dbt.adapters.databricks.impl import DatabricksAdapter
+from dbt.adapters.databricks.relation import DatabricksRelation
+from mock import Mock
+from mock import patch
+
+
+class TestColumnCache:
+    @pytest.fixture
+    def cache(self):
+        return ColumnCache()
+
+    @pytest.fixture
+    def load(self):
+        return Mock(return_value=[DatabricksColumn(column="id", dtype="int")])
+
+    def test_get__describes_once(self, cache, load):
+        first = cache.get("`main`.`s`.`t`", load)
+        second = cache.get("main.s.T", load)
+
+        assert first == second
+        load.assert_called_once()
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_get__returns_copies(self, cache, load):
+        cache.get("main.s.t", load).clear()
+        assert len(cache.get("main.s.t", load)) == 1
+
+    @pytest.mark.parametrize(
+        "sql",
+        [
+            "create or replace table `main`.`s`.`t` using delta as select 1",
+            '/* {"node_id": "x"} */ alter table main.s.t add columns (c int)',
+            "drop view if exists `main`.`s`.`t`",
+            "insert overwrite table main.s.t select * from main.s.t__dbt_tmp",
+            "merge into main.s.t as target using src on false when not matched then insert *",
+            "comment on column main.s.t.id is 'docs'",
+            "alter table main.s.other rename to main.s.t",
+            # Qualified differently from the cached relation
+            "drop table t",
+        ],
+    )
+    def test_invalidate(self, cache, load, sql):
+        cache.get("`main`.`s`.`t`", load)
+        cache.invalidate(sql)
+        cache.get("`main`.`s`.`t`", load)
+
+        assert load.call_count == 2
+        assert cache.invalidations == 1
+
+    @pytest.mark.parametrize(
+        "sql",
+        [
+            "select * from main.s.t",
+            "describe table main.s.t",
+            "create or replace table main.s.other as select * from main.s.t",
+            "insert into main.s.other select * from main.s.t",
+        ],
+    )
+    def test_invalidate__other_statements(self, cache, load, sql):
+        cache.get("main.s.t", load)
+        cache.invalidate(sql)
+        cache.get("main.s.t", load)
+
+        load.assert_called_once()
+
+    def test_invalidate__during_describe(self, cache):
+        def load():
+            cache.invalidate("alter table main.s.t add columns (c int)")
+            return []
+
+        cache.get("main.s.t", load)
+        assert cache.get("main.s.t", Mock(return_value=[])) == []
+        assert cache.misses == 2
+
+    def test_get_described(self, cache):
+        table = Table([["id", "int", None]], ["col_name", "data_type", "comment"])
+        load = Mock(return_value=table)
+        assert cache.peek_described("main.s.t") is None
+
+        assert cache.get_described("main.s.t", load) is table
+        assert cache.get_described("main.s.t", load) is table
+        assert cache.peek_described("main.s.t") is table
+        load.assert_called_once()
+
+        cache.invalidate("alter table main.s.t set tblproperties ('a' = 'b')")
+        assert cache.peek_described("main.s.t") is None
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_get__from_described(self, cache, load):
+        table = Table([["id", "int", None]], ["col_name", "data_type", "comment"])
+        cache.get_described("main.s.t", Mock(return_value=table))
+        from_described = Mock(return_value=[DatabricksColumn(column="id", dtype="int")])
+
+        assert cache.get("main.s.t", load, from_described) == load.return_value
+        from_described.assert_called_once_with(table)
+        load.assert_not_called()
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_get__from_described_missing(self, cache, load):
+        from_described = Mock()
+        cache.get("main.s.t", load, from_described)
+
+        from_described.assert_not_called()
+        load.assert_called_once()
+        assert (cache.hits, cache.misses) == (0, 1)
+
+    def test_clear(self, cache, load):
+        cache.get("main.s.t", load)
+        cache.clear()
+        cache.get("main.s.t", load)
+
+        assert load.call_count == 2
+
+
+class TestGetColumnsInRelation:
+    @pytest.fixture
+    def adapter(self):
+        adapter = DatabricksAdapter.__new__(DatabricksAdapter)
+        adapter.connections = Mock(column_cache=ColumnCache())
+        return adapter
+
+    @pytest.fixture
+    def relation(self):
+        return DatabricksRelation.create(database="main", schema="s", identifier="t")
+
+    def test_describes_relation_once(self, adapter, relation):
+        rows = [
+            {"col_name": "id", "data_type": "int", "comment": None},
+            {"col_name": "# Partition Information", "data_type": "", "comment": None},
+        ]
+
+        with patch.object(DatabricksAdapter, "execute_macro", return_value=rows) as mocked:
+            columns = adapter.get_columns_in_relation(relation)
+            assert adapter.get_columns_in_relation(relation) == columns
+
+        mocked.assert_called_once()
+        assert [column.name for column in columns] == ["id"]
+
+    def test_reuses_describe_extended(self, adapter, relation):
+        described = Table(
+            [
+                ["id", "int", "the id"],
+                ["", "", ""],
+                ["# Detailed Table Information", "", ""],
+                ["Owner", "me", ""],
+            ],
+            ["col_name", "data_type", "comment"],
+        )
+
+        with patch.object(DatabricksAdapter, "execute_macro", return_value=described) as mocked:
+            updated, _ = adapter._get_updated_relation(relation)
+            assert adapter.describe_extended(relation) is described
+            columns = adapter.get_columns_in_relation(relation)
+
+        mocked.assert_called_once()
+        cache = adapter.connections.column_cache
+        assert (cache.hits, cache.misses) == (2, 1)
+        assert updated.metadata["Owner"] == "me"
+        assert [(column.name, column.dtype, column.comment) for column in columns] == [
+            ("id", "int", "the id")
+        ]
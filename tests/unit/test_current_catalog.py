@@ -0,0 +1,93 @@
+import pytest
+from dbt.adapters.databricks.connections import DatabricksSQLConnectionWrapper
+from dbt.adapters.databricks.credentials import DatabricksCredentials
+from dbt.adapters.databricks.impl import DatabricksAdapter
+from mock import Mock
+from mock import patch
+
+
+class TestCurrentCatalogTracking:
+    @pytest.fixture
+    def wrapper(self):
+        # The cursor events read operation ids that a mocked cursor does not have
+        with patch("dbt.adapters.databricks.connections.CursorCreate"):
+            yield DatabricksSQLConnectionWrapper(
+                Mock(),
+                is_cluster=False,
+                creds=DatabricksCredentials(),
+                user_agent="test",
+                catalog="main",
+            )
+
+    def execute(self, wrapper, sql):
+        wrapper.cursor().execute(sql)
+
+    def test_initial_catalog(self, wrapper):
+        assert wrapper.current_catalog == "main"
+
+    @pytest.mark.parametrize(
+        "sql, expected",
+        [
+            ("use catalog other", "other"),
+            ("USE CATALOG `my catalog`;", "my catalog"),
+            ("/* comment */\n  set catalog `a``b`", "a`b"),
+            ("-- comment\nuse catalog hive_metastore", "hive_metastore"),
+        ],
+    )
+    def test_use_catalog(self, wrapper, sql, expected):
+        self.execute(wrapper, sql)
+        assert wrapper.current_catalog == expected
+
+    def test_other_use_makes_catalog_unknown(self, wrapper):
+        self.execute(wrapper, "use other.schema")
+        assert wrapper.current_catalog is None
+
+    @pytest.mark.parametrize(
+        "sql", ["select 'use catalog other'", "set spark.sql.ansi.enabled = true", "show tables"]
+    )
+    def test_other_statements_keep_catalog(self, wrapper, sql):
+        self.execute(wrapper, sql)
+        assert wrapper.current_catalog == "main"
+
+    def test_failed_statement_keeps_catalog(self, wrapper):
+        wrapper._conn.cursor.return_value.execute.side_effect = Exception("no such catalog")
+        with pytest.raises(Exception):
+            self.execute(wrapper, "use catalog missing")
+        assert wrapper.current_catalog == "main"
+
+
+class TestCatalogContext:
+    @pytest.fixture
+    def adapter(self):
+        adapter = DatabricksAdapter.__new__(DatabricksAdapter)
+        adapter.connections = Mock()
+        return adapter
+
+    def test_catalog__uses_tracked_catalog(self, adapter):
+        adapter.connections.get_current_catalog.return_value = "main"
+        with patch.object(DatabricksAdapter, "execute_macro") as execute_macro:
+            with adapter._catalog("other"):
+                pass
+
+        assert [call.args[0] for call in execute_macro.call_args_list] == [
+            "use_catalog",
+            "use_catalog",
+        ]
+        assert execute_macro.call_args.kwargs["kwargs"] == {"catalog": "main"}
+
+    def test_catalog__same_catalog_is_noop(self, adapter):
+        adapter.connections.get_current_catalog.return_value = "main"
+        with patch.object(DatabricksAdapter, "execute_macro") as execute_macro:
+            with adapter._catalog("main"):
+                pass
+
+        execute_macro.assert_not_called()
+
+    def test_catalog__queries_unknown_catalog(self, adapter):
+        adapter.connections.get_current_catalog.return_value = None
+        with patch.object(DatabricksAdapter, "execute_macro", return_value=[["main"]]) as mocked:
+            with adapter._catalog("other"):
+                pass
+
+        assert mocked.call_args_list[0].args[0] == "current_catalog"
+        adapter.connections.set_current_catalog.assert_called_once_with("main")
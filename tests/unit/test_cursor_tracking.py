@@ -0,0 +1,45 @@
+from dbt.adapters.databricks.connections import DatabricksSQLConnectionWrapper
+from dbt.adapters.databricks.credentials import DatabricksCredentials
+from mock import Mock
+
+
+class TestCursorTracking:
+    def wrapper(self):
+        conn = Mock(_cursors=[])
+
+        def cursor():
+            cursor = Mock(active_result_set=None, open=False)
+            conn._cursors.append(cursor)
+            return cursor
+
+        conn.cursor.side_effect = cursor
+        return DatabricksSQLConnectionWrapper(
+            conn, is_cluster=False, creds=DatabricksCredentials(), user_agent=""
+        )
+
+    def test_closed_cursors_are_forgotten(self):
+        wrapper = self.wrapper()
+        for _ in range(3):
+            wrapper.cursor().close()
+
+        assert wrapper.live_cursor_count == 0
+        assert wrapper._conn._cursors == []
+
+    def test_cancel_only_live_cursors(self):
+        wrapper = self.wrapper()
+        closed = wrapper.cursor()
+        closed.close()
+        live = wrapper.cursor()
+
+        assert wrapper.live_cursor_count == 1
+        wrapper.cancel()
+        live._cursor.cancel.assert_called_once()
+        closed._cursor.cancel.assert_not_called()
+
+    def test_ping_releases_its_cursor(self):
+        wrapper = self.wrapper()
+        for _ in range(3):
+            assert wrapper.ping()
+
+        assert wrapper.live_cursor_count == 0
+        assert wrapper._conn._cursors == []
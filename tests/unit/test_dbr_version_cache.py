@@ -0,0 +1,75 @@
+import json
+import time
+
+import pytest
+from dbt.adapters.databricks.connections import DatabricksSQLConnectionWrapper
+from dbt.adapters.databricks.connections import dbr_version_cache
+from dbt.adapters.databricks.connections import DbrVersionCache
+from dbt.adapters.databricks.credentials import DatabricksCredentials
+from mock import MagicMock
+from mock import Mock
+
+
+class TestDbrVersionCache:
+    def test_get__loads_once(self):
+        cache = DbrVersionCache()
+        load = Mock(return_value=(13, 3))
+
+        assert cache.get("key", load) == (13, 3)
+        assert cache.get("key", load) == (13, 3)
+        load.assert_called_once()
+
+    def test_get__persists_with_ttl(self, tmp_path):
+        path = str(tmp_path / "versions.json")
+        DbrVersionCache(path, ttl=60).get("key", lambda: (14, 1))
+
+        load = Mock()
+        assert DbrVersionCache(path, ttl=60).get("key", load) == (14, 1)
+        load.assert_not_called()
+
+    def test_get__ignores_expired_entries(self, tmp_path):
+        path = tmp_path / "versions.json"
+        path.write_text(json.dumps({"key": {"value": [12, 2], "fetched_at": time.time() - 120}}))
+
+        assert DbrVersionCache(str(path), ttl=60).get("key", lambda: (14, 1)) == (14, 1)
+
+    def test_get__no_ttl_doesnt_touch_disk(self, tmp_path):
+        path = tmp_path / "versions.json"
+        DbrVersionCache(str(path)).get("key", lambda: (14, 1))
+        assert not path.exists()
+
+    def test_get__ignores_corrupt_file(self, tmp_path):
+        path = tmp_path / "versions.json"
+        path.write_text("not json")
+        assert DbrVersionCache(str(path), ttl=60).get("key", lambda: (14, 1)) == (14, 1)
+
+
+class TestConnectionWrapperDbrVersion:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        dbr_version_cache.clear()
+        yield
+        dbr_version_cache.clear()
+
+    def wrapper(self, http_path="path"):
+        conn = MagicMock()
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.fetchone.return_value = ("key", "13.3.x-scala2.12")
+        return DatabricksSQLConnectionWrapper(
+            conn,
+            is_cluster=True,
+            creds=DatabricksCredentials(host="host"),
+            user_agent="",
+            http_path=http_path,
+        )
+
+    def test_dbr_version__shared_across_sessions(self):
+        first, second = self.wrapper(), self.wrapper()
+        assert first.dbr_version == (13, 3)
+        assert second.dbr_version == (13, 3)
+        second._conn.cursor.assert_not_called()
+
+    def test_dbr_version__keyed_by_http_path(self):
+        first, second = self.wrapper(), self.wrapper("other")
+        assert first.dbr_version == second.dbr_version
+        second._conn.cursor.assert_called_once()
@@ -0,0 +1,113 @@
+from multiprocessing import get_context
+
+import pyarrow
+import pytest
+from databricks.sql.exc import Error
+from dbt.adapters.databricks.connections import DatabricksConnectionManager
+from dbt.adapters.databricks.connections import DatabricksSQLCursorWrapper
+from dbt.adapters.databricks.credentials import DatabricksCredentials
+from dbt_common.exceptions import DbtRuntimeError
+from mock import Mock
+from mock import patch
+
+
+class TestFetchBatches:
+    @pytest.fixture
+    def cursor(self):
+        table = pyarrow.table({"id": list(range(5)), "name": [f"row{i}" for i in range(5)]})
+        offset = [0]
+        inner = Mock(description=[("id",), ("name",)], active_result_set=None, open=False)
+
+        def fetchmany_arrow(size):
+            batch = table.slice(offset[0], size)
+            offset[0] += batch.num_rows
+            return batch
+
+        inner.fetchmany_arrow.side_effect = fetchmany_arrow
+        inner.fetchall_arrow.side_effect = lambda: fetchmany_arrow(table.num_rows)
+        return DatabricksSQLCursorWrapper(inner, creds=DatabricksCredentials(), user_agent="")
+
+    def test_fetch_batches(self, cursor):
+        assert [len(rows) for rows in cursor.fetch_batches(2)] == [2, 2, 1]
+
+    def test_fetch_batches__limit(self, cursor):
+        assert [len(rows) for rows in cursor.fetch_batches(2, limit=3)] == [2, 1]
+        assert cursor._cursor.fetchmany_arrow.call_args_list[-1].args == (1,)
+
+    def test_get_result_from_cursor(self, cursor):
+        table = DatabricksConnectionManager.get_result_from_cursor(cursor, None)
+        assert table.column_names == ("id", "name")
+        assert len(table.rows) == 5
+        assert tuple(table.rows[4]) == (4, "row4")
+        cursor._cursor.fetchall.assert_not_called()
+        cursor._cursor.fetchmany.assert_not_called()
+
+    def test_get_result_from_cursor__limit(self, cursor):
+        table = DatabricksConnectionManager.get_result_from_cursor(cursor, 3)
+        assert len(table.rows) == 3
+
+    def test_fetch_batches__complex_types(self):
+        table = pyarrow.table(
+            {
+                "arr": [["x", "y"]],
+                "map": pyarrow.array(
+                    [[("k", 1)]], type=pyarrow.map_(pyarrow.string(), pyarrow.int64())
+                ),
+                "struct": [{"f": 1}],
+            }
+        )
+        inner = Mock(description=[("arr",), ("map",), ("struct",)], active_result_set=None)
+        inner.fetchmany_arrow.side_effect = [table, table.slice(0, 0)]
+        cursor = DatabricksSQLCursorWrapper(inner, creds=DatabricksCredentials(), user_agent="")
+
+        # Plain Python values, as the connector returns without pandas, rather than the numpy
+        # arrays of its pandas conversion
+        assert list(cursor.fetch_batches()) == [[(["x", "y"], [("k", 1)], {"f": 1})]]
+
+    def test_get_result_from_cursor__complex_types_as_json(self):
+        table = pyarrow.table({"arr": [["x", "y"]], "struct": [{"f": 1}]})
+        inner = Mock(description=[("arr",), ("struct",)], active_result_set=None)
+        inner.fetchmany_arrow.side_effect = [table, table.slice(0, 0)]
+        cursor = DatabricksSQLCursorWrapper(inner, creds=DatabricksCredentials(), user_agent="")
+
+        result = DatabricksConnectionManager.get_result_from_cursor(cursor, None)
+        assert tuple(result.rows[0]) == ('["x", "y"]', '{"f": 1}')
+
+    @pytest.fixture
+    def manager(self, cursor):
+        creds = DatabricksCredentials()
+        manager = DatabricksConnectionManager(Mock(credentials=creds), get_context("spawn"))
+        with patch.object(manager, "add_query", return_value=(Mock(), cursor)), patch.object(
+            manager, "_add_query_comment", side_effect=lambda sql: sql
+        ):
+            yield manager
+
+    def test_execute_batches(self, manager, cursor):
+        tables = list(manager.execute_batches("select 1", batch_size=2))
+
+        assert [len(table.rows) for table in tables] == [2, 2, 1]
+        assert tables[0].rows[1]["name"] == "row1"
+        cursor._cursor.close.assert_called_once()
+
+    def test_execute_batches__stopped_early(self, manager, cursor):
+        batches = manager.execute_batches("select 1", batch_size=2)
+        next(batches)
+        cursor._cursor.close.assert_not_called()
+
+        batches.close()
+        cursor._cursor.close.assert_called_once()
+
+    def test_execute_batches__fetch_error(self, manager, cursor):
+        cursor._cursor.fetchmany_arrow.side_effect = Error("result expired")
+        with pytest.raises(DbtRuntimeError, match="result expired"):
+            list(manager.execute_batches("select 1", batch_size=2))
+        cursor._cursor.close.assert_called_once()
+
+    def test_execute_arrow(self, manager, cursor):
+        table = manager.execute_arrow("select 1")
+        assert table.num_rows == 5
+        assert table.column("name").to_pylist()[0] == "row0"
+        cursor._cursor.close.assert_called_once()
+
+    def test_execute_arrow__limit(self, manager):
+        assert manager.execute_arrow("select 1", limit=3).num_rows == 3
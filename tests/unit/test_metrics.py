@@ -0,0 +1,122 @@
+import json
+import time
+
+import pytest
+from dbt.adapters.databricks.connections import _update_connect_timings
+from dbt.adapters.databricks.connections import TimedCredentialsProvider
+from dbt.adapters.databricks.metrics import ConnectionOpenStats
+from dbt.adapters.databricks.metrics import ConnectionOpenTimings
+from dbt.adapters.databricks.metrics import get_statement_kind
+from dbt.adapters.databricks.metrics import LatencyHistogram
+from dbt.adapters.databricks.metrics import QueryMetrics
+from mock import Mock
+
+
+@pytest.mark.parametrize(
+    "sql, kind",
+    [
+        ("create or replace table t as select 1", "ddl"),
+        ('/* {"app": "dbt"} */\nmerge into t using s on t.id = s.id', "merge"),
+        ("-- comment\ninsert into t values (1)", "dml"),
+        ("  WITH a AS (SELECT 1) SELECT * FROM a", "query"),
+        ("describe table extended t", "metadata"),
+        ("optimize t", "other"),
+        ("", "other"),
+    ],
+)
+def test_get_statement_kind(sql, kind):
+    assert get_statement_kind(sql) == kind
+
+
+class TestLatencyHistogram:
+    def test_observe(self):
+        histogram = LatencyHistogram()
+        for elapsed in (0.05, 0.1, 3, 5000):
+            histogram.observe(elapsed)
+
+        buckets = dict(histogram.cumulative_buckets())
+        assert buckets["0.1"] == 2
+        assert buckets["2.5"] == 2
+        assert buckets["5"] == 3
+        assert buckets["1800"] == 3
+        assert buckets["+Inf"] == 4
+        assert histogram.count == 4
+
+
+class TestQueryMetrics:
+    @pytest.fixture
+    def metrics(self):
+        metrics = QueryMetrics()
+        metrics.record("ddl", 2.0, compute_name="alt", node_id="model.a")
+        metrics.record("ddl", 0.2, compute_name="alt", node_id="model.a", error=True)
+        metrics.record("metadata", 0.05)
+        metrics.record_live_cursors(3, compute_name="alt")
+        metrics.record_live_cursors(1, compute_name="alt")
+        return metrics
+
+    def test_to_dict(self, metrics):
+        summary = metrics.to_dict()
+        assert summary["statements"] == {"alt": {"ddl": 2}, "default": {"metadata": 1}}
+        assert summary["errors"] == {"alt": {"ddl": 1}}
+        assert summary["node_latency_seconds"]["model.a"]["count"] == 2
+        assert summary["compute_latency_seconds"]["default"]["sum"] == 0.05
+        assert summary["peak_live_cursors"] == {"alt": 3}
+
+    def test_to_openmetrics(self, metrics):
+        text = metrics.to_openmetrics()
+        assert "# TYPE dbt_databricks_compute_query_latency_seconds histogram" in text
+        assert (
+            'dbt_databricks_compute_query_latency_seconds_bucket{compute="alt",le="+Inf"} 2' in text
+        )
+        assert 'dbt_databricks_queries_total{compute="alt",kind="ddl"} 2' in text
+        assert 'dbt_databricks_query_errors_total{compute="alt",kind="ddl"} 1' in text
+        assert 'dbt_databricks_peak_live_cursors{compute="alt"} 3' in text
+        assert text.endswith("# EOF\n")
+
+    def test_export__json(self, metrics, tmp_path):
+        path = tmp_path / "metrics.json"
+        metrics.export(str(path))
+        assert json.loads(path.read_text()) == metrics.to_dict()
+
+    def test_export__openmetrics(self, metrics, tmp_path):
+        path = tmp_path / "metrics.prom"
+        metrics.export(str(path))
+        assert path.read_text() == metrics.to_openmetrics()
+
+
+class TestConnectionOpenStats:
+    def test_record(self):
+        stats = ConnectionOpenStats()
+        stats.record(ConnectionOpenTimings(authenticate=1, connect=2, attempts=1))
+        stats.record(ConnectionOpenTimings(connect=1, backoff=4, attempts=2), failed=True)
+
+        assert (stats.opened, stats.failed) == (1, 1)
+        assert stats.totals.connect == 3
+        assert stats.totals.attempts == 3
+        assert stats.max_elapsed == 5
+
+
+class TestConnectionOpenTimings:
+    def test_timed_credentials_provider(self):
+        timings = ConnectionOpenTimings()
+        provider = Mock(_token="token")
+        provider.return_value.return_value = {"Authorization": "Bearer token"}
+        timed = TimedCredentialsProvider(provider, timings)
+
+        assert timed._token == "token"
+        assert timed()() == {"Authorization": "Bearer token"}
+        assert timings.token > 0
+
+        header_factory = timed()
+        timings.done = True
+        token_time = timings.token
+        header_factory()
+        assert timings.token == token_time
+
+    def test_update_connect_timings(self):
+        timings = ConnectionOpenTimings(token=1.0)
+        now = time.time()
+        _update_connect_timings(timings, now - 10, now - 3, token_time=0.5)
+
+        assert 2.4 < timings.connect < 2.6
+        assert 6.4 < timings.backoff < 6.6
@@ -0,0 +1,69 @@
+import json
+import time
+
+import pytest
+from dbt.adapters.databricks import auth
+from dbt.adapters.databricks.auth import m2m_auth
+from dbt.adapters.databricks.auth import OAuthEndpointCache
+from mock import Mock
+from mock import patch
+
+ENDPOINT = ("https://host/oidc/v1/token", ["all-apis"])
+
+
+class TestOAuthEndpointCache:
+    def test_get__loads_once(self):
+        cache = OAuthEndpointCache()
+        load = Mock(return_value=ENDPOINT)
+
+        assert cache.get("host", load) == ENDPOINT
+        assert cache.get("host", load) == ENDPOINT
+        load.assert_called_once()
+
+    def test_get__persists_with_ttl(self, tmp_path):
+        path = str(tmp_path / "endpoints.json")
+        OAuthEndpointCache(path, ttl=60).get("host", lambda: ENDPOINT)
+
+        load = Mock()
+        assert OAuthEndpointCache(path, ttl=60).get("host", load) == ENDPOINT
+        load.assert_not_called()
+
+    def test_get__ignores_expired_entries(self, tmp_path):
+        path = tmp_path / "endpoints.json"
+        value = {"token_endpoint": "https://old", "scopes": []}
+        entry = {"value": value, "fetched_at": time.time() - 120}
+        path.write_text(json.dumps({"host": entry}))
+
+        assert OAuthEndpointCache(str(path), ttl=60).get("host", lambda: ENDPOINT) == ENDPOINT
+
+    def test_get__no_ttl_doesnt_touch_disk(self, tmp_path):
+        path = tmp_path / "endpoints.json"
+        OAuthEndpointCache(str(path)).get("host", lambda: ENDPOINT)
+        assert not path.exists()
+
+    def test_get__failed_discovery_not_cached(self):
+        cache = OAuthEndpointCache()
+        with pytest.raises(ValueError):
+            cache.get("host", Mock(side_effect=ValueError("host does not support OAuth")))
+        assert cache.get("host", lambda: ENDPOINT) == ENDPOINT
+
+
+class TestM2MAuthDiscovery:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        auth.oauth_endpoint_cache.clear()
+        yield
+        auth.oauth_endpoint_cache.clear()
+
+    def test_discovery_shared_across_instances(self):
+        with patch.object(m2m_auth, "_discover_token_endpoint", return_value=ENDPOINT) as discover:
+            first = m2m_auth("host", "id", "secret")
+            second = m2m_auth.from_dict("host", "id", "secret", {"token": _token()})
+
+        discover.assert_called_once_with("host")
+        assert first._token_source.token_url == ENDPOINT[0]
+        assert second._token_source.scopes == ENDPOINT[1]
+
+
+def _token():
+    return {"access_token": "abc", "token_type": "Bearer", "expiry": "2030-01-01T00:00:00"}
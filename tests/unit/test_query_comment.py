@@ -0,0 +1,41 @@
+from unittest.mock import Mock
+
+from dbt.adapters.contracts.connection import QueryComment
+from dbt.adapters.databricks.connections import DatabricksMacroQueryStringSetter
+
+
+class TestDatabricksMacroQueryStringSetter:
+    def get_setter(self, append=False):
+        config = Mock(query_comment=QueryComment(comment="{{ connection_name }}", append=append))
+        setter = DatabricksMacroQueryStringSetter(config, {})
+        setter.generator = Mock(side_effect=lambda name, node: f"comment {name}")
+        # Drop the comment rendered for "master" by the constructor
+        setter._comments.clear()
+        return setter
+
+    def test_set__renders_once_per_node_and_name(self):
+        setter = self.get_setter()
+        node = Mock(unique_id="model.proj.a")
+
+        setter.set("model.proj.a", node)
+        setter.set("model.proj.a", node)
+        assert setter.generator.call_count == 1
+        assert setter.add("select 1") == "/* comment model.proj.a */\nselect 1"
+
+        setter.set("model.proj.a", Mock(unique_id="model.proj.b"))
+        setter.set("other", node)
+        assert setter.generator.call_count == 3
+
+    def test_set__without_node(self):
+        setter = self.get_setter(append=True)
+        setter.set("master", None)
+        setter.set("master", None)
+
+        assert setter.generator.call_count == 1
+        assert setter.add("select 1") == "select 1\n/* comment master */"
+
+    def test_set__new_setter_has_fresh_cache(self):
+        first, second = self.get_setter(), self.get_setter()
+        first.set("master", None)
+        second.set("master", None)
+        assert second.generator.call_count == 1
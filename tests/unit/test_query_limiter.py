@@ -0,0 +1,63 @@
+import threading
+import time
+from multiprocessing import get_context
+
+import pytest
+from dbt.adapters.databricks import connections
+from dbt.adapters.databricks.connections import DatabricksConnectionManager
+from dbt.adapters.databricks.connections import DatabricksQueryLimiter
+from dbt.adapters.databricks.credentials import DatabricksCredentials
+from dbt_common.exceptions import DbtRuntimeError
+from mock import Mock
+
+
+class TestDatabricksQueryLimiter:
+    def test_slot__no_wait(self):
+        limiter = DatabricksQueryLimiter("foo", 1)
+        with limiter.slot():
+            pass
+        assert (limiter.queued, limiter.queue_time) == (0, 0.0)
+
+    def test_slot__waits_when_full(self):
+        limiter = DatabricksQueryLimiter("foo", 1)
+        entered = []
+
+        def run():
+            with limiter.slot():
+                entered.append(time.time())
+
+        with limiter.slot():
+            waiter = threading.Thread(target=run)
+            waiter.start()
+            time.sleep(0.1)
+            assert not entered
+        waiter.join(timeout=5)
+
+        assert entered
+        assert limiter.queued == 1
+        assert limiter.queue_time > 0
+
+    def test_init__invalid(self):
+        with pytest.raises(DbtRuntimeError):
+            DatabricksQueryLimiter("foo", 0)
+
+
+class TestQueryLimiterConfig:
+    @pytest.fixture
+    def manager(self):
+        creds = DatabricksCredentials(
+            max_concurrent_queries=4, compute={"small": {"max_concurrent_queries": "2"}, "big": {}}
+        )
+        return DatabricksConnectionManager(Mock(credentials=creds), get_context("spawn"))
+
+    def test_get_query_limiter__per_compute(self, manager):
+        assert manager._get_query_limiter("small").max_concurrent_queries == 2
+        assert manager._get_query_limiter("big").max_concurrent_queries == 4
+        assert manager._get_query_limiter("") is not manager._get_query_limiter("big")
+
+    def test_get_query_limiter__reused(self, manager):
+        assert manager._get_query_limiter("small") is manager._get_query_limiter("small")
+
+    def test_get_max_concurrent_queries__unset(self):
+        creds = DatabricksCredentials()
+        assert connections._get_max_concurrent_queries(None, creds) is None
@@ -0,0 +1,155 @@
+from multiprocessing import get_context
+
+import pytest
+from databricks.sql.exc import DatabaseError
+from databricks.sql.exc import NonRecoverableNetworkError
+from databricks.sql.exc import RequestError
+from databricks.sql.exc import ServerOperationError
+from dbt.adapters.contracts.connection import ConnectionState
+from dbt.adapters.databricks import connections
+from dbt.adapters.databricks.connections import DatabricksConnectionManager
+from dbt.adapters.databricks.connections import DatabricksQueryRetryPolicy
+from dbt.adapters.databricks.connections import ExtendedSessionConnectionManager
+from dbt.adapters.databricks.credentials import DatabricksCredentials
+from mock import Mock
+from mock import patch
+
+
+@pytest.mark.parametrize(
+    "exc, reason",
+    [
+        (DatabaseError("Invalid SessionHandle: 01ef"), "session_expired"),
+        (RequestError("Error during request", {"http-code": 503}), "throttled"),
+        (ServerOperationError("TEMPORARILY_UNAVAILABLE: try again"), "transient"),
+        (RequestError("Error during request", {"http-code": 504}), "transient"),
+        (ServerOperationError("Bad gateway, http code 502"), "transient"),
+        (ServerOperationError("[TABLE_OR_VIEW_NOT_FOUND] foo"), None),
+        (ServerOperationError("[TABLE_OR_VIEW_NOT_FOUND] The table `orders_503` is missing"), None),
+        (ServerOperationError("[PARSE_SYNTAX_ERROR] Syntax error at 'LIMIT 429'"), None),
+        (ServerOperationError("[DELTA_CONCURRENT_APPEND] 502 rows conflict"), None),
+        (NonRecoverableNetworkError("503 not implemented"), None),
+    ],
+)
+def test_get_retry_reason(exc, reason):
+    assert connections._get_retry_reason(exc) == reason
+
+
+class TestQueryRetryPolicy:
+    def test_should_retry(self):
+        policy = DatabricksQueryRetryPolicy(2, ["metadata"])
+        assert policy.should_retry("metadata", 1)
+        assert not policy.should_retry("metadata", 2)
+        assert not policy.should_retry("merge", 0)
+
+    def test_get_delay(self):
+        policy = DatabricksQueryRetryPolicy(10, [])
+        assert 0 <= policy.get_delay(0) <= 1
+        assert 0 <= policy.get_delay(10) <= 30
+
+    def test_get_query_retry_policy__defaults(self):
+        policy = connections._get_query_retry_policy(None, DatabricksCredentials())
+        assert policy.retries == 2
+        assert policy.statement_kinds == {"metadata"}
+
+    def test_get_query_retry_policy__opt_in(self):
+        creds = DatabricksCredentials(
+            query_retries=1, compute={"foo": {"query_retry_statements": "ddl, merge"}}
+        )
+        policy = connections._get_query_retry_policy("foo", creds)
+        assert policy.retries == 1
+        assert policy.statement_kinds == {"metadata", "ddl", "merge"}
+
+
+class TestExecuteWithRetries:
+    @pytest.fixture(autouse=True)
+    def no_sleep(self):
+        with patch("dbt.adapters.databricks.connections.time.sleep"):
+            yield
+
+    def manager(self, manager_class=DatabricksConnectionManager, **kwargs):
+        creds = DatabricksCredentials(**kwargs)
+        return manager_class(Mock(credentials=creds), get_context("spawn"))
+
+    def connection(self, **kwargs):
+        connection = Mock(compute_name="", **kwargs)
+        connection.handle.live_cursor_count = 1
+        return connection
+
+    def test_retries_transient_metadata_error(self):
+        manager = self.manager()
+        f = Mock(side_effect=[ServerOperationError("TEMPORARILY_UNAVAILABLE"), None])
+        connection = self.connection()
+
+        manager._execute_with_retries(connection, "metadata", f)
+        assert f.call_count == 2
+        assert manager.query_metrics.retry_counts[("default", "metadata:transient")] == 1
+        assert manager.query_metrics.peak_live_cursors["default"] == 1
+
+    def test_does_not_retry_ddl_by_default(self):
+        manager = self.manager()
+        f = Mock(side_effect=ServerOperationError("TEMPORARILY_UNAVAILABLE"))
+
+        with pytest.raises(ServerOperationError):
+            manager._execute_with_retries(self.connection(), "ddl", f)
+        assert f.call_count == 1
+
+    def test_gives_up_after_retries(self):
+        manager = self.manager(query_retries=1, query_retry_statements=["ddl"])
+        f = Mock(side_effect=ServerOperationError("TEMPORARILY_UNAVAILABLE"))
+
+        with pytest.raises(ServerOperationError):
+            manager._execute_with_retries(self.connection(), "ddl", f)
+        assert f.call_count == 2
+
+    def test_session_expired__not_reopened_without_long_sessions(self):
+        manager = self.manager()
+        f = Mock(side_effect=DatabaseError("Invalid SessionHandle"))
+
+        with pytest.raises(DatabaseError):
+            manager._execute_with_retries(self.connection(), "metadata", f)
+        assert f.call_count == 1
+
+    def test_session_expired__reopens_long_session(self):
+        manager = self.manager(ExtendedSessionConnectionManager, http_path="path")
+        f = Mock(side_effect=[DatabaseError("Invalid SessionHandle"), None])
+        connection = self.connection(http_path="path", state=ConnectionState.OPEN)
+        expired = connection.handle
+
+        with patch.object(manager, "_close_pooled") as close_pooled:
+            manager._execute_with_retries(connection, "metadata", f)
+
+        close_pooled.assert_called_once_with(connection)
+        expired.cursor.return_value.close.assert_called_once()
+        assert f.call_count == 2
+
+    def reopen(self, manager, connection, new):
+        def close_pooled(conn):
+            conn.handle = new
+
+        return patch.object(manager, "_close_pooled", side_effect=close_pooled)
+
+    def test_session_expired__restores_catalog(self):
+        manager = self.manager(ExtendedSessionConnectionManager, http_path="path")
+        f = Mock(side_effect=[DatabaseError("Invalid SessionHandle"), None])
+        connection = self.connection(http_path="path", state=ConnectionState.OPEN)
+        connection.handle.current_catalog = "other"
+        new = Mock(current_catalog="main", live_cursor_count=1)
+
+        with self.reopen(manager, connection, new):
+            manager._execute_with_retries(connection, "metadata", f)
+
+        new.cursor.return_value.execute.assert_any_call("USE CATALOG `other`")
+        assert f.call_count == 2
+
+    def test_session_expired__unknown_catalog_not_retried(self):
+        manager = self.manager(ExtendedSessionConnectionManager, http_path="path")
+        f = Mock(side_effect=[DatabaseError("Invalid SessionHandle"), None])
+        connection = self.connection(http_path="path", state=ConnectionState.OPEN)
+        connection.handle.current_catalog = None
+        new = Mock(current_catalog="main", live_cursor_count=1)
+
+        with self.reopen(manager, connection, new), pytest.raises(DatabaseError):
+            manager._execute_with_retries(connection, "metadata", f)
+
+        new.cursor.return_value.execute.assert_not_called()
+        assert f.call_count == 1
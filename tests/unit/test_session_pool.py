@@ -0,0 +1,412 @@
+import threading
+import time
+from multiprocessing import get_context
+
+import pytest
+from dbt.adapters.contracts.connection import ConnectionState
+from dbt.adapters.databricks import connections
+from dbt.adapters.databricks.connections import DatabricksSessionPool
+from dbt.adapters.databricks.connections import ExtendedSessionConnectionManager
+from dbt.adapters.databricks.credentials import DatabricksCredentials
+from dbt_common.exceptions import DbtRuntimeError
+from mock import Mock
+from mock import patch
+
+
+class TestDatabricksSessionPool:
+    @pytest.fixture
+    def pool(self):
+        return DatabricksSessionPool("path", max_size=2, max_idle_time=60)
+
+    def test_lease__empty_pool_reserves_slot(self, pool):
+        assert pool.lease() is None
+        assert pool.size == 1
+        assert pool.misses == 1
+
+    def test_lease__reuses_released_session(self, pool):
+        handle = Mock()
+        assert pool.lease() is None
+        pool.release(handle, time.time())
+
+        leased = pool.lease()
+        assert leased is not None
+        assert leased[0] is handle
+        assert pool.size == 1
+        assert pool.hits == 1
+
+    def test_lease__closes_expired_session(self, pool):
+        handle = Mock()
+        assert pool.lease() is None
+        pool.release(handle, time.time() - 61)
+
+        assert pool.lease() is None
+        handle.close.assert_called_once()
+        assert pool.size == 1
+
+    def test_lease__waits_when_full(self, pool):
+        handle = Mock()
+        assert pool.lease() is None
+        assert pool.lease() is None
+
+        leased = []
+        waiter = threading.Thread(target=lambda: leased.append(pool.lease()))
+        waiter.start()
+        time.sleep(0.1)
+        assert not leased
+
+        pool.release(handle, time.time())
+        waiter.join(timeout=5)
+        assert leased[0][0] is handle
+        assert pool.waits == 1
+        assert pool.wait_time > 0
+
+    def test_discard__frees_slot(self, pool):
+        assert pool.lease() is None
+        pool.discard()
+        assert pool.size == 0
+
+    def test_reap(self, pool):
+        fresh, stale = Mock(), Mock()
+        pool.lease(), pool.lease()
+        pool.release(fresh, time.time())
+        pool.release(stale, time.time() - 61)
+
+        assert pool.reap() == [stale]
+        assert pool.size == 1
+        assert pool.idle_count == 1
+
+    def test_reserve(self, pool):
+        assert pool.reserve(1)
+        assert not pool.reserve(1)
+        assert pool.reserve(5)
+        assert not pool.reserve(5)
+        assert pool.size == 2
+
+    def test_drain(self, pool):
+        handle = Mock()
+        pool.lease()
+        pool.release(handle, time.time())
+        assert pool.drain() == [handle]
+        assert pool.size == 0
+
+    def test_release__keeps_idle_sessions_ordered(self, pool):
+        older, newer = Mock(), Mock()
+        pool.lease(), pool.lease()
+        now = time.time()
+        pool.release(newer, now)
+        pool.release(older, now - 10)
+
+        assert pool.next_expiry() == now - 10 + 60
+        assert pool.drain() == [older, newer]
+
+    def test_next_expiry__empty(self, pool):
+        assert pool.next_expiry() is None
+
+    def test_lease__times_out_when_full(self):
+        pool = DatabricksSessionPool("path", max_size=1, timeout=1)
+        pool.lease()
+
+        start = time.time()
+        with pytest.raises(DbtRuntimeError) as info:
+            pool.lease()
+
+        assert time.time() - start >= 1
+        assert "compute path: all 1 sessions" in str(info.value)
+        assert pool.waits == 1
+        assert pool.size == 1
+
+    def test_init__max_smaller_than_min(self):
+        with pytest.raises(DbtRuntimeError):
+            DatabricksSessionPool("path", min_size=3, max_size=2)
+
+
+class TestPoolSizeConfig:
+    def test_get_pool_size__default(self):
+        creds = DatabricksCredentials()
+        assert connections._get_pool_size(None, creds) == (0, None)
+
+    def test_get_pool_size__creds(self):
+        creds = DatabricksCredentials(connect_pool_min_size=1, connect_pool_max_size=4)
+        assert connections._get_pool_size(None, creds) == (1, 4)
+        assert connections._get_pool_size("foo", creds) == (1, 4)
+
+    def test_get_pool_size__compute(self):
+        creds = DatabricksCredentials(connect_pool_min_size=1, connect_pool_max_size=4)
+        creds.compute = {"foo": {"connect_pool_max_size": "8"}}
+        assert connections._get_pool_size("foo", creds) == (1, 8)
+
+    def test_get_pool_timeout(self):
+        creds = DatabricksCredentials(connect_pool_timeout=60)
+        creds.compute = {"foo": {"connect_pool_timeout": "0"}}
+        assert connections._get_pool_timeout(None, DatabricksCredentials()) == 3600
+        assert connections._get_pool_timeout(None, creds) == 60
+        assert connections._get_pool_timeout("foo", creds) == 0
+
+    def test_get_pool_size__invalid(self):
+        creds = DatabricksCredentials(connect_pool_max_size="many")
+        with pytest.raises(DbtRuntimeError) as info:
+            connections._get_pool_size(None, creds)
+        assert "many is not a valid value for connect_pool_max_size" in str(info.value)
+
+
+class TestExtendedSessionPooling:
+    @pytest.fixture
+    def manager(self):
+        creds = DatabricksCredentials(http_path="path")
+        return ExtendedSessionConnectionManager(Mock(credentials=creds), get_context("spawn"))
+
+    @staticmethod
+    def fake_open(connection):
+        connection.handle = Mock()
+        connection.state = ConnectionState.OPEN
+        return connection
+
+    def test_session_shared_across_threads(self, manager):
+        handles = []
+
+        def run(name):
+            manager.set_connection_name(name)
+            handles.append(manager.get_thread_connection().handle)
+            manager.release()
+
+        with patch.object(ExtendedSessionConnectionManager, "open", side_effect=self.fake_open):
+            for name in ("first", "second"):
+                thread = threading.Thread(target=run, args=(name,))
+                thread.start()
+                thread.join()
+
+        assert handles[0] is handles[1]
+        pool = manager.session_pools["path"]
+        assert (pool.size, pool.hits, pool.misses) == (1, 1, 1)
+
+    def test_cleanup_all_closes_pooled_sessions(self, manager):
+        with patch.object(ExtendedSessionConnectionManager, "open", side_effect=self.fake_open):
+            manager.set_connection_name("first")
+            handle = manager.get_thread_connection().handle
+            manager.release()
+
+        manager.cleanup_all()
+        handle.close.assert_called_once()
+        assert manager.session_pools == {}
+
+
+class TestSessionReaper:
+    @pytest.fixture
+    def manager(self):
+        creds = DatabricksCredentials(http_path="path", connect_max_idle=1)
+        manager = ExtendedSessionConnectionManager(Mock(credentials=creds), get_context("spawn"))
+        yield manager
+        manager.cleanup_all()
+
+    def test_get_reap_delay__no_pools(self, manager):
+        assert manager._get_reap_delay() is None
+
+    def test_get_reap_delay__next_expiry(self, manager):
+        pool = manager._get_session_pool("path")
+        pool.lease()
+        pool.release(Mock(), time.time() - 0.5)
+        assert 0 < manager._get_reap_delay() <= 0.5
+
+    def test_reaper_closes_expired_sessions(self, manager):
+        handle = Mock()
+        pool = manager._get_session_pool("path")
+        pool.lease()
+        pool.release(handle, time.time())
+
+        deadline = time.time() + 5
+        while pool.size and time.time() < deadline:
+            time.sleep(0.05)
+
+        handle.close.assert_called_once()
+        assert pool.size == 0
+
+    def test_cleanup_all_stops_reaper(self, manager):
+        manager._get_session_pool("path")
+        reaper = manager._reaper
+        assert reaper is not None and reaper.is_alive()
+
+        manager.cleanup_all()
+        assert not reaper.is_alive()
+        assert manager._reaper is None
+
+    def test_fill_session_pool__closes_session_opened_during_cleanup(self, manager):
+        pool = manager._get_session_pool("path")
+        pool.reserve(1)
+        handle = Mock()
+
+        def open_during_cleanup(connection):
+            manager.cleanup_all()
+            connection.handle = handle
+            return connection
+
+        with patch.object(
+            ExtendedSessionConnectionManager, "open", side_effect=open_during_cleanup
+        ):
+            assert not manager._fill_session_pool(pool)
+
+        handle.close.assert_called_once()
+        assert pool.size == 0
+
+    def test_maintain__closes_pinged_session_after_cleanup(self, manager):
+        pool = manager._get_session_pool("path")
+        pool.keepalive = True
+        # Replace the background reaper, so only this test maintains the pool
+        reaper = manager._reaper
+        with manager.lock:
+            manager._reaper = Mock()
+        manager._reaper_wakeup.set()
+        reaper.join(5)
+
+        pool.lease()
+        handle = Mock()
+        handle.ping.side_effect = lambda: manager.cleanup_all() or True
+        pool.release(handle, time.time() - 61)
+        manager._maintain_session_pools()
+
+        handle.close.assert_called_once()
+        assert pool.size == 0
+
+    def test_cleanup_all_does_not_wait_for_slow_close(self, manager):
+        closing = threading.Event()
+        release = threading.Event()
+
+        def close():
+            closing.set()
+            release.wait(5)
+
+        pool = manager._get_session_pool("path")
+        pool.lease()
+        pool.release(Mock(close=Mock(side_effect=close)), time.time() - 1)
+        assert closing.wait(5)
+        reaper = manager._reaper
+
+        start = time.time()
+        manager.cleanup_all()
+        assert time.time() - start < 3
+
+        release.set()
+        reaper.join(5)
+        assert not reaper.is_alive()
+
+
+class TestSessionKeepalive:
+    @pytest.fixture
+    def pool(self):
+        return DatabricksSessionPool("path", max_size=2, max_idle_time=60, keepalive=True)
+
+    def test_lease__keeps_expired_session(self, pool):
+        handle = Mock()
+        pool.lease()
+        pool.release(handle, time.time() - 61)
+
+        assert pool.lease()[0] is handle
+        handle.close.assert_not_called()
+
+    def test_lease_expired(self, pool):
+        fresh, stale = Mock(), Mock()
+        pool.lease(), pool.lease()
+        pool.release(fresh, time.time())
+        pool.release(stale, time.time() - 61)
+
+        assert pool.lease_expired() == [stale]
+        assert pool.size == 2
+        assert pool.idle_count == 1
+
+    def test_maintain__pings_expired_sessions(self):
+        creds = DatabricksCredentials(http_path="path", connect_keepalive=True)
+        manager = ExtendedSessionConnectionManager(Mock(credentials=creds), get_context("spawn"))
+        alive, dead = Mock(), Mock()
+        alive.ping.return_value = True
+        dead.ping.return_value = False
+
+        pool = manager._get_session_pool("path")
+        pool.lease(), pool.lease()
+        pool.release(alive, time.time() - 61)
+        pool.release(dead, time.time() - 61)
+        manager._maintain_session_pools()
+        manager.cleanup_all()
+
+        alive.ping.assert_called_once()
+        dead.close.assert_called_once()
+        assert alive.close.call_count == 1
+        assert pool.size == 0
+
+    def test_close_if_idle_too_long__pings(self):
+        creds = DatabricksCredentials(http_path="path")
+        manager = ExtendedSessionConnectionManager(Mock(credentials=creds), get_context("spawn"))
+        conn = Mock(
+            state=ConnectionState.OPEN,
+            acquire_release_count=0,
+            keepalive=True,
+            last_used_time=time.time() - 61,
+        )
+        conn._idle_too_long.return_value = True
+        conn.handle.ping.return_value = True
+
+        manager._close_if_idle_too_long(conn)
+        conn.handle.close.assert_not_called()
+        assert time.time() - conn.last_used_time < 5
+
+    @pytest.mark.parametrize(
+        "value, expected", [(None, False), (True, True), ("false", False), (" True ", True)]
+    )
+    def test_get_keepalive(self, value, expected):
+        creds = DatabricksCredentials(compute={"foo": {"connect_keepalive": value}})
+        assert connections._get_keepalive("foo", creds) is expected
+
+    def test_get_keepalive__invalid(self):
+        creds = DatabricksCredentials(connect_keepalive="sometimes")
+        with pytest.raises(DbtRuntimeError):
+            connections._get_keepalive(None, creds)
+
+
+class TestSessionPoolPrewarm:
+    @staticmethod
+    def fake_open(connection):
+        connection.handle = Mock()
+        connection.state = ConnectionState.OPEN
+        return connection
+
+    def get_manager(self, **kwargs):
+        creds = DatabricksCredentials(
+            http_path="path",
+            compute={"alt": {"http_path": "alt_path", "connect_pool_prewarm": 1}},
+            **kwargs,
+        )
+        return ExtendedSessionConnectionManager(Mock(credentials=creds), get_context("spawn"))
+
+    def test_prewarm__opens_sessions_for_every_compute(self):
+        manager = self.get_manager(connect_pool_prewarm=2)
+        with patch.object(ExtendedSessionConnectionManager, "open", side_effect=self.fake_open):
+            manager.set_connection_name("master")
+
+        assert manager.session_pools["path"].idle_count == 2
+        assert manager.session_pools["alt_path"].idle_count == 1
+
+    def test_prewarm__only_once(self):
+        manager = self.get_manager(connect_pool_prewarm=2)
+        with patch.object(
+            ExtendedSessionConnectionManager, "open", side_effect=self.fake_open
+        ) as mock_open:
+            manager.set_connection_name("master")
+            manager.set_connection_name("other")
+
+        assert mock_open.call_count == 3
+
+    def test_prewarm__done_without_lock(self):
+        manager = self.get_manager()
+        manager._prewarmed = True
+        with patch.object(manager, "lock") as lock:
+            manager._prewarm_session_pools()
+
+        lock.__enter__.assert_not_called()
+
+    def test_prewarm__per_compute_setting(self):
+        manager = self.get_manager()
+        with patch.object(
+            ExtendedSessionConnectionManager, "open", side_effect=self.fake_open
+        ) as mock_open:
+            manager.set_connection_name("master")
+
+        assert set(manager.session_pools) == {"alt_path"}
+        assert mock_open.call_count == 1
@@ -0,0 +1,149 @@
+import errno
+import json
+import os
+import stat
+import threading
+import time
+from datetime import datetime
+from datetime import timedelta
+
+import pytest
+from databricks.sdk.oauth import SessionCredentials
+from databricks.sdk.oauth import Token
+from dbt.adapters.databricks import token_cache
+from dbt.adapters.databricks.credentials import DatabricksCredentials
+from dbt.adapters.databricks.token_cache import FileTokenCache
+from mock import Mock
+from mock import patch
+
+
+class TestFileTokenCache:
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return FileTokenCache(str(tmp_path / "tokens"))
+
+    def test_get__missing(self, cache):
+        assert cache.get("host") is None
+
+    def test_set_get_delete(self, cache):
+        cache.set("host", '{"token": {}}')
+        assert cache.get("host") == '{"token": {}}'
+        assert cache.get("other") is None
+
+        cache.delete("host")
+        assert cache.get("host") is None
+        cache.delete("host")
+
+    def test_set__private_file(self, cache):
+        cache.set("host", "secret")
+        (path,) = [p for p in os.listdir(cache.directory) if p.endswith(".json")]
+        mode = os.stat(os.path.join(cache.directory, path)).st_mode
+        assert stat.S_IMODE(mode) == 0o600
+        assert "host" not in path
+
+    def test_lock__exclusive(self, cache):
+        events = []
+
+        def hold():
+            with cache.lock("host"):
+                events.append("first acquired")
+                time.sleep(0.2)
+                events.append("first released")
+
+        thread = threading.Thread(target=hold)
+        thread.start()
+        time.sleep(0.05)
+        with cache.lock("host"):
+            events.append("second acquired")
+        thread.join()
+
+        assert events == ["first acquired", "first released", "second acquired"]
+
+    def test_lock__windows_keeps_waiting(self, cache):
+        msvcrt = Mock(LK_LOCK=1, LK_UNLCK=0)
+        timeout = OSError(errno.EDEADLOCK, "Resource deadlock avoided")
+        msvcrt.locking.side_effect = [timeout, timeout, None, None]
+
+        with patch.object(token_cache.sys, "platform", "win32"), patch.object(
+            token_cache, "msvcrt", msvcrt, create=True
+        ):
+            with cache.lock("host"):
+                pass
+
+        assert msvcrt.locking.call_count == 4
+
+
+class TestCredentialsTokenCache:
+    @pytest.fixture
+    def cache_dir(self, tmp_path):
+        directory = str(tmp_path / "tokens")
+        with patch.object(token_cache, "TOKEN_CACHE_DIR", directory):
+            yield directory
+
+    def creds(self):
+        return DatabricksCredentials(
+            host="my.cloud.databricks.com",
+            database="andre",
+            http_path="http://foo",
+            schema="dbt",
+            auth_type="oauth",
+        )
+
+    def test_authenticate__reads_file_cache_instead_of_keyring(self, cache_dir):
+        raw = {
+            "token": {
+                "access_token": "abc",
+                "token_type": "Bearer",
+                "expiry": (datetime.now() + timedelta(hours=1)).isoformat(),
+                "refresh_token": "def",
+            }
+        }
+        FileTokenCache(cache_dir).set("my.cloud.databricks.com", json.dumps(raw))
+
+        with patch("dbt.adapters.databricks.credentials.OAuthClient"), patch(
+            "keyring.get_password", side_effect=AssertionError("keyring used")
+        ):
+            provider = self.creds().authenticate(None)
+
+        assert provider.token().access_token == "abc"
+
+    def test_authenticate__saves_new_token_to_file_cache(self, cache_dir):
+        creds = self.creds()
+        with patch("dbt.adapters.databricks.credentials.OAuthClient") as client, patch(
+            "keyring.set_password", side_effect=AssertionError("keyring used")
+        ):
+            consent = client.return_value.initiate_consent.return_value
+            consent.launch_external_browser.return_value = SessionCredentials(
+                client=Mock(), token=self.token("new", timedelta(hours=1))
+            )
+            creds.authenticate(None)
+
+        cached = FileTokenCache(cache_dir).get("my.cloud.databricks.com")
+        assert json.loads(cached)["token"]["access_token"] == "new"
+
+    def test_refresh__saves_token_to_file_cache(self, cache_dir):
+        raw = {"token": self.token("old", timedelta(seconds=10)).as_dict()}
+        FileTokenCache(cache_dir).set("my.cloud.databricks.com", json.dumps(raw))
+
+        with patch("dbt.adapters.databricks.credentials.OAuthClient"), patch(
+            "databricks.sdk.oauth.retrieve_token",
+            side_effect=[
+                self.token("refreshed", timedelta(hours=1)),
+                self.token("later", timedelta(hours=1)),
+            ],
+        ):
+            provider = self.creds().authenticate(None)
+            assert provider.token().access_token == "refreshed"
+            # Refreshed after authenticating, e.g. inline by the SDK
+            provider.refresh()
+
+        cached = FileTokenCache(cache_dir).get("my.cloud.databricks.com")
+        assert json.loads(cached)["token"]["access_token"] == "later"
+
+    def token(self, access_token, lifetime):
+        return Token(
+            access_token=access_token,
+            token_type="Bearer",
+            expiry=datetime.now() + lifetime,
+            refresh_token="refresh",
+        )
@@ -0,0 +1,173 @@
+import gc
+import time
+import weakref
+from datetime import datetime
+from datetime import timedelta
+from unittest.mock import Mock
+
+from databricks.sdk.oauth import Refreshable
+from databricks.sdk.oauth import SessionCredentials
+from databricks.sdk.oauth import Token
+
+from dbt.adapters.databricks import auth
+from dbt.adapters.databricks.auth import TokenRefresher
+
+
+class CountingTokenSource(Refreshable):
+    def __init__(self, lifetime: float = 3600, token=None):
+        super().__init__(token)
+        self.lifetime = lifetime
+        self.refreshes = 0
+
+    def refresh(self) -> Token:
+        self.refreshes += 1
+        return Token(
+            access_token=f"token-{self.refreshes}",
+            token_type="Bearer",
+            expiry=datetime.now() + timedelta(seconds=self.lifetime),
+        )
+
+
+def to_headers(token):
+    return {"Authorization": f"{token.token_type} {token.access_token}"}
+
+
+class TestTokenRefresher:
+    def test_headers__cached(self):
+        source = CountingTokenSource()
+        refresher = TokenRefresher(source, to_headers)
+
+        first = refresher.headers()
+        assert first == {"Authorization": "Bearer token-1"}
+        assert refresher.headers() is first
+        assert source.refreshes == 1
+
+    def test_headers__expired_token_refreshed_inline(self):
+        source = CountingTokenSource(lifetime=30)
+        refresher = TokenRefresher(source, to_headers)
+
+        refresher.headers()
+        # Tokens within 40 seconds of expiry are not valid anymore
+        assert refresher.headers() == {"Authorization": "Bearer token-2"}
+
+    def test_headers__kept_until_rejected(self):
+        source = CountingTokenSource(lifetime=35)
+        refresher = TokenRefresher(source, to_headers)
+
+        first = refresher.headers()
+        # Expired for the token source, but still accepted by Databricks
+        assert refresher.headers() is first
+        assert source.refreshes == 1
+
+    def test_next_refresh__when_token_source_renews(self):
+        source = CountingTokenSource(lifetime=3600)
+        refresher = TokenRefresher(source, to_headers)
+        refresher.headers()
+
+        expiry = source.token().expiry.timestamp()
+        assert refresher.next_refresh() == expiry - auth.TOKEN_EXPIRY_MARGIN
+
+    def test_next_refresh__no_expiry(self):
+        source = CountingTokenSource(token=Token(access_token="static", token_type="Bearer"))
+        refresher = TokenRefresher(source, to_headers)
+
+        assert refresher.headers() == {"Authorization": "Bearer static"}
+        assert refresher.next_refresh() is None
+
+    def test_refresh__valid_token_checked_again(self):
+        source = CountingTokenSource()
+        refresher = TokenRefresher(source, to_headers)
+        headers = refresher.headers()
+
+        refresher.refresh()
+        assert source.refreshes == 1
+        assert refresher.headers() is headers
+        assert refresher.next_refresh() > time.time()
+
+    def test_refresh__expired_token(self):
+        source = CountingTokenSource(lifetime=35)
+        refresher = TokenRefresher(source, to_headers)
+        first = refresher.headers()
+
+        # The background thread may renew the token as well
+        refresher.refresh()
+        assert source.refreshes >= 2
+        assert refresher.headers() != first
+
+    def test_refresh__failure_keeps_token_and_backs_off(self):
+        source = CountingTokenSource()
+        refresher = TokenRefresher(source, to_headers)
+        headers = refresher.headers()
+
+        source.token = Mock(side_effect=ValueError("boom"))
+        refresher.refresh()
+        assert refresher.headers() is headers
+        assert refresher.next_refresh() >= time.time() + auth.TOKEN_REFRESH_RETRY_DELAY - 1
+
+    def test_background_refresh(self):
+        source = CountingTokenSource(lifetime=auth.TOKEN_EXPIRY_MARGIN + 0.2)
+        refresher = TokenRefresher(source, to_headers)
+        refresher.headers()
+
+        deadline = time.time() + 5
+        while source.refreshes < 2 and time.time() < deadline:
+            time.sleep(0.05)
+
+        assert source.refreshes >= 2
+        assert auth.token_refresh_stats.background > 0
+
+    def test_stop_token_refresher(self):
+        TokenRefresher(CountingTokenSource(), to_headers).headers()
+        thread = auth._token_refresh_thread
+        assert thread is not None
+
+        auth.stop_token_refresher()
+        thread.join(5)
+        assert not thread.is_alive()
+        assert not auth._token_refreshers
+
+        # Handing out new tokens starts it again
+        TokenRefresher(CountingTokenSource(), to_headers).headers()
+        assert auth._token_refresh_thread is not None
+        auth.stop_token_refresher()
+
+    def test_stop_token_refresher__reused_refresher_scheduled_again(self):
+        refresher = TokenRefresher(CountingTokenSource(), to_headers)
+        headers = refresher.headers()
+        auth.stop_token_refresher()
+        assert not refresher.scheduled
+
+        # A cached token handed out after the stop is refreshed in the background again
+        assert refresher.headers() is headers
+        assert refresher.scheduled
+        assert refresher in auth._token_refreshers
+        assert auth._token_refresh_thread is not None
+        auth.stop_token_refresher()
+
+
+class TestGetHeaderFactory:
+    def test_session_credentials__shared_refresher(self):
+        token = Token(
+            access_token="abc",
+            token_type="Bearer",
+            expiry=datetime.now() + timedelta(hours=1),
+        )
+        provider = SessionCredentials(client=Mock(), token=token)
+
+        first = auth.get_header_factory(provider)
+        assert first() == {"Authorization": "Bearer abc"}
+        assert auth.get_header_factory(provider).__self__ is first.__self__
+
+    def test_session_credentials__refresher_collected_with_provider(self):
+        provider = SessionCredentials(
+            client=Mock(), token=Token(access_token="abc", token_type="Bearer")
+        )
+        refresher = weakref.ref(auth.get_header_factory(provider).__self__)
+
+        del provider
+        gc.collect()
+        assert refresher() is None
+
+    def test_other_providers(self):
+        provider = auth.token_auth("foo")
+        assert auth.get_header_factory(provider)() == {"Authorization": "Bearer foo"}
@@ -1,5 +1,11 @@
+import threading
+
+import pytest
+from dbt.adapters.databricks.utils import get_cache_ttl
 from dbt.adapters.databricks.utils import redact_credentials
 from dbt.adapters.databricks.utils import remove_ansi
+from dbt.adapters.databricks.utils import TtlFileCache
+from mock import patch
 
 
 class TestDatabricksUtils:
@@ -47,6 +53,21 @@ class TestDatabricksUtils:
         )
         assert redact_credentials(sql) == expected
 
+    def test_redact_credentials__large_statement(self):
+        # ~4MB of generated seed inserts, the kind of statement the regex is slow on
+        sql = "insert into seed values\n" + ",\n".join(
+            f"({i}, 'value = {i}', '({i})')" for i in range(150_000)
+        )
+
+        # Returned as is, so the statement skipped the credential regex entirely
+        assert redact_credentials(sql) is sql
+
+    def test_redact_credentials__large_statement_with_credential(self):
+        values = ",\n".join(f"({i})" for i in range(150_000))
+        sql = f"copy into target_table\nfrom (select * from values {values})\n"
+        sql += "  WITH (credential ('KEY' = 'VALUE'))"
+        assert redact_credentials(sql).endswith("credential ('KEY' = '[REDACTED]'))")
+
     def test_remove_ansi(self):
         test_string = """Python model failed with traceback as:
   [0;31m---------------------------------------------------------------------------[0m
@@ -65,3 +86,58 @@ class TestDatabricksUtils:
        72 # how to execute python model in notebook
 """
         assert remove_ansi(test_string) == expected_string
+
+
+class TestGetCacheTtl:
+    @pytest.mark.parametrize(
+        "value, expected", [(None, None), ("", None), ("60", 60), ("0.5", 0.5)]
+    )
+    def test_valid(self, value, expected):
+        env = {} if value is None else {"TEST_CACHE_TTL": value}
+        with patch.dict("os.environ", env, clear=True):
+            assert get_cache_ttl("TEST_CACHE_TTL") == expected
+
+    @pytest.mark.parametrize("value", ["one hour", "-1"])
+    def test_invalid_disables_cache(self, value):
+        with patch.dict("os.environ", {"TEST_CACHE_TTL": value}), patch(
+            "dbt.adapters.databricks.utils.logger"
+        ) as logger:
+            assert get_cache_ttl("TEST_CACHE_TTL") is None
+        logger.warning.assert_called_once()
+
+
+class TestTtlFileCache:
+    def test_get__slow_load_doesnt_block_other_keys(self):
+        cache = TtlFileCache()
+        started, release = threading.Event(), threading.Event()
+
+        def slow_load():
+            started.set()
+            release.wait(5)
+            return "slow"
+
+        thread = threading.Thread(target=cache.get, args=("slow", slow_load))
+        thread.start()
+        started.wait(5)
+        try:
+            assert cache.get("fast", lambda: "fast") == "fast"
+            assert thread.is_alive()
+        finally:
+            release.set()
+            thread.join()
+        assert cache.get("slow", lambda: "reloaded") == "slow"
+
+    def test_get__loads_key_once_across_threads(self):
+        cache = TtlFileCache()
+        calls = []
+
+        def load():
+            calls.append(1)
+            return 1
+
+        threads = [threading.Thread(target=cache.get, args=("key", load)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(calls) == 1